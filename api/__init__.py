@@ -7,8 +7,10 @@ api_bp = Blueprint("api", __name__, url_prefix="/api")
 from . import journal_routes
 from . import auth_routes
 from . import caldav_routes
+from . import user_routes
 
 # Register blueprints
 api_bp.register_blueprint(journal_routes.journal_bp)
 api_bp.register_blueprint(auth_routes.auth_bp)
 api_bp.register_blueprint(caldav_routes.caldav_bp)
+api_bp.register_blueprint(user_routes.user_bp)
@@ -1,60 +1,135 @@
 """CalDAV API routes for calendar synchronization."""
+import hmac
 import logging
-from flask import Blueprint, request, jsonify
+import os
+from datetime import datetime
+from flask import Blueprint, current_app, g, request, jsonify, url_for
 from flask_login import login_required, current_user
 from services.caldav_service import CalDAVService
 from services.journal_service import JournalService
-from models import db
+from services.sync_jobs import SyncJobService, run_after_response, run_worker
+from models import db, SyncJob
+from models.read_routing import route_safe_methods_to_reader
+from utils.validation import ValidationError, validate_date_string
 
 logger = logging.getLogger(__name__)
 
 caldav_bp = Blueprint("calendar", __name__, url_prefix="/calendar")
+route_safe_methods_to_reader(caldav_bp)
 
 
 @caldav_bp.route("/sync", methods=["POST"])
 @login_required
 def sync_calendar():
-    """Manual sync trigger for all pending entries."""
+    """Manual sync: queue a job that pushes pending entries (or the given entry_ids), then pulls calendar changes."""
     try:
-        logger.info(f"Manual calendar sync triggered by user {current_user.id}")
-        result = CalDAVService.sync_all_pending_entries(current_user.id)
+        data = request.get_json(silent=True) or {}
+        entry_ids = data.get("entry_ids")
+        if entry_ids is not None and (
+            not isinstance(entry_ids, list) or not all(isinstance(i, int) for i in entry_ids)
+        ):
+            return jsonify({"error": "entry_ids must be a list of integers"}), 400
+
+        payload = {"entry_ids": entry_ids} if entry_ids is not None else None
+        job = SyncJobService.enqueue(current_user.id, SyncJob.KIND_SYNC_ALL, payload)
+        logger.info(f"Manual calendar sync queued as job {job.id} by user {current_user.id}")
+        return sync_job_accepted(job, "Sync queued")
 
-        logger.info(
-            f"Calendar sync completed for user {current_user.id}: "
-            f"success={result['success']}, failed={result['failed']}, skipped={result['skipped']}"
-        )
-        return (
-            jsonify(
-                {
-                    "message": "Sync completed",
-                    "success": result["success"],
-                    "failed": result["failed"],
-                    "skipped": result["skipped"],
-                }
-            ),
-            200,
+    except Exception as e:
+        logger.error(f"Error queueing calendar sync for user {current_user.id}: {str(e)}", exc_info=True)
+        db.session.rollback()
+        return jsonify({"error": "Internal server error"}), 500
+
+
+@caldav_bp.route("/jobs/<int:job_id>", methods=["GET"])
+@login_required
+def get_sync_job(job_id):
+    """Status of a queued sync job, with its result once finished."""
+    try:
+        job = SyncJobService.get_job(job_id, current_user.id)
+        if job is None:
+            return jsonify({"error": "Sync job not found"}), 404
+        return jsonify(job.to_dict()), 200
+
+    except Exception as e:
+        logger.error(f"Error getting sync job {job_id} for user {current_user.id}: {str(e)}", exc_info=True)
+        return jsonify({"error": "Internal server error"}), 500
+
+
+@caldav_bp.route("/jobs/run-due", methods=["GET"])
+def run_due_sync_jobs():
+    """Scheduled trigger (e.g. Vercel Cron) that runs due sync jobs where no worker runs."""
+    secret = current_app.config.get("SYNC_CRON_SECRET")
+    if not secret:
+        return jsonify({"error": "Not found"}), 404
+    if not hmac.compare_digest(request.headers.get("Authorization", ""), f"Bearer {secret}"):
+        return jsonify({"error": "Unauthorized"}), 401
+    # Cron only sends GET, but claiming and running jobs writes
+    g.db_read_only = False
+    try:
+        ran = run_worker(
+            f"cron:{os.getpid()}", once=True, max_jobs=current_app.config.get("SYNC_CRON_MAX_JOBS", 20)
         )
+        return jsonify({"ran": ran}), 200
 
-    except ValueError as e:
-        # Handle specific validation errors (T104)
-        logger.warning(f"Calendar sync validation error for user {current_user.id}: {str(e)}")
-        return jsonify({"error": str(e)}), 400
     except Exception as e:
-        logger.error(f"Error syncing calendar for user {current_user.id}: {str(e)}", exc_info=True)
+        logger.error(f"Error running due sync jobs: {str(e)}", exc_info=True)
+        db.session.rollback()
         return jsonify({"error": "Internal server error"}), 500
 
 
+def sync_job_accepted(job, message):
+    """202 response for a queued sync job, pointing at its status URL."""
+    response = jsonify({"message": message, "job": job.to_dict()})
+    response.status_code = 202
+    response.headers["Location"] = url_for("api.calendar.get_sync_job", job_id=job.id)
+    run_after_response(response, job.id)
+    return response
+
+
 @caldav_bp.route("/events", methods=["GET"])
 @login_required
 def list_calendar_events():
-    """List calendar events for the current user."""
+    """List calendar events for the current user.
+
+    Pages through the local mirror that calendar sync keeps up to date, in
+    start order; pass next_cursor back as ?cursor= for the following page.
+    """
     try:
         logger.debug(f"Listing calendar events for user {current_user.id}")
-        # TODO: Implement actual calendar event listing from CalDAV server
-        # For now, return empty list
-        events = []
+        try:
+            limit = int(request.args.get("limit", 50))
+        except (ValueError, TypeError):
+            logger.warning(f"Invalid limit parameter for user {current_user.id}")
+            return jsonify({"error": "Invalid limit parameter"}), 400
+        limit = min(max(limit, 1), current_app.config["CALENDAR_EVENTS_MAX_LIMIT"])
+
+        dates = {}
+        for name in ("start_date", "end_date"):
+            value = request.args.get(name)
+            if not value:
+                dates[name] = None
+                continue
+            try:
+                dates[name] = datetime.strptime(validate_date_string(value), "%Y-%m-%d").date()
+            except (ValidationError, ValueError):
+                return jsonify({"error": f"Invalid {name}. Use YYYY-MM-DD"}), 400
+
+        try:
+            result = CalDAVService.list_calendar_events(
+                current_user.id,
+                start_date=dates["start_date"],
+                end_date=dates["end_date"],
+                limit=limit,
+                cursor=request.args.get("cursor") or None,
+            )
+        except ValidationError as e:
+            logger.warning(f"Invalid calendar event listing for user {current_user.id}: {str(e)}")
+            return jsonify({"error": str(e)}), 400
+
+        events = [event.to_dict() for event in result["events"]]
         logger.info(f"Retrieved {len(events)} calendar events for user {current_user.id}")
-        return jsonify({"events": events, "total": len(events)}), 200
+        return jsonify({"events": events, "next_cursor": result["next_cursor"]}), 200
 
     except Exception as e:
         logger.error(f"Error listing calendar events for user {current_user.id}: {str(e)}", exc_info=True)
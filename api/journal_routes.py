@@ -1,10 +1,13 @@
 """Journal API routes for journal entry CRUD operations."""
 import logging
-from datetime import datetime
-from flask import Blueprint, request, jsonify
+from datetime import date, datetime, timedelta, timezone
+from functools import wraps
+from flask import Blueprint, Response, current_app, make_response, request, jsonify
 from flask_login import login_required, current_user
 from services.journal_service import JournalService
-from models import db
+from models import db, JournalEntry
+from models.read_routing import route_safe_methods_to_reader
+from utils.serialization import get_json_backend, rows_to_dicts
 from utils.validation import (
     validate_title,
     validate_content,
@@ -15,16 +18,105 @@ from utils.validation import (
 logger = logging.getLogger(__name__)
 
 journal_bp = Blueprint("journal", __name__, url_prefix="/journal")
+route_safe_methods_to_reader(journal_bp)
+
+# Writes that may leave an automatic sync due (see schedule_auto_sync)
+JOURNAL_WRITE_ENDPOINTS = {
+    "api.journal.create_entry",
+    "api.journal.bulk_entries",
+    "api.journal.update_entry",
+    "api.journal.delete_entry",
+}
+
+
+@journal_bp.after_request
+def run_due_sync_after_write(response):
+    """Without a sync worker, journal writes also run the oldest due sync job."""
+    if request.endpoint in JOURNAL_WRITE_ENDPOINTS and response.status_code < 400:
+        from services.sync_jobs import run_after_response
+
+        run_after_response(response)
+    return response
+
+
+def conditional_on_journal_version(view):
+    """
+    Answer conditional GETs from the user's journal change version.
+
+    The version is read before the view runs; when the client's ETag (or
+    Last-Modified date) is still current a 304 is returned without querying
+    any entries. Successful responses get the ETag and Last-Modified headers.
+    """
+
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        version, changed_at = JournalService.get_change_version(current_user.id)
+        etag = f"{current_user.id}-{version}"
+        if changed_at is not None:
+            changed_at = changed_at.replace(tzinfo=timezone.utc, microsecond=0)
+
+        if request.if_none_match:
+            not_modified = request.if_none_match.contains(etag)
+        else:
+            not_modified = (
+                changed_at is not None
+                and request.if_modified_since is not None
+                and changed_at <= request.if_modified_since
+            )
+
+        if not_modified:
+            response = Response(status=304)
+        else:
+            response = make_response(view(*args, **kwargs))
+            if response.status_code != 200:
+                return response
+
+        response.set_etag(etag)
+        if changed_at is not None:
+            response.last_modified = changed_at
+        # Cache privately but always revalidate against the version
+        response.headers["Cache-Control"] = "private, no-cache"
+        response.vary.add("Cookie")
+        return response
+
+    return wrapper
 
 
 @journal_bp.route("/entries", methods=["GET"])
 @login_required
+@conditional_on_journal_version
 def list_entries():
-    """List journal entries, optionally filtered by date."""
+    """List journal entries, optionally filtered by date.
+
+    Pass the returned next_cursor back as ?cursor= to fetch the following
+    page with a keyset seek instead of an offset scan. ?view=summary (or an
+    explicit ?fields=a,b) returns projected rows with a content preview
+    instead of full entries.
+    """
     try:
         logger.debug(f"Listing journal entries for user {current_user.id}")
         # Parse and validate query parameters
         date_str = request.args.get("date")
+        cursor = request.args.get("cursor") or None
+        # Clients that page with next_cursor can skip the total lookup
+        include_total = request.args.get("include_total", "true").lower() not in (
+            "false",
+            "0",
+            "no",
+        )
+
+        # Projection: explicit fields win over a named view; the full view
+        # is also a projection so rows never become ORM objects
+        fields = list(JournalEntry.FULL_FIELDS)
+        fields_param = request.args.get("fields")
+        view = request.args.get("view", "full")
+        if fields_param:
+            fields = [name.strip() for name in fields_param.split(",") if name.strip()]
+        elif view == "summary":
+            fields = list(JournalEntry.SUMMARY_FIELDS)
+        elif view != "full":
+            return jsonify({"error": "view must be 'full' or 'summary'"}), 400
+
         try:
             limit = int(request.args.get("limit", 50))
             offset = int(request.args.get("offset", 0))
@@ -32,8 +124,8 @@ def list_entries():
             logger.warning(f"Invalid limit or offset parameter for user {current_user.id}")
             return jsonify({"error": "Invalid limit or offset parameter"}), 400
 
-        # Validate limit (performance optimization: cap at 100) (T107)
-        limit = min(max(limit, 1), 100)
+        # Validate limit (performance optimization: capped) (T107)
+        limit = min(max(limit, 1), current_app.config["JOURNAL_LIST_MAX_LIMIT"])
         offset = max(offset, 0)
 
         # Parse and validate date if provided
@@ -58,22 +150,32 @@ def list_entries():
                 )
 
         # Get entries (uses indexed queries for performance - T107)
-        result = JournalService.list_entries(
-            user_id=current_user.id, entry_date=entry_date, limit=limit, offset=offset
-        )
+        try:
+            result = JournalService.list_entries(
+                user_id=current_user.id,
+                entry_date=entry_date,
+                limit=limit,
+                offset=offset,
+                cursor=cursor,
+                include_total=include_total,
+                fields=fields,
+            )
+        except ValidationError as e:
+            logger.warning(f"Invalid listing parameters for user {current_user.id}: {str(e)}")
+            return jsonify({"error": str(e)}), 400
 
+        rows = result["entries"]
         logger.info(
-            f"Retrieved {len(result['entries'])} journal entries for user {current_user.id} "
-            f"(date={entry_date}, limit={limit}, offset={offset}, total={result['total']})"
+            f"Retrieved {len(rows)} journal entries for user {current_user.id} "
+            f"(date={entry_date}, limit={limit}, offset={offset}, cursor={cursor}, total={result['total']})"
         )
-        return (
-            jsonify(
-                {
-                    "entries": [entry.to_dict() for entry in result["entries"]],
-                    "total": result["total"],
-                }
-            ),
-            200,
+
+        # Serialize the row tuples directly: no ORM objects or to_dict() calls
+        dumps = get_json_backend(current_app.config["JSON_BACKEND"])
+        return Response(
+            dumps({"entries": rows_to_dicts(rows), "total": result["total"], "next_cursor": result["next_cursor"]}),
+            status=200,
+            mimetype="application/json",
         )
 
     except Exception as e:
@@ -81,6 +183,123 @@ def list_entries():
         return jsonify({"error": "Internal server error"}), 500
 
 
+@journal_bp.route("/calendar", methods=["GET"])
+@login_required
+@conditional_on_journal_version
+def calendar_histogram():
+    """Entry and sync-status counts per day for ?month=YYYY-MM or ?year=YYYY."""
+    try:
+        month_str = request.args.get("month")
+        year_str = request.args.get("year")
+
+        try:
+            if month_str:
+                start_date = datetime.strptime(month_str, "%Y-%m").date()
+                next_month = date(
+                    start_date.year + start_date.month // 12, start_date.month % 12 + 1, 1
+                )
+                end_date = next_month - timedelta(days=1)
+            elif year_str:
+                start_date = datetime.strptime(year_str, "%Y").date()
+                end_date = date(start_date.year, 12, 31)
+            else:
+                return jsonify({"error": "month (YYYY-MM) or year (YYYY) is required"}), 400
+        except ValueError:
+            logger.warning(f"Invalid calendar range for user {current_user.id}: month={month_str}, year={year_str}")
+            return jsonify({"error": "Invalid month or year. Use YYYY-MM or YYYY"}), 400
+
+        days = JournalService.get_daily_histogram(current_user.id, start_date, end_date)
+        for day in days:
+            day["date"] = day["date"].isoformat()
+
+        payload = {
+            "start_date": start_date.isoformat(),
+            "end_date": end_date.isoformat(),
+            "total": sum(day["total"] for day in days),
+            "days": days,
+        }
+        if not month_str:
+            # Year view: also roll the days up into months
+            months = {}
+            for day in days:
+                bucket = months.setdefault(
+                    day["date"][:7],
+                    {
+                        "month": day["date"][:7],
+                        "total": 0,
+                        "sync_status": dict.fromkeys(day["sync_status"], 0),
+                    },
+                )
+                bucket["total"] += day["total"]
+                for status, count in day["sync_status"].items():
+                    bucket["sync_status"][status] += count
+            payload["months"] = list(months.values())
+
+        logger.info(
+            f"Calendar histogram for user {current_user.id} "
+            f"({start_date} to {end_date}): {len(days)} days with entries"
+        )
+        return jsonify(payload), 200
+
+    except Exception as e:
+        logger.error(f"Error building calendar histogram for user {current_user.id}: {str(e)}", exc_info=True)
+        return jsonify({"error": "Internal server error"}), 500
+
+
+@journal_bp.route("/search", methods=["GET"])
+@login_required
+@conditional_on_journal_version
+def search_entries():
+    """Ranked full-text search over the user's entries.
+
+    ?q= is required; ?from= and ?to= (YYYY-MM-DD) narrow the date range and
+    next_cursor pages through further results.
+    """
+    try:
+        from services.search_service import SearchService
+
+        if not SearchService.is_available():
+            return jsonify({"error": "Full-text search is not available"}), 501
+
+        try:
+            limit = int(request.args.get("limit", 20))
+        except (ValueError, TypeError):
+            return jsonify({"error": "Invalid limit parameter"}), 400
+        limit = min(max(limit, 1), current_app.config["SEARCH_MAX_LIMIT"])
+
+        try:
+            bounds = {}
+            for param in ("from", "to"):
+                value = validate_date_string(request.args.get(param))
+                bounds[param] = (
+                    datetime.strptime(value, "%Y-%m-%d").date() if value else None
+                )
+            result = SearchService.search_entries(
+                user_id=current_user.id,
+                query=request.args.get("q", ""),
+                start_date=bounds["from"],
+                end_date=bounds["to"],
+                limit=limit,
+                cursor=request.args.get("cursor") or None,
+            )
+        except (ValidationError, ValueError) as e:
+            logger.warning(f"Invalid search parameters for user {current_user.id}: {str(e)}")
+            message = str(e) if isinstance(e, ValidationError) else "Invalid date. Use YYYY-MM-DD"
+            return jsonify({"error": message}), 400
+
+        for item in result["results"]:
+            item["date"] = item["date"].isoformat()
+
+        logger.info(
+            f"Search for user {current_user.id} returned {len(result['results'])} results"
+        )
+        return jsonify(result), 200
+
+    except Exception as e:
+        logger.error(f"Error searching journal entries for user {current_user.id}: {str(e)}", exc_info=True)
+        return jsonify({"error": "Internal server error"}), 500
+
+
 @journal_bp.route("/entries", methods=["POST"])
 @login_required
 def create_entry():
@@ -125,8 +344,105 @@ def create_entry():
         return jsonify({"error": "Internal server error"}), 500
 
 
+def _parse_bulk_operation(index, raw):
+    """
+    Validate one bulk operation with the same rules as the single-entry routes.
+
+    Args:
+        index: Position of the operation in the request
+        raw: Operation object from the request body
+
+    Returns:
+        Normalized operation for JournalService.apply_bulk_operations
+
+    Raises:
+        ValidationError: If the operation is malformed or a field is invalid
+    """
+    if not isinstance(raw, dict):
+        raise ValidationError("Operation must be an object")
+    op = raw.get("op")
+    if op not in ("create", "update", "delete"):
+        raise ValidationError("op must be 'create', 'update' or 'delete'")
+
+    operation = {"index": index, "op": op}
+    if op != "create":
+        entry_id = raw.get("id")
+        if not isinstance(entry_id, int) or isinstance(entry_id, bool):
+            raise ValidationError("id is required for update and delete")
+        operation["id"] = entry_id
+    if op == "delete":
+        return operation
+
+    if op == "create" or "title" in raw:
+        operation["title"] = validate_title(raw.get("title", ""))
+    if op == "create" or "content" in raw:
+        operation["content"] = validate_content(raw.get("content"))
+    date_str = validate_date_string(raw.get("date"))
+    if date_str:
+        try:
+            operation["entry_date"] = datetime.strptime(date_str, "%Y-%m-%d").date()
+        except ValueError:
+            raise ValidationError("Invalid date format. Use YYYY-MM-DD")
+    return operation
+
+
+@journal_bp.route("/entries/bulk", methods=["POST"])
+@login_required
+def bulk_entries():
+    """Apply a batch of create/update/delete operations in one transaction.
+
+    Invalid operations and unknown ids are reported per item and skipped;
+    the valid ones are committed together.
+    """
+    try:
+        data = request.get_json(silent=True)
+        operations = data.get("operations") if isinstance(data, dict) else None
+        if not isinstance(operations, list) or not operations:
+            return jsonify({"error": "operations must be a non-empty list"}), 400
+
+        max_operations = current_app.config["JOURNAL_BULK_MAX_OPERATIONS"]
+        if len(operations) > max_operations:
+            return (
+                jsonify({"error": f"At most {max_operations} operations per request"}),
+                400,
+            )
+
+        results = {}
+        valid = []
+        for index, raw in enumerate(operations):
+            try:
+                valid.append(_parse_bulk_operation(index, raw))
+            except ValidationError as e:
+                results[index] = {
+                    "index": index,
+                    "op": raw.get("op") if isinstance(raw, dict) else None,
+                    "status": 400,
+                    "error": str(e),
+                }
+
+        if valid:
+            for result in JournalService.apply_bulk_operations(current_user.id, valid):
+                results[result["index"]] = result
+
+        ordered = [results[index] for index in range(len(operations))]
+        summary = {
+            "created": sum(1 for r in ordered if r["status"] == 201),
+            "updated": sum(1 for r in ordered if r["status"] == 200),
+            "deleted": sum(1 for r in ordered if r["status"] == 204),
+            "failed": sum(1 for r in ordered if r["status"] >= 400),
+        }
+        logger.info(f"Bulk request for user {current_user.id}: {summary}")
+        return jsonify({"results": ordered, **summary}), 200
+
+    except Exception as e:
+        logger.error(f"Error applying bulk operations for user {current_user.id}: {str(e)}", exc_info=True)
+        db.session.rollback()
+        return jsonify({"error": "Internal server error"}), 500
+
+
 @journal_bp.route("/entries/<int:entry_id>", methods=["GET"])
 @login_required
+@conditional_on_journal_version
 def get_entry(entry_id):
     """Get a specific journal entry."""
     try:
@@ -238,38 +554,24 @@ def delete_entry(entry_id):
 @journal_bp.route("/entries/<int:entry_id>/sync", methods=["POST"])
 @login_required
 def sync_entry(entry_id):
-    """Sync a journal entry to calendar."""
+    """Queue a job that syncs a journal entry to calendar."""
     try:
-        logger.info(f"Syncing journal entry {entry_id} to calendar for user {current_user.id}")
         entry = JournalService.get_entry(entry_id, current_user.id)
 
         if not entry:
             logger.warning(f"Journal entry {entry_id} not found for sync by user {current_user.id}")
             return jsonify({"error": "Journal entry not found"}), 404
 
-        from services.caldav_service import CalDAVService
+        from api.caldav_routes import sync_job_accepted
+        from models import SyncJob
+        from services.sync_jobs import SyncJobService
 
-        success = CalDAVService.sync_entry_to_calendar(entry)
+        job = SyncJobService.enqueue(current_user.id, SyncJob.KIND_SYNC_ENTRY, {"entry_id": entry_id})
+        logger.info(f"Sync of journal entry {entry_id} queued as job {job.id} by user {current_user.id}")
+        return sync_job_accepted(job, "Entry sync queued")
 
-        if success:
-            logger.info(f"Journal entry {entry_id} synced successfully to calendar for user {current_user.id}")
-            return (
-                jsonify(
-                    {"message": "Entry synced successfully", "entry": entry.to_dict()}
-                ),
-                200,
-            )
-        else:
-            logger.warning(f"Failed to sync journal entry {entry_id} to calendar for user {current_user.id}")
-            return jsonify({"error": "Failed to sync entry"}), 500
-
-    except ValueError as e:
-        # Handle specific sync errors (T104)
-        logger.warning(f"Sync validation error for entry {entry_id} by user {current_user.id}: {str(e)}")
-        db.session.rollback()
-        return jsonify({"error": str(e)}), 400
     except Exception as e:
-        logger.error(f"Error syncing journal entry {entry_id} for user {current_user.id}: {str(e)}", exc_info=True)
+        logger.error(f"Error queueing sync of journal entry {entry_id} for user {current_user.id}: {str(e)}", exc_info=True)
         db.session.rollback()
         return jsonify({"error": "Internal server error"}), 500
 
@@ -319,13 +621,14 @@ def batch_export_entries():
         if not entry_ids:
             logger.warning(f"Empty entry_ids for batch export by user {current_user.id}")
             return jsonify({"error": "entry_ids is required"}), 400
-
-        # Get entries
-        entries = []
-        for entry_id in entry_ids:
-            entry = JournalService.get_entry(entry_id, current_user.id)
-            if entry:
-                entries.append(entry)
+        if not isinstance(entry_ids, list) or any(
+            not isinstance(entry_id, int) or isinstance(entry_id, bool) for entry_id in entry_ids
+        ):
+            logger.warning(f"Invalid entry_ids for batch export by user {current_user.id}")
+            return jsonify({"error": "entry_ids must be a list of integers"}), 400
+
+        # Get entries (one query, in the requested order, each once)
+        entries = JournalService.get_entries(list(dict.fromkeys(entry_ids)), current_user.id)
 
         if not entries:
             logger.warning(f"No valid entries found for batch export by user {current_user.id}")
@@ -0,0 +1,59 @@
+"""User API routes for account preferences."""
+import logging
+from flask import Blueprint, request, jsonify
+from flask_login import login_required, current_user
+from services.auth_service import AuthService
+from models import db
+from models.read_routing import route_safe_methods_to_reader
+
+logger = logging.getLogger(__name__)
+
+user_bp = Blueprint("user", __name__, url_prefix="/user")
+route_safe_methods_to_reader(user_bp)
+
+SYNC_MODES = ("automatic", "manual")
+
+
+def _settings(user):
+    return {
+        "calendar_sync_enabled": user.calendar_sync_enabled,
+        "calendar_sync_mode": user.calendar_sync_mode,
+    }
+
+
+@user_bp.route("/settings", methods=["GET"])
+@login_required
+def get_settings():
+    """Get the current user's calendar sync preferences."""
+    try:
+        return jsonify(_settings(current_user)), 200
+    except Exception as e:
+        logger.error(f"Error getting settings for user {current_user.id}: {str(e)}", exc_info=True)
+        return jsonify({"error": "Internal server error"}), 500
+
+
+@user_bp.route("/settings", methods=["PUT"])
+@login_required
+def update_settings():
+    """Update calendar sync preferences; in 'automatic' mode journal changes are pushed shortly after they stop."""
+    try:
+        data = request.get_json(silent=True)
+        if not isinstance(data, dict):
+            return jsonify({"error": "Request body must be a JSON object"}), 400
+
+        enabled = data.get("calendar_sync_enabled")
+        if enabled is not None and not isinstance(enabled, bool):
+            return jsonify({"error": "calendar_sync_enabled must be a boolean"}), 400
+        mode = data.get("calendar_sync_mode")
+        if mode is not None and mode not in SYNC_MODES:
+            return jsonify({"error": "calendar_sync_mode must be 'automatic' or 'manual'"}), 400
+
+        user = AuthService.update_sync_settings(current_user.id, enabled, mode)
+        if user is None:
+            return jsonify({"error": "User not found"}), 404
+        return jsonify(_settings(user)), 200
+
+    except Exception as e:
+        logger.error(f"Error updating settings for user {current_user.id}: {str(e)}", exc_info=True)
+        db.session.rollback()
+        return jsonify({"error": "Internal server error"}), 500
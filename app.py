@@ -29,8 +29,13 @@ def unauthorized():
 
 @login_manager.user_loader
 def load_user(user_id):
-    """Load user by ID for Flask-Login."""
-    return User.query.get(int(user_id))
+    """Load user by ID for Flask-Login, from the user cache when enabled."""
+    from services.user_cache import get_user_cache
+
+    cache = get_user_cache()
+    if cache is not None:
+        return cache.load(int(user_id))
+    return db.session.get(User, int(user_id))
 
 
 def create_app(config_name=None):
@@ -48,16 +53,42 @@ def create_app(config_name=None):
     # Load configuration
     config_name = config_name or os.environ.get("FLASK_ENV", "development")
     app.config.from_object(config[config_name])
+    logging.getLogger().setLevel(app.config["LOG_LEVEL"])
 
     # Initialize extensions
+    from models.read_routing import configure_reader_bind, init_read_routing
+
+    configure_reader_bind(app)
     db.init_app(app)
+    init_read_routing(app, db)
     login_manager.init_app(app)
 
+    from utils.sqlite_profile import init_sqlite_profile
+
+    init_sqlite_profile(app, db)
+
+    from services.user_cache import init_user_cache
+
+    init_user_cache(app)
+
+    from services.connectivity import init_health_tracker
+
+    init_health_tracker(app)
+
+    from services.caldav_transport import init_caldav_transport
+
+    init_caldav_transport(app)
+
     # Register blueprints
     from api import api_bp
 
     app.register_blueprint(api_bp)
 
+    # Register CLI commands
+    from cli import register_commands
+
+    register_commands(app)
+
     # Register template routes
     @app.route("/")
     @app.route("/home")
@@ -106,10 +137,13 @@ def create_app(config_name=None):
             return redirect(url_for("login"))
         return render_template("settings.html")
 
-    # Create database tables
-    with app.app_context():
-        db.create_all()
-        logger.info("Database tables created")
+    # Check the schema version; `flask db-upgrade` creates and migrates
+    from migrations import check_schema, defer_schema_check
+
+    if app.config.get("STARTUP_BUDGET_MODE"):
+        defer_schema_check(app, db)
+    else:
+        check_schema(app, db)
 
     # Error handlers
     @app.errorhandler(404)
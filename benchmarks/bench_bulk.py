@@ -0,0 +1,78 @@
+"""Benchmark: importing entries one request at a time vs. one bulk request.
+
+Runs against a file-backed SQLite database (so every commit pays for its
+fsync) through the Flask test client, comparing --rows POSTs to
+/api/journal/entries with a single POST to /api/journal/entries/bulk.
+
+Usage:
+    python benchmarks/bench_bulk.py [--rows 1000]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from app import create_app  # noqa: E402
+from config import TestingConfig, config  # noqa: E402
+from models import db, User  # noqa: E402
+
+
+def make_client(db_path):
+    """Create an app on db_path and return a logged-in test client."""
+    config["bench"] = type(
+        "BenchConfig", (TestingConfig,), {"SQLALCHEMY_DATABASE_URI": f"sqlite:///{db_path}"}
+    )
+    app = create_app("bench")
+    with app.app_context():
+        user = User(username="bench")
+        user.set_password("benchpass")
+        db.session.add(user)
+        db.session.commit()
+    client = app.test_client()
+    client.post("/api/auth/login", json={"username": "bench", "password": "benchpass"})
+    return client
+
+
+def payload(i):
+    return {
+        "title": f"Imported entry {i}",
+        "content": ("Lorem ipsum dolor sit amet. " * 20)[: 200 + (i % 10) * 30],
+        "date": f"2024-{1 + i % 12:02d}-{1 + i % 28:02d}",
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        client = make_client(os.path.join(tmp, "single.db"))
+        start = time.perf_counter()
+        for i in range(args.rows):
+            assert client.post("/api/journal/entries", json=payload(i)).status_code == 201
+        single = time.perf_counter() - start
+
+        client = make_client(os.path.join(tmp, "bulk.db"))
+        start = time.perf_counter()
+        response = client.post(
+            "/api/journal/entries/bulk",
+            json={"operations": [{"op": "create", **payload(i)} for i in range(args.rows)]},
+        )
+        bulk = time.perf_counter() - start
+        assert response.status_code == 200 and response.json["created"] == args.rows
+
+    print(f"{args.rows} entries")
+    for label, seconds in (("one request per entry", single), ("one bulk request", bulk)):
+        print(
+            f"  {label:<24} {seconds * 1000:9.1f} ms  "
+            f"{args.rows / seconds:9.0f} entries/s  ({single / seconds:5.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Benchmark: CalDAV PUTs with a new connection per event vs. the pooled transport.
+
+Pushes --events events to the in-process CalDAV stand-in server, first
+with a fresh DAVClient per event (a new TCP, and with --tls a new TLS,
+handshake each time) and then through one shared CalDAVTransport whose
+keep-alive pool reuses its connection. Reports events/s, the per-event
+cost and how many connections the server accepted.
+
+--tls serves HTTPS with a throwaway self-signed certificate made by the
+openssl command line tool.
+
+Usage:
+    python benchmarks/bench_caldav_transport.py [--events 300] [--tls]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+# The throwaway --tls certificate is self-signed, so it is not verified
+warnings.filterwarnings("ignore", message="Unverified HTTPS request")
+
+from services.caldav_transport import CalDAVTransport  # noqa: E402
+from tests.caldav_stub import CalDAVStubServer  # noqa: E402
+
+ICS = (
+    "BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:bench\r\nBEGIN:VEVENT\r\n"
+    "UID:{uid}\r\nDTSTART:20260101T090000Z\r\nSUMMARY:Bench event {uid}\r\n"
+    "END:VEVENT\r\nEND:VCALENDAR\r\n"
+)
+
+
+def make_certificate(directory):
+    certfile = os.path.join(directory, "cert.pem")
+    keyfile = os.path.join(directory, "key.pem")
+    subprocess.run(
+        [
+            "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+            "-subj", "/CN=127.0.0.1", "-keyout", keyfile, "-out", certfile,
+        ],
+        check=True,
+        capture_output=True,
+    )
+    return certfile, keyfile
+
+
+def run(label, events, tls_files, per_event_client):
+    server = CalDAVStubServer(
+        username="bench",
+        password="benchpass",
+        certfile=tls_files[0] if tls_files else None,
+        keyfile=tls_files[1] if tls_files else None,
+    ).start()
+    try:
+
+        def new_transport():
+            return CalDAVTransport(
+                server.url, "bench", "benchpass", verify=False if tls_files else True
+            )
+
+        shared = None if per_event_client else new_transport()
+        started = time.perf_counter()
+        for i in range(events):
+            transport = new_transport() if per_event_client else shared
+            transport.put_event(f"bench-{i}", ICS.format(uid=f"bench-{i}"))
+            if per_event_client:
+                transport.close()
+        elapsed = time.perf_counter() - started
+        if shared is not None:
+            shared.close()
+    finally:
+        server.stop()
+
+    assert len(server.events) == events
+    print(
+        f"  {label:<24} {events / elapsed:8.0f} events/s  "
+        f"{elapsed / events * 1000:7.2f} ms/event  {server.connections:5d} connections"
+    )
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=300)
+    parser.add_argument("--tls", action="store_true")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tls_files = make_certificate(tmp) if args.tls else None
+        scheme = "HTTPS" if args.tls else "HTTP"
+        print(f"PUT {args.events} events to a local CalDAV server over {scheme}")
+        before = run("connection per event", args.events, tls_files, True)
+        after = run("pooled keep-alive", args.events, tls_files, False)
+    print(f"  speedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""Benchmark: pulling a calendar one GET per event vs. batched calendar-multiget.
+
+Fills the in-process CalDAV stand-in server with --events events and
+mirrors them into calendar_events twice: the naive way (list the
+collection, GET every event, parse it with ics and add an ORM row per
+event) and with CalDAVService.pull_calendar_changes (sync-collection,
+calendar-multiget batches of --batch-size parsed as they stream in, one
+upsert per batch). A second pull with no remote changes shows the cost of
+an up-to-date calendar. Reports wall time, events/s and HTTP requests.
+
+Usage:
+    python benchmarks/bench_calendar_pull.py [--events 1000] [--batch-size 100]
+        [--latency 0.002]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urljoin
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from app import create_app  # noqa: E402
+from config import Config, TestingConfig, config  # noqa: E402
+from models import db, User, CalendarEvent  # noqa: E402
+from services.caldav_service import CalDAVService  # noqa: E402
+from services.caldav_transport import get_transport  # noqa: E402
+from services.connectivity import HealthTracker  # noqa: E402
+from tests.caldav_stub import CalDAVStubServer  # noqa: E402
+
+EVENT = (
+    "BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:bench\r\nBEGIN:VEVENT\r\n"
+    "UID:{uid}\r\nDTSTART:{start}\r\nDTEND:{start}\r\nSUMMARY:Bench event {uid}\r\n"
+    "DESCRIPTION:Remote description of {uid}\r\nLAST-MODIFIED:20260101T000000Z\r\n"
+    "END:VEVENT\r\nEND:VCALENDAR\r\n"
+)
+
+
+def make_app(db_path, server_url, batch_size):
+    config["bench"] = type(
+        "BenchConfig",
+        (TestingConfig,),
+        {
+            "SQLALCHEMY_DATABASE_URI": f"sqlite:///{db_path}",
+            "SQLITE_PRAGMAS": Config.SQLITE_PRAGMAS,
+            "CALDAV_SERVER_URL": server_url,
+            "CALDAV_MULTIGET_BATCH_SIZE": batch_size,
+        },
+    )
+    app = create_app("bench")
+    app.extensions["caldav_health"] = HealthTracker(probe=lambda host, port, timeout: True)
+    return app
+
+
+def pull_per_event(user_id):
+    """List the collection and GET and parse every event on its own."""
+    from ics import Calendar
+
+    transport = get_transport()
+    for href, etag in transport.list_events():
+        response = transport.client.request(urljoin(transport.server_url, href))
+        (event,) = Calendar(response.raw).events
+        db.session.add(
+            CalendarEvent(
+                user_id=user_id,
+                external_event_id=event.uid,
+                href=href,
+                etag=etag,
+                title=event.name,
+                start_datetime=event.begin.datetime.replace(tzinfo=None),
+                end_datetime=event.end.datetime.replace(tzinfo=None),
+                description=event.description,
+                sync_direction="iphone_to_web",
+            )
+        )
+    db.session.commit()
+
+
+def pull_batched(user_id):
+    CalDAVService.pull_calendar_changes(user_id)
+
+
+def run(label, pull, events, batch_size, latency):
+    server = CalDAVStubServer(latency=latency).start()
+    first = datetime(2026, 1, 1, 8, tzinfo=timezone.utc)
+    for i in range(events):
+        start = (first + timedelta(hours=i)).strftime("%Y%m%dT%H%M%SZ")
+        server.edit(f"/calendars/journal/bench-{i}.ics", EVENT.format(uid=f"bench-{i}", start=start))
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            app = make_app(os.path.join(tmp, "journal.db"), server.url, batch_size)
+            with app.app_context():
+                user = User(username="bench")
+                user.set_password("benchpass")
+                db.session.add(user)
+                db.session.commit()
+
+                started = time.perf_counter()
+                pull(user.id)
+                elapsed = time.perf_counter() - started
+                requests = server.requests
+                mirrored = CalendarEvent.query.count()
+
+                repull = None
+                if pull is pull_batched:
+                    started = time.perf_counter()
+                    pull(user.id)
+                    repull = (time.perf_counter() - started, server.requests - requests)
+                get_transport().close()
+                db.engine.dispose()
+    finally:
+        server.stop()
+
+    assert mirrored == events, (label, mirrored)
+    print(
+        f"  {label:<16} {elapsed:7.2f} s  {events / elapsed:7.0f} events/s  "
+        f"{requests:5d} requests"
+    )
+    if repull is not None:
+        print(f"  {'unchanged re-pull':<16} {repull[0] * 1000:7.1f} ms {repull[1]:18d} requests")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=1000)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.002)
+    args = parser.parse_args()
+
+    print(
+        f"Mirroring {args.events} events from a CalDAV server with "
+        f"{args.latency * 1000:.0f} ms latency per request"
+    )
+    before = run("GET per event", pull_per_event, args.events, args.batch_size, args.latency)
+    after = run("multiget batches", pull_batched, args.events, args.batch_size, args.latency)
+    print(f"  speedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""Benchmark: serverless cold start, from `import app` to the first responses.
+
+Each run is a fresh interpreter started with `python -X importtime`, the
+way a new serverless instance starts: it imports app (which builds the
+production app at module level), then logs in and lists entries through
+the test client. Reports median import and first-request latency with and
+without STARTUP_BUDGET_MODE, plus the slowest top-level imports from the
+-X importtime trace.
+
+--max-import-ms / --max-request-ms turn it into a regression check: the
+script exits with status 1 if a budget-mode median exceeds them.
+
+Usage:
+    python benchmarks/bench_cold_start.py [--runs 7] [--top 10]
+        [--max-import-ms 800] [--max-request-ms 200]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+SETUP = """
+from app import create_app
+from migrations import upgrade
+from models import db, User
+
+app = create_app()
+with app.app_context():
+    with db.engine.begin() as connection:
+        upgrade(connection, db.metadata)
+    user = User(username="bench")
+    user.set_password("benchpass")
+    db.session.add(user)
+    db.session.commit()
+"""
+
+COLD_START = """
+import json, time
+started = time.perf_counter()
+import app as app_module
+imported = time.perf_counter()
+
+client = app_module.app.test_client()
+client.post("/api/auth/login", json={"username": "bench", "password": "benchpass"})
+logged_in = time.perf_counter()
+response = client.get("/api/journal/entries")
+listed = time.perf_counter()
+assert response.status_code == 200, response.status_code
+
+print(json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "login_ms": (logged_in - imported) * 1000,
+    "list_ms": (listed - logged_in) * 1000,
+}))
+"""
+
+
+def child_env(db_path, budget_mode):
+    env = dict(os.environ)
+    env.update(
+        {
+            "FLASK_ENV": "production",
+            "DATABASE_URL": f"sqlite:///{db_path}",
+            "SECRET_KEY": "bench-secret",
+            "SESSION_COOKIE_SECURE": "False",
+            "STARTUP_BUDGET_MODE": str(budget_mode),
+        }
+    )
+    return env
+
+
+def parse_importtime(trace):
+    """Return {module: cumulative_us} for the modules app imports directly."""
+    modules = {}
+    for line in trace.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # Direct imports of app are indented by one level (two spaces + one)
+        if name.startswith("   ") and not name.startswith("    "):
+            modules[name.strip()] = modules.get(name.strip(), 0) + int(cumulative)
+    return modules
+
+
+def cold_start(env):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", COLD_START],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings = json.loads(result.stdout.strip().splitlines()[-1])
+    return timings, parse_importtime(result.stderr)
+
+
+def run(budget_mode, runs):
+    with tempfile.TemporaryDirectory() as tmp:
+        env = child_env(os.path.join(tmp, "journal.db"), budget_mode)
+        subprocess.run([sys.executable, "-c", SETUP], cwd=ROOT, env=env, check=True,
+                       capture_output=True)
+        # Warm the bytecode cache once, so every measured run starts alike
+        cold_start(env)
+        samples = [cold_start(env) for _ in range(runs)]
+
+    timings = {
+        key: statistics.median(sample[0][key] for sample in samples)
+        for key in ("import_ms", "login_ms", "list_ms")
+    }
+    modules = {}
+    for _, sample_modules in samples:
+        for name, cumulative in sample_modules.items():
+            modules.setdefault(name, []).append(cumulative)
+    timings["modules"] = {
+        name: statistics.median(values) / 1000 for name, values in modules.items()
+    }
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--max-import-ms", type=float, default=None)
+    parser.add_argument("--max-request-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    print(f"Cold starts of app.py (FLASK_ENV=production), median of {args.runs} runs")
+    results = {}
+    for label, budget_mode in (("default startup", False), ("startup budget mode", True)):
+        results[budget_mode] = timing = run(budget_mode, args.runs)
+        print(
+            f"  {label:<20} import {timing['import_ms']:7.1f} ms  "
+            f"first login {timing['login_ms']:6.1f} ms  "
+            f"first list {timing['list_ms']:6.1f} ms"
+        )
+
+    print("\nSlowest imports of app (cumulative, budget mode):")
+    modules = sorted(results[True]["modules"].items(), key=lambda item: -item[1])
+    for name, cumulative_ms in modules[: args.top]:
+        print(f"  {cumulative_ms:7.1f} ms  {name}")
+
+    budget = results[True]
+    over = []
+    if args.max_import_ms is not None and budget["import_ms"] > args.max_import_ms:
+        over.append(f"import {budget['import_ms']:.1f} ms > {args.max_import_ms:g} ms")
+    first_request = budget["login_ms"]
+    if args.max_request_ms is not None and first_request > args.max_request_ms:
+        over.append(f"first request {first_request:.1f} ms > {args.max_request_ms:g} ms")
+    if over:
+        print("\nOver budget: " + "; ".join(over))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Benchmark: pushing pending entries with one PUT in flight vs. several.
+
+Seeds pending entries and syncs them with
+CalDAVService.sync_all_pending_entries against the in-process CalDAV
+stand-in server, which answers every request after --latency seconds to
+mimic a remote server's round trip. Runs once with CALDAV_MAX_CONCURRENCY
+set to 1 (serial pushes) and once with --concurrency, and reports
+entries/s and the peak number of PUTs the server saw in flight.
+
+Usage:
+    python benchmarks/bench_concurrent_sync.py [--rows 200] [--latency 0.05]
+        [--concurrency 8]
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import date, datetime, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from app import create_app  # noqa: E402
+from config import TestingConfig, config  # noqa: E402
+from models import db, User, JournalEntry, SyncOutbox  # noqa: E402
+from models.sync_outbox import record_entry_changes  # noqa: E402
+from services.caldav_service import CalDAVService  # noqa: E402
+from services.caldav_transport import get_transport  # noqa: E402
+from services.connectivity import HealthTracker  # noqa: E402
+from tests.caldav_stub import CalDAVStubServer  # noqa: E402
+
+
+def make_app(server_url, concurrency):
+    config["bench"] = type(
+        "BenchConfig",
+        (TestingConfig,),
+        {
+            "CALDAV_SERVER_URL": server_url,
+            "CALDAV_MAX_CONCURRENCY": concurrency,
+        },
+    )
+    app = create_app("bench")
+    app.extensions["caldav_health"] = HealthTracker(probe=lambda host, port, timeout: True)
+    return app
+
+
+def seed(user_id, rows):
+    now = datetime.now(timezone.utc)
+    entry_ids = db.session.execute(
+        JournalEntry.__table__.insert().returning(JournalEntry.id),
+        [
+            {
+                "user_id": user_id,
+                "title": f"Pending {i}",
+                "content": "Pending content " * 10,
+                "date": date.today(),
+                "sync_status": "sync_pending",
+                "created_at": now,
+                "updated_at": now,
+            }
+            for i in range(rows)
+        ],
+    ).scalars()
+    # Core inserts bypass the outbox listener
+    record_entry_changes(
+        db.session.connection(),
+        [{"user_id": user_id, "entry_id": entry_id, "op": SyncOutbox.OP_UPDATE} for entry_id in entry_ids],
+    )
+    db.session.commit()
+
+
+def run(label, rows, latency, concurrency):
+    server = CalDAVStubServer(latency=latency).start()
+    try:
+        app = make_app(server.url, concurrency)
+        with app.app_context():
+            user = User(username="bench")
+            user.set_password("benchpass")
+            db.session.add(user)
+            db.session.commit()
+            seed(user.id, rows)
+
+            started = time.perf_counter()
+            synced = CalDAVService.sync_all_pending_entries(user.id)["success"]
+            elapsed = time.perf_counter() - started
+            get_transport().close()
+    finally:
+        server.stop()
+
+    assert synced == rows, (label, synced)
+    print(
+        f"  {label:<16} {elapsed:7.2f} s  {rows / elapsed:7.0f} entries/s  "
+        f"{server.max_in_flight:3d} in flight"
+    )
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    print(f"Syncing {args.rows} entries to a CalDAV server with {args.latency * 1000:.0f} ms latency")
+    before = run("serial", args.rows, args.latency, 1)
+    after = run(f"{args.concurrency} concurrent", args.rows, args.latency, args.concurrency)
+    print(f"  speedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
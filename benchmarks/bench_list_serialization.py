@@ -0,0 +1,98 @@
+"""Micro-benchmark: per-row cost of serializing a journal listing page.
+
+Compares the original path (ORM objects + to_dict() + jsonify) with the
+row-tuple fast path used by GET /api/journal/entries, for each available
+JSON backend.
+
+Usage:
+    python benchmarks/bench_list_serialization.py [--rows 500] [--repeat 20]
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from app import create_app  # noqa: E402
+from models import db, User, JournalEntry  # noqa: E402
+from services.journal_service import JournalService  # noqa: E402
+from utils.serialization import JSON_BACKENDS, get_json_backend, rows_to_dicts  # noqa: E402
+
+
+def seed(user_id, count):
+    """Insert count entries with realistic content sizes."""
+    today = date.today()
+    db.session.add_all(
+        JournalEntry(
+            user_id=user_id,
+            title=f"Entry {i}",
+            content=("Lorem ipsum dolor sit amet. " * 40)[: 200 + (i % 10) * 100],
+            date=today - timedelta(days=i // 3),
+        )
+        for i in range(count)
+    )
+    db.session.commit()
+
+
+def best_of(repeat, func):
+    """Return the fastest wall-clock time of repeat calls."""
+    timings = []
+    for _ in range(repeat):
+        db.session.expunge_all()
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    app = create_app("testing")
+    with app.test_request_context():
+        user = User(username="bench")
+        user.set_password("benchpass")
+        db.session.add(user)
+        db.session.commit()
+        user_id = user.id
+        seed(user_id, args.rows)
+
+        def orm_path():
+            result = JournalService.list_entries(user_id=user_id, limit=args.rows)
+            app.json.response(
+                {
+                    "entries": [entry.to_dict() for entry in result["entries"]],
+                    "total": result["total"],
+                }
+            ).get_data()
+
+        results = [("orm + to_dict + jsonify", best_of(args.repeat, orm_path))]
+
+        for name in sorted(JSON_BACKENDS):
+            dumps = get_json_backend(name)
+
+            def row_path(dumps=dumps):
+                result = JournalService.list_entries(
+                    user_id=user_id,
+                    limit=args.rows,
+                    fields=list(JournalEntry.FULL_FIELDS),
+                )
+                dumps({"entries": rows_to_dicts(result["entries"]), "total": result["total"]})
+
+            results.append((f"rows + {name}", best_of(args.repeat, row_path)))
+
+    baseline = results[0][1]
+    print(f"{args.rows} rows, best of {args.repeat}")
+    for label, seconds in results:
+        per_row = seconds / args.rows * 1e6
+        print(f"  {label:<28} {per_row:8.2f} us/row  ({baseline / seconds:4.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Benchmark: re-syncing entries whose calendar events did not change.
+
+Seeds --rows entries with content longer than the event description
+keeps, syncs them to the in-process CalDAV stand-in server (answering
+after --latency seconds), then appends whitespace to every entry, an edit
+the truncated event never shows, and syncs again. The re-sync runs once
+with the stored event hashes cleared, as before change detection, so every
+entry is PUT again, and once with them, and reports the time and the PUTs
+the server stored.
+
+Usage:
+    python benchmarks/bench_resync.py [--rows 200] [--latency 0.02]
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import date, datetime, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from app import create_app  # noqa: E402
+from config import TestingConfig, config  # noqa: E402
+from models import db, User, JournalEntry, SyncOutbox  # noqa: E402
+from models.sync_outbox import record_entry_changes  # noqa: E402
+from services.caldav_service import CalDAVService  # noqa: E402
+from services.caldav_transport import get_transport  # noqa: E402
+from services.connectivity import HealthTracker  # noqa: E402
+from tests.caldav_stub import CalDAVStubServer  # noqa: E402
+
+CONTENT = "Long journal content " * 40
+
+
+def make_app(server_url):
+    config["bench"] = type("BenchConfig", (TestingConfig,), {"CALDAV_SERVER_URL": server_url})
+    app = create_app("bench")
+    app.extensions["caldav_health"] = HealthTracker(probe=lambda host, port, timeout: True)
+    return app
+
+
+def queue_all(user_id, entry_ids):
+    # Core statements bypass the outbox listener
+    record_entry_changes(
+        db.session.connection(),
+        [{"user_id": user_id, "entry_id": entry_id, "op": SyncOutbox.OP_UPDATE} for entry_id in entry_ids],
+    )
+    db.session.commit()
+
+
+def run(label, rows, latency, keep_hashes):
+    server = CalDAVStubServer(latency=latency).start()
+    try:
+        app = make_app(server.url)
+        with app.app_context():
+            user = User(username="bench")
+            user.set_password("benchpass")
+            db.session.add(user)
+            db.session.commit()
+            now = datetime.now(timezone.utc)
+            entry_ids = db.session.execute(
+                JournalEntry.__table__.insert().returning(JournalEntry.id),
+                [
+                    {
+                        "user_id": user.id,
+                        "title": f"Entry {i}",
+                        "content": CONTENT,
+                        "date": date.today(),
+                        "sync_status": "sync_pending",
+                        "created_at": now,
+                        "updated_at": now,
+                    }
+                    for i in range(rows)
+                ],
+            ).scalars().all()
+            queue_all(user.id, entry_ids)
+            CalDAVService.sync_all_pending_entries(user.id)
+
+            edit = {"content": CONTENT + "   "}
+            if not keep_hashes:
+                edit["calendar_content_hash"] = None
+            db.session.execute(JournalEntry.__table__.update().values(**edit))
+            queue_all(user.id, entry_ids)
+            db.session.expire_all()
+            puts = server.puts
+
+            started = time.perf_counter()
+            CalDAVService.sync_all_pending_entries(user.id)
+            elapsed = time.perf_counter() - started
+            puts = server.puts - puts
+            get_transport().close()
+    finally:
+        server.stop()
+
+    print(f"  {label:<22} {elapsed:7.2f} s  {puts:5d} PUTs")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.02)
+    args = parser.parse_args()
+
+    print(f"Re-syncing {args.rows} invisibly edited entries, {args.latency * 1000:.0f} ms server latency")
+    before = run("every entry PUT", args.rows, args.latency, False)
+    after = run("content hash skip", args.rows, args.latency, True)
+    print(f"  speedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
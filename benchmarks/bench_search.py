@@ -0,0 +1,135 @@
+"""Benchmark: full-text search latency over a large journal.
+
+Seeds one user with --rows entries of generated text (the FTS5 triggers
+index them on insert) and reports the median and p95 latency of
+SearchService.search_entries against the LIKE '%term%' scan it replaces.
+
+Usage:
+    python benchmarks/bench_search.py [--rows 100000] [--repeat 20]
+"""
+import argparse
+import itertools
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from sqlalchemy import func, insert, or_, select  # noqa: E402
+from app import create_app  # noqa: E402
+from models import db, User, JournalEntry  # noqa: E402
+from services.search_service import SearchService  # noqa: E402
+
+VOCABULARY_SIZE = 20000
+
+
+def make_vocabulary(rng):
+    """Pseudo-words whose frequencies follow Zipf's law, like real prose."""
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    words = sorted(
+        {"".join(rng.choices(letters, k=rng.randint(4, 9))) for _ in range(VOCABULARY_SIZE)}
+    )
+    rng.shuffle(words)
+    cum_weights = list(itertools.accumulate(1 / rank for rank in range(1, len(words) + 1)))
+    return words, cum_weights
+
+
+def pick_queries(words):
+    """Common, mid-frequency and rare terms, single and combined."""
+    return [
+        words[10],
+        words[300],
+        words[5000],
+        f"{words[40]} {words[200]}",
+        f"{words[100]} {words[3000]}",
+    ]
+
+
+def seed(user_id, count, words, cum_weights, batch=5000):
+    """Insert count entries with Core executemany batches."""
+    rng = random.Random(42)
+    today = date.today()
+    table = JournalEntry.__table__
+    for start in range(0, count, batch):
+        db.session.execute(
+            insert(table),
+            [
+                {
+                    "user_id": user_id,
+                    "title": " ".join(rng.choices(words, cum_weights=cum_weights, k=3)),
+                    "content": " ".join(rng.choices(words, cum_weights=cum_weights, k=rng.randint(30, 120))),
+                    "date": today - timedelta(days=i // 5),
+                    "sync_status": "not_synced",
+                    "completion_status": False,
+                }
+                for i in range(start, min(start + batch, count))
+            ],
+        )
+    db.session.commit()
+
+
+def timings(repeat, func):
+    """Return per-call wall-clock times in milliseconds."""
+    result = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        result.append((time.perf_counter() - start) * 1000)
+    return result
+
+
+def report(label, samples):
+    p95 = statistics.quantiles(samples, n=20)[-1] if len(samples) > 1 else samples[0]
+    print(f"  {label:<36} median {statistics.median(samples):8.2f} ms   p95 {p95:8.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    app = create_app("testing")
+    with app.app_context():
+        user = User(username="bench")
+        user.set_password("benchpass")
+        db.session.add(user)
+        db.session.commit()
+        user_id = user.id
+
+        words, cum_weights = make_vocabulary(random.Random(7))
+        start = time.perf_counter()
+        seed(user_id, args.rows, words, cum_weights)
+        print(f"Seeded {args.rows} entries in {time.perf_counter() - start:.1f} s")
+
+        for query in pick_queries(words):
+            print(f"q={query!r}")
+            report(
+                "fts5 top 20",
+                timings(args.repeat, lambda: SearchService.search_entries(user_id, query)),
+            )
+
+            def like_scan(query=query):
+                conditions = [
+                    or_(JournalEntry.title.like(f"%{term}%"), JournalEntry.content.like(f"%{term}%"))
+                    for term in query.split()
+                ]
+                db.session.execute(
+                    select(JournalEntry.id)
+                    .where(JournalEntry.user_id == user_id, *conditions)
+                    .order_by(JournalEntry.date.desc())
+                    .limit(20)
+                ).all()
+                db.session.execute(
+                    select(func.count()).where(JournalEntry.user_id == user_id, *conditions)
+                ).scalar()
+
+            report("LIKE scan top 20 + count", timings(args.repeat, like_scan))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Benchmark: concurrent write and read throughput with and without the SQLite profile.
+
+Runs writer threads (one commit per created entry) alongside reader
+threads (first page of the listing) against a file-backed database,
+once with SQLITE_PRAGMAS / SQLALCHEMY_ENGINE_OPTIONS from config.Config
+and once with SQLite's defaults, and reports throughput and
+"database is locked" errors.
+
+Usage:
+    python benchmarks/bench_sqlite_profile.py [--writers 4] [--readers 4] [--seconds 5]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from sqlalchemy.exc import OperationalError  # noqa: E402
+from app import create_app  # noqa: E402
+from config import Config, TestingConfig, config  # noqa: E402
+from models import db, User  # noqa: E402
+from services.journal_service import JournalService  # noqa: E402
+
+
+def make_app(db_path, profile):
+    attrs = {"SQLALCHEMY_DATABASE_URI": f"sqlite:///{db_path}"}
+    if profile:
+        attrs["SQLITE_PRAGMAS"] = Config.SQLITE_PRAGMAS
+        attrs["SQLALCHEMY_ENGINE_OPTIONS"] = Config.SQLALCHEMY_ENGINE_OPTIONS
+    else:
+        attrs["SQLITE_PRAGMAS"] = {}
+        # sqlite3's default 5 s busy wait is SQLite's "no tuning" baseline too
+        attrs["SQLALCHEMY_ENGINE_OPTIONS"] = {"pool_size": 10, "max_overflow": 10}
+    config["bench"] = type("BenchConfig", (TestingConfig,), attrs)
+    return create_app("bench")
+
+
+def run(profile, writers, readers, seconds):
+    with tempfile.TemporaryDirectory() as tmp:
+        app = make_app(os.path.join(tmp, "journal.db"), profile)
+        with app.app_context():
+            user = User(username="bench")
+            user.set_password("benchpass")
+            db.session.add(user)
+            db.session.commit()
+            user_id = user.id
+            for i in range(200):
+                JournalService.create_entry(user_id, f"Seed {i}", "Seed content " * 20)
+
+        counts = {"writes": 0, "reads": 0, "locked": 0}
+        lock = threading.Lock()
+        deadline = time.perf_counter() + seconds
+
+        def bump(key):
+            with lock:
+                counts[key] += 1
+
+        def writer(n):
+            with app.app_context():
+                i = 0
+                while time.perf_counter() < deadline:
+                    try:
+                        JournalService.create_entry(user_id, f"W{n}-{i}", "Written content " * 20)
+                        bump("writes")
+                    except OperationalError:
+                        db.session.rollback()
+                        bump("locked")
+                    i += 1
+
+        def reader():
+            with app.app_context():
+                while time.perf_counter() < deadline:
+                    try:
+                        JournalService.list_entries(user_id, limit=50, include_total=True)
+                        bump("reads")
+                    except OperationalError:
+                        db.session.rollback()
+                        bump("locked")
+                    db.session.remove()
+
+        threads = [threading.Thread(target=writer, args=(n,)) for n in range(writers)]
+        threads += [threading.Thread(target=reader) for _ in range(readers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        with app.app_context():
+            db.engine.dispose()
+        return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=5)
+    args = parser.parse_args()
+
+    print(f"{args.writers} writers + {args.readers} readers, {args.seconds:g} s each")
+    for label, profile in (("SQLite defaults", False), ("SQLite profile", True)):
+        counts = run(profile, args.writers, args.readers, args.seconds)
+        print(
+            f"  {label:<16} {counts['writes'] / args.seconds:8.0f} writes/s  "
+            f"{counts['reads'] / args.seconds:8.0f} reads/s  {counts['locked']:5d} locked errors"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""Benchmark: syncing pending entries one commit per entry vs. per chunk.
+
+Seeds pending entries in a file-backed SQLite database (so every commit
+pays for its fsync) and syncs them the old way (load all pending entries,
+sync_entry_to_calendar committing each one) and with
+CalDAVService.sync_all_pending_entries (queued outbox changes in chunks,
+one commit per chunk). Reports wall time, commits and peak Python memory of each.
+
+The old way is quadratic, since every commit expires every loaded entry;
+it runs on --baseline-rows (default 1000) so the benchmark finishes, and
+the throughput ratio understates the gain at --rows.
+
+Usage:
+    python benchmarks/bench_sync.py [--rows 10000] [--baseline-rows 1000]
+        [--chunk-size 200]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, datetime, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from sqlalchemy import event  # noqa: E402
+from app import create_app  # noqa: E402
+from config import Config, TestingConfig, config  # noqa: E402
+from models import db, User, JournalEntry, SyncOutbox  # noqa: E402
+from models.journal_stats import rebuild_entry_counts  # noqa: E402
+from models.sync_outbox import record_entry_changes  # noqa: E402
+from services.caldav_service import CalDAVService  # noqa: E402
+
+
+def make_app(db_path, chunk_size):
+    config["bench"] = type(
+        "BenchConfig",
+        (TestingConfig,),
+        {
+            "SQLALCHEMY_DATABASE_URI": f"sqlite:///{db_path}",
+            "SQLITE_PRAGMAS": Config.SQLITE_PRAGMAS,
+            "CALDAV_SYNC_CHUNK_SIZE": chunk_size,
+        },
+    )
+    return create_app("bench")
+
+
+def seed(user_id, rows):
+    now = datetime.now(timezone.utc)
+    entry_ids = db.session.execute(
+        JournalEntry.__table__.insert().returning(JournalEntry.id),
+        [
+            {
+                "user_id": user_id,
+                "title": f"Pending {i}",
+                "content": "Pending content " * 10,
+                "date": date.today(),
+                "sync_status": "sync_pending",
+                "created_at": now,
+                "updated_at": now,
+            }
+            for i in range(rows)
+        ],
+    ).scalars()
+    # Core inserts bypass the outbox listener
+    record_entry_changes(
+        db.session.connection(),
+        [{"user_id": user_id, "entry_id": entry_id, "op": SyncOutbox.OP_UPDATE} for entry_id in entry_ids],
+    )
+    rebuild_entry_counts(db.session.connection(), user_id)
+    db.session.commit()
+
+
+def sync_per_entry(user_id):
+    """The pre-chunking sync: every pending row in memory, one commit each."""
+    entries = JournalEntry.query.filter_by(user_id=user_id, sync_status="sync_pending").all()
+    return sum(CalDAVService.sync_entry_to_calendar(entry) for entry in entries)
+
+
+def sync_chunked(user_id):
+    return CalDAVService.sync_all_pending_entries(user_id)["success"]
+
+
+def run(label, sync, rows, chunk_size):
+    with tempfile.TemporaryDirectory() as tmp:
+        app = make_app(os.path.join(tmp, "journal.db"), chunk_size)
+        with app.app_context():
+            CalDAVService.is_offline = staticmethod(lambda: False)
+            user = User(username="bench")
+            user.set_password("benchpass")
+            db.session.add(user)
+            db.session.commit()
+            user_id = user.id
+            seed(user_id, rows)
+            db.session.remove()
+
+            commits = []
+            event.listen(db.engine, "commit", lambda conn: commits.append(1))
+            tracemalloc.start()
+            started = time.perf_counter()
+            synced = sync(user_id)
+            elapsed = time.perf_counter() - started
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            db.engine.dispose()
+
+    assert synced == rows, (label, synced)
+    print(
+        f"  {label:<18} {rows:6d} rows {elapsed:8.2f} s  {rows / elapsed:7.0f} entries/s  "
+        f"{len(commits):6d} commits  peak {peak / 1024 / 1024:6.1f} MiB"
+    )
+    return rows / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--baseline-rows", type=int, default=1000)
+    parser.add_argument("--chunk-size", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"Syncing pending entries (chunk size {args.chunk_size})")
+    before = run("commit per entry", sync_per_entry, args.baseline_rows, args.chunk_size)
+    after = run("commit per chunk", sync_chunked, args.rows, args.chunk_size)
+    print(f"  throughput: {after / before:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
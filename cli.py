@@ -0,0 +1,73 @@
+"""Flask CLI commands for database maintenance and the background sync worker."""
+import logging
+import click
+from models import db, User
+
+logger = logging.getLogger(__name__)
+
+
+def register_commands(app):
+    """
+    Register maintenance commands on the Flask CLI.
+
+    Args:
+        app: Flask application instance
+    """
+
+    @app.cli.command("db-upgrade")
+    def db_upgrade():
+        """Create missing tables and apply pending schema migrations."""
+        from migrations import upgrade
+
+        with db.engine.begin() as connection:
+            before, after = upgrade(connection, db.metadata)
+
+        if before == after:
+            click.echo(f"Database schema is up to date (version {after})")
+        else:
+            logger.info(f"Upgraded database schema from version {before} to {after}")
+            click.echo(f"Upgraded database schema from version {before} to {after}")
+
+    @app.cli.command("rebuild-journal-stats")
+    def rebuild_journal_stats():
+        """Rebuild per-user and per-date journal entry counters."""
+        from models.journal_stats import rebuild_entry_counts
+
+        user_ids = [user_id for (user_id,) in db.session.query(User.id).all()]
+        connection = db.session.connection()
+        for user_id in user_ids:
+            rebuild_entry_counts(connection, user_id)
+        db.session.commit()
+
+        logger.info(f"Rebuilt journal stats for {len(user_ids)} users")
+        click.echo(f"Rebuilt journal stats for {len(user_ids)} users")
+
+    @app.cli.command("rebuild-search-index")
+    def rebuild_search_index_command():
+        """Create the full-text search index if missing and re-index all entries."""
+        from models.search_index import create_search_index, rebuild_search_index
+
+        connection = db.session.connection()
+        if connection.dialect.name != "sqlite":
+            raise click.ClickException("Full-text search requires SQLite (FTS5)")
+        create_search_index(connection)
+        rebuild_search_index(connection)
+        db.session.commit()
+
+        logger.info("Rebuilt journal search index")
+        click.echo("Rebuilt journal search index")
+
+    @app.cli.command("sync-worker")
+    @click.option("--once", is_flag=True, help="Exit when no job is due instead of polling.")
+    @click.option("--max-jobs", type=int, default=None, help="Exit after running this many jobs.")
+    @click.option("--worker-id", default=None, help="Name recorded on claimed jobs (default host:pid).")
+    def sync_worker(once, max_jobs, worker_id):
+        """Run queued calendar sync jobs."""
+        from services.sync_jobs import run_worker
+
+        try:
+            processed = run_worker(worker_id=worker_id, once=once, max_jobs=max_jobs)
+        except KeyboardInterrupt:
+            click.echo("Sync worker interrupted")
+            return
+        click.echo(f"Sync worker ran {processed} jobs")
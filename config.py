@@ -11,6 +11,37 @@ class Config:
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     SQLALCHEMY_ECHO = os.environ.get("SQLALCHEMY_ECHO", "False").lower() == "true"
 
+    # Engine pool: pre-ping drops dead connections before they are handed out
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "pool_size": int(os.environ.get("DB_POOL_SIZE", "5")),
+        "max_overflow": int(os.environ.get("DB_MAX_OVERFLOW", "10")),
+        "pool_timeout": int(os.environ.get("DB_POOL_TIMEOUT", "10")),
+        "pool_pre_ping": True,
+    }
+
+    # Read-only engine for GET/HEAD requests of the journal and calendar
+    # APIs: file-backed SQLite is reopened with mode=ro and query_only, or
+    # DATABASE_READ_URL names a replica
+    DB_READER_ENABLED = os.environ.get("DB_READER_ENABLED", "True").lower() == "true"
+    DB_READER_POOL_SIZE = int(os.environ.get("DB_READER_POOL_SIZE", "20"))
+    DATABASE_READ_URL = os.environ.get("DATABASE_READ_URL", "")
+
+    # Upgrade an outdated schema at startup instead of waiting for
+    # `flask db-upgrade` (on in development and testing)
+    DB_AUTO_UPGRADE = os.environ.get("DB_AUTO_UPGRADE", "False").lower() == "true"
+
+    # SQLite profile applied to every new connection (empty disables it):
+    # WAL for concurrent readers, NORMAL sync (no fsync per commit in WAL),
+    # wait up to busy_timeout ms for locks, 20 MB page cache, 256 MB mmap
+    SQLITE_PRAGMAS = {
+        "journal_mode": os.environ.get("SQLITE_JOURNAL_MODE", "WAL"),
+        "synchronous": os.environ.get("SQLITE_SYNCHRONOUS", "NORMAL"),
+        "busy_timeout": int(os.environ.get("SQLITE_BUSY_TIMEOUT", "5000")),
+        "cache_size": int(os.environ.get("SQLITE_CACHE_SIZE", "-20000")),
+        "mmap_size": int(os.environ.get("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024))),
+        "temp_store": "MEMORY",
+    }
+
     # Session configuration
     PERMANENT_SESSION_LIFETIME = timedelta(hours=24)
     SESSION_COOKIE_SECURE = (
@@ -21,10 +52,105 @@ class Config:
 
     # Logging configuration
     LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO")
+
+    # Startup budget mode for serverless cold starts: the schema version
+    # check waits for the first request instead of running in create_app
+    STARTUP_BUDGET_MODE = (
+        os.environ.get("STARTUP_BUDGET_MODE", "False").lower() == "true"
+    )
     LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
+    # Journal listing: page size cap; JSON_BACKEND is "auto", "orjson" or "json"
+    JOURNAL_LIST_MAX_LIMIT = int(os.environ.get("JOURNAL_LIST_MAX_LIMIT", "100"))
+    JSON_BACKEND = os.environ.get("JSON_BACKEND", "auto")
+
+    # Maximum number of operations accepted by POST /api/journal/entries/bulk
+    JOURNAL_BULK_MAX_OPERATIONS = int(
+        os.environ.get("JOURNAL_BULK_MAX_OPERATIONS", "1000")
+    )
+
+    # Full-text search: FTS5 tokenizer for the search index (empty picks
+    # trigram where available), and the page size cap for /api/journal/search
+    SEARCH_TOKENIZER = os.environ.get("SEARCH_TOKENIZER", "")
+    SEARCH_MAX_LIMIT = int(os.environ.get("SEARCH_MAX_LIMIT", "100"))
+
+    # Page size cap for /api/calendar/events (served from the local mirror)
+    CALENDAR_EVENTS_MAX_LIMIT = int(os.environ.get("CALENDAR_EVENTS_MAX_LIMIT", "200"))
+
+    # Authenticated-user cache: seconds an entry lives (0 disables it), and
+    # an optional shared UserCacheBackend ("package.module:Class")
+    USER_CACHE_TTL = int(os.environ.get("USER_CACHE_TTL", "300"))
+    USER_CACHE_BACKEND = os.environ.get("USER_CACHE_BACKEND", "")
+
     # CalDAV configuration
     CALDAV_SERVER_URL = os.environ.get("CALDAV_SERVER_URL", "")
+    CALDAV_USERNAME = os.environ.get("CALDAV_USERNAME", "")
+    CALDAV_PASSWORD = os.environ.get("CALDAV_PASSWORD", "")
+    CALDAV_AUTH_TYPE = os.environ.get("CALDAV_AUTH_TYPE", "basic")  # or "digest"
+
+    # CalDAV HTTP session shared by all users: connections kept alive per
+    # server, their idle lifetime (s), request timeout (s), and TLS
+    # verification ("true", "false" or a CA bundle path)
+    CALDAV_POOL_SIZE = int(os.environ.get("CALDAV_POOL_SIZE", "10"))
+    CALDAV_KEEPALIVE = float(os.environ.get("CALDAV_KEEPALIVE", "600"))
+    CALDAV_TIMEOUT = float(os.environ.get("CALDAV_TIMEOUT", "10"))
+    CALDAV_TLS_VERIFY = {"true": True, "false": False}.get(
+        os.environ.get("CALDAV_TLS_VERIFY", "true").lower(),
+        os.environ.get("CALDAV_TLS_VERIFY"),
+    )
+
+    # CalDAV reachability: a probe result is reused for CALDAV_HEALTH_TTL
+    # seconds; after CALDAV_BREAKER_THRESHOLD consecutive failures the host
+    # is treated as offline for CALDAV_BREAKER_RESET seconds without probing.
+    # CALDAV_HEALTH_PROBE may name a replacement probe ("package.module:func")
+    CALDAV_HEALTH_TTL = float(os.environ.get("CALDAV_HEALTH_TTL", "30"))
+    CALDAV_PROBE_TIMEOUT = float(os.environ.get("CALDAV_PROBE_TIMEOUT", "3"))
+    CALDAV_BREAKER_THRESHOLD = int(os.environ.get("CALDAV_BREAKER_THRESHOLD", "3"))
+    CALDAV_BREAKER_RESET = float(os.environ.get("CALDAV_BREAKER_RESET", "60"))
+    CALDAV_HEALTH_PROBE = os.environ.get("CALDAV_HEALTH_PROBE", "")
+
+    # Pending entries pushed (and committed) per chunk by a calendar sync,
+    # PUTs in flight at once per server, and the timeout (s) of each such
+    # request; a chunk can take chunk size / concurrency timeouts in all
+    CALDAV_SYNC_CHUNK_SIZE = int(os.environ.get("CALDAV_SYNC_CHUNK_SIZE", "200"))
+    CALDAV_MAX_CONCURRENCY = int(os.environ.get("CALDAV_MAX_CONCURRENCY", "4"))
+    CALDAV_PUSH_TIMEOUT = float(os.environ.get("CALDAV_PUSH_TIMEOUT", "30"))
+
+    # Changed events fetched per calendar-multiget REPORT when pulling
+    CALDAV_MULTIGET_BATCH_SIZE = int(os.environ.get("CALDAV_MULTIGET_BATCH_SIZE", "100"))
+
+    # Background sync jobs: attempts before a job fails, exponential backoff
+    # base and cap (seconds) between attempts, how often an idle
+    # `flask sync-worker` polls the queue, and seconds a running job may go
+    # without finishing before another worker takes it over
+    SYNC_JOB_MAX_ATTEMPTS = int(os.environ.get("SYNC_JOB_MAX_ATTEMPTS", "5"))
+    SYNC_JOB_BACKOFF_BASE = float(os.environ.get("SYNC_JOB_BACKOFF_BASE", "5"))
+    SYNC_JOB_BACKOFF_MAX = float(os.environ.get("SYNC_JOB_BACKOFF_MAX", "600"))
+    SYNC_WORKER_POLL_INTERVAL = float(os.environ.get("SYNC_WORKER_POLL_INTERVAL", "2"))
+    SYNC_JOB_LEASE = float(os.environ.get("SYNC_JOB_LEASE", "900"))
+    # Run queued jobs in the web process after the response is sent, for
+    # hosts that cannot run a worker (on by default on Vercel)
+    SYNC_JOBS_RUN_AFTER_RESPONSE = (
+        os.environ.get(
+            "SYNC_JOBS_RUN_AFTER_RESPONSE", "True" if os.environ.get("VERCEL") else "False"
+        ).lower()
+        == "true"
+    )
+    # Jobs running at once across all users (each user runs one at a time)
+    SYNC_MAX_RUNNING_JOBS = int(os.environ.get("SYNC_MAX_RUNNING_JOBS", "4"))
+
+    # Automatic sync mode: seconds after a user's last journal change before
+    # their changes are pushed, and the longest a push waits on a user who
+    # keeps writing (seconds after the first change)
+    AUTO_SYNC_DELAY = float(os.environ.get("AUTO_SYNC_DELAY", "10"))
+    AUTO_SYNC_MAX_DELAY = float(os.environ.get("AUTO_SYNC_MAX_DELAY", "120"))
+
+    # Scheduled trigger for hosts without a worker: GET
+    # /api/calendar/jobs/run-due with "Authorization: Bearer <CRON_SECRET>"
+    # (sent by Vercel Cron) runs up to SYNC_CRON_MAX_JOBS due jobs; an
+    # unset secret disables the endpoint
+    SYNC_CRON_SECRET = os.environ.get("CRON_SECRET", "")
+    SYNC_CRON_MAX_JOBS = int(os.environ.get("SYNC_CRON_MAX_JOBS", "20"))
 
     # HTTPS/TLS enforcement (Vercel provides automatic HTTPS)
     FORCE_HTTPS = os.environ.get("FORCE_HTTPS", "True").lower() == "true"
@@ -35,6 +161,7 @@ class DevelopmentConfig(Config):
 
     DEBUG = True
     SQLALCHEMY_ECHO = True
+    DB_AUTO_UPGRADE = True
     SESSION_COOKIE_SECURE = False
 
 
@@ -43,6 +170,10 @@ class ProductionConfig(Config):
 
     DEBUG = False
     SESSION_COOKIE_SECURE = True
+    LOG_LEVEL = os.environ.get("LOG_LEVEL", "WARNING")
+    STARTUP_BUDGET_MODE = (
+        os.environ.get("STARTUP_BUDGET_MODE", "True").lower() == "true"
+    )
 
 
 class TestingConfig(Config):
@@ -50,6 +181,9 @@ class TestingConfig(Config):
 
     TESTING = True
     SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
+    DB_AUTO_UPGRADE = True
+    # In-memory databases use a single static connection, which takes no pool sizing
+    SQLALCHEMY_ENGINE_OPTIONS = {}
     WTF_CSRF_ENABLED = False
 
 
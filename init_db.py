@@ -6,11 +6,16 @@ import os
 sys.path.insert(0, os.path.dirname(__file__))
 
 from app import create_app
+from migrations import upgrade
 from models import db, User
 
 app = create_app()
 
 with app.app_context():
+    # Create the tables and apply migrations, whatever DB_AUTO_UPGRADE says
+    with db.engine.begin() as connection:
+        upgrade(connection, db.metadata)
+
     # Check if user already exists
     existing_user = User.query.filter_by(username="testuser").first()
     if existing_user:
@@ -0,0 +1,153 @@
+"""Versioned schema migrations.
+
+The database records the version it was last upgraded to in the
+schema_version table. `flask db-upgrade` creates any missing tables (the
+baseline, which is the full current schema on an empty database) and then
+applies every migration newer than the stored version, in order, in one
+transaction.
+
+A schema change ships as a module here with an idempotent
+upgrade(connection), appended to MIGRATIONS; its version is its position
+in the list. A migration declares the tables and indexes it touches as
+they were at its version, instead of importing the models, which keep
+changing after it ships.
+"""
+import logging
+import threading
+from typing import Optional, Tuple
+from sqlalchemy import Column, Integer, MetaData, Table, select
+from sqlalchemy.exc import DBAPIError
+from . import (
+    m0001_query_shape_indexes,
+    m0002_calendar_sync_state,
+    m0003_calendar_event_mirror,
+    m0004_sync_jobs,
+    m0005_sync_outbox,
+    m0006_sync_job_status_index,
+    m0007_entry_calendar_hash,
+)
+
+logger = logging.getLogger(__name__)
+
+MIGRATIONS = [
+    m0001_query_shape_indexes,
+    m0002_calendar_sync_state,
+    m0003_calendar_event_mirror,
+    m0004_sync_jobs,
+    m0005_sync_outbox,
+    m0006_sync_job_status_index,
+    m0007_entry_calendar_hash,
+]
+
+# Version of a database with every migration applied
+HEAD_VERSION = len(MIGRATIONS)
+
+schema_metadata = MetaData()
+
+schema_version = Table(
+    "schema_version",
+    schema_metadata,
+    Column("version", Integer, nullable=False),
+)
+
+
+def get_schema_version(connection) -> Optional[int]:
+    """
+    Read the stored schema version with a single-row query.
+
+    Args:
+        connection: SQLAlchemy connection
+
+    Returns:
+        Stored version, or None if the database was never upgraded
+    """
+    try:
+        return connection.execute(select(schema_version.c.version)).scalar()
+    except DBAPIError:
+        # No schema_version table yet
+        connection.rollback()
+        return None
+
+
+def upgrade(connection, metadata) -> Tuple[int, int]:
+    """
+    Bring a database up to HEAD_VERSION.
+
+    Args:
+        connection: SQLAlchemy connection inside a transaction
+        metadata: Application metadata providing the baseline tables
+
+    Returns:
+        Tuple of (version before, version after)
+    """
+    schema_metadata.create_all(connection)
+    current = connection.execute(select(schema_version.c.version)).scalar()
+    if current is None:
+        connection.execute(schema_version.insert().values(version=0))
+        current = 0
+
+    metadata.create_all(connection)
+    for version, migration in enumerate(MIGRATIONS, start=1):
+        if version <= current:
+            continue
+        migration.upgrade(connection)
+        logger.info(f"Applied migration {version} ({migration.__name__})")
+
+    if current < HEAD_VERSION:
+        connection.execute(schema_version.update().values(version=HEAD_VERSION))
+    return current, HEAD_VERSION
+
+
+def check_schema(app, db) -> None:
+    """
+    Compare the database's schema version with HEAD_VERSION at startup.
+
+    This is a single-row SELECT instead of reflecting every table. An
+    outdated database is upgraded in place when DB_AUTO_UPGRADE is set
+    (development, testing); otherwise a warning asks for `flask db-upgrade`.
+
+    Args:
+        app: Flask application instance
+        db: Flask-SQLAlchemy extension bound to the app
+    """
+    with app.app_context():
+        engine = db.engine
+        with engine.connect() as connection:
+            version = get_schema_version(connection)
+
+        if version is not None and version >= HEAD_VERSION:
+            return
+        if not app.config.get("DB_AUTO_UPGRADE", False):
+            logger.warning(
+                f"Database schema is at version {version or 0}, expected "
+                f"{HEAD_VERSION}; run `flask db-upgrade`"
+            )
+            return
+        with engine.begin() as connection:
+            before, after = upgrade(connection, db.metadata)
+        logger.info(f"Upgraded database schema from version {before} to {after}")
+
+
+def defer_schema_check(app, db) -> None:
+    """
+    Run check_schema on the app's first request instead of at startup.
+
+    Keeps the database connection out of a serverless cold start; only the
+    first request pays for it.
+
+    Args:
+        app: Flask application instance
+        db: Flask-SQLAlchemy extension bound to the app
+    """
+    lock = threading.Lock()
+    checked = False
+
+    @app.before_request
+    def _check_schema_once():
+        nonlocal checked
+        if checked:
+            return
+        with lock:
+            if not checked:
+                check_schema(app, db)
+                checked = True
@@ -0,0 +1,43 @@
+"""Replace the single-column journal_entries indexes with query-shaped ones.
+
+Adds the partial (user_id, id) index of pending syncs and the
+(user_id, calendar_event_id) index, and drops the user_id, date,
+sync_status and calendar_event_id indexes they supersede.
+"""
+from sqlalchemy import Column, Date, DateTime, Index, Integer, MetaData, String, Table, text
+from models.partial_index import partial_index
+
+# journal_entries as of this migration, reduced to the indexed columns
+journal_entries = Table(
+    "journal_entries",
+    MetaData(),
+    Column("id", Integer, primary_key=True),
+    Column("user_id", Integer, nullable=False),
+    Column("date", Date, nullable=False),
+    Column("sync_status", String(20), nullable=False),
+    Column("calendar_event_id", String(255), nullable=True),
+    Column("created_at", DateTime, nullable=False),
+    Index("ix_journal_entries_user_date_created_id", "user_id", "date", "created_at", "id"),
+    partial_index("ix_journal_entries_user_pending", "user_id", "id", where="sync_status = 'sync_pending'"),
+    Index("ix_journal_entries_user_calendar_event", "user_id", "calendar_event_id"),
+)
+
+DROPPED_INDEXES = (
+    "ix_journal_entries_user_id",
+    "ix_journal_entries_date",
+    "ix_journal_entries_sync_status",
+    "ix_journal_entries_calendar_event_id",
+)
+
+
+def upgrade(connection) -> None:
+    """
+    Create the new indexes and drop the superseded ones, if needed.
+
+    Args:
+        connection: SQLAlchemy connection inside a transaction
+    """
+    for index in journal_entries.indexes:
+        index.create(connection, checkfirst=True)
+    for name in DROPPED_INDEXES:
+        connection.execute(text(f"DROP INDEX IF EXISTS {name}"))
@@ -0,0 +1,27 @@
+"""Add calendar_sync_state, the per-user CTag and sync-token of a pull."""
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, MetaData, String, Table
+
+metadata = MetaData()
+
+# Referenced by the foreign key only; never created here
+Table("users", metadata, Column("id", Integer, primary_key=True))
+
+calendar_sync_state = Table(
+    "calendar_sync_state",
+    metadata,
+    Column("user_id", Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
+    Column("calendar_url", String(500), primary_key=True),
+    Column("ctag", String(255), nullable=True),
+    Column("sync_token", String(500), nullable=True),
+    Column("synced_at", DateTime, nullable=True),
+)
+
+
+def upgrade(connection) -> None:
+    """
+    Create the calendar_sync_state table, if needed.
+
+    Args:
+        connection: SQLAlchemy connection inside a transaction
+    """
+    calendar_sync_state.create(connection, checkfirst=True)
@@ -0,0 +1,49 @@
+"""Turn calendar_events into a per-user mirror of the CalDAV calendar.
+
+Adds the href and etag columns, makes UIDs unique per user instead of
+globally, and adds the listing and href indexes; the user_id and
+external_event_id indexes they supersede are dropped.
+"""
+from sqlalchemy import Column, DateTime, Index, Integer, MetaData, String, Table, inspect, text
+
+NEW_COLUMNS = {
+    "href": "VARCHAR(1000)",
+    "etag": "VARCHAR(255)",
+}
+
+# calendar_events as of this migration, reduced to the indexed columns
+calendar_events = Table(
+    "calendar_events",
+    MetaData(),
+    Column("id", Integer, primary_key=True),
+    Column("user_id", Integer, nullable=False),
+    Column("external_event_id", String(255), nullable=False),
+    Column("href", String(1000), nullable=True),
+    Column("start_datetime", DateTime, nullable=False),
+    Index("ix_calendar_events_user_external_event", "user_id", "external_event_id", unique=True),
+    Index("ix_calendar_events_user_start_id", "user_id", "start_datetime", "id"),
+    Index("ix_calendar_events_user_href", "user_id", "href"),
+)
+
+DROPPED_INDEXES = (
+    "ix_calendar_events_user_id",
+    "ix_calendar_events_external_event_id",
+)
+
+
+def upgrade(connection) -> None:
+    """
+    Add the mirror columns and indexes, if needed.
+
+    Args:
+        connection: SQLAlchemy connection inside a transaction
+    """
+    existing = {column["name"] for column in inspect(connection).get_columns("calendar_events")}
+    for name, column_type in NEW_COLUMNS.items():
+        if name not in existing:
+            connection.execute(text(f"ALTER TABLE calendar_events ADD COLUMN {name} {column_type}"))
+
+    for name in DROPPED_INDEXES:
+        connection.execute(text(f"DROP INDEX IF EXISTS {name}"))
+    for index in calendar_events.indexes:
+        index.create(connection, checkfirst=True)
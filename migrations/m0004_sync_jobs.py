@@ -0,0 +1,41 @@
+"""Add sync_jobs, the queue of background calendar syncs."""
+from sqlalchemy import JSON, Column, DateTime, ForeignKey, Integer, MetaData, String, Table, Text
+from models.partial_index import partial_index
+
+metadata = MetaData()
+
+# Referenced by the foreign key only; never created here
+Table("users", metadata, Column("id", Integer, primary_key=True))
+
+sync_jobs = Table(
+    "sync_jobs",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("user_id", Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+    Column("kind", String(20), nullable=False),
+    Column("payload", JSON, nullable=True),
+    Column("status", String(20), nullable=False),
+    Column("attempts", Integer, nullable=False),
+    Column("max_attempts", Integer, nullable=False),
+    Column("run_at", DateTime, nullable=False),
+    Column("locked_by", String(100), nullable=True),
+    Column("locked_at", DateTime, nullable=True),
+    Column("result", JSON, nullable=True),
+    Column("last_error", Text, nullable=True),
+    Column("created_at", DateTime, nullable=False),
+    Column("finished_at", DateTime, nullable=True),
+    # Replaced by ix_sync_jobs_status_run_at in migration 6
+    partial_index("ix_sync_jobs_queued_run_at", "run_at", "id", where="status = 'queued'"),
+    partial_index("ix_sync_jobs_queued_user_kind", "user_id", "kind", where="status = 'queued'"),
+    partial_index("ix_sync_jobs_running_locked_at", "locked_at", where="status = 'running'"),
+)
+
+
+def upgrade(connection) -> None:
+    """
+    Create the sync_jobs table and its indexes, if needed.
+
+    Args:
+        connection: SQLAlchemy connection inside a transaction
+    """
+    sync_jobs.create(connection, checkfirst=True)
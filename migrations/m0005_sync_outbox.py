@@ -0,0 +1,75 @@
+"""Add sync_outbox, the queue of journal changes to send to the calendar.
+
+Entries left pending by the sync_status scan it replaces are queued as
+updates, so they still go out with the next sync.
+"""
+from datetime import datetime, timezone
+from sqlalchemy import (
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    exists,
+    insert,
+    literal,
+    select,
+)
+
+metadata = MetaData()
+
+# Referenced by the foreign key only; never created here
+Table("users", metadata, Column("id", Integer, primary_key=True))
+
+# Read only, reduced to the columns the pending entries are queued from
+journal_entries = Table(
+    "journal_entries",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("user_id", Integer, nullable=False),
+    Column("sync_status", String(20), nullable=False),
+)
+
+sync_outbox = Table(
+    "sync_outbox",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("user_id", Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+    Column("entry_id", Integer, nullable=False),
+    Column("op", String(10), nullable=False),
+    Column("calendar_event_id", String(255), nullable=True),
+    Column("created_at", DateTime, nullable=False),
+    Index("ix_sync_outbox_user_id", "user_id", "id"),
+    Index("ix_sync_outbox_entry_id", "entry_id"),
+)
+
+
+def upgrade(connection) -> None:
+    """
+    Create the sync_outbox table and queue pending entries, if needed.
+
+    Args:
+        connection: SQLAlchemy connection inside a transaction
+    """
+    sync_outbox.create(connection, checkfirst=True)
+
+    entries = journal_entries
+    connection.execute(
+        insert(sync_outbox).from_select(
+            ["user_id", "entry_id", "op", "created_at"],
+            select(
+                entries.c.user_id,
+                entries.c.id,
+                literal("update"),
+                literal(datetime.now(timezone.utc)),
+            )
+            .where(
+                entries.c.sync_status == "sync_pending",
+                ~exists().where(sync_outbox.c.entry_id == entries.c.id),
+            )
+            .order_by(entries.c.id),
+        )
+    )
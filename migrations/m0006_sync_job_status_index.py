@@ -0,0 +1,28 @@
+"""Replace the queued-only claim index with one on status, run_at and id.
+
+Claims now also count running jobs and look for a running job of the same
+user; on the partial index those lookups were scans.
+"""
+from sqlalchemy import Column, DateTime, Index, Integer, MetaData, String, Table, text
+
+# sync_jobs as of this migration, reduced to the indexed columns
+sync_jobs = Table(
+    "sync_jobs",
+    MetaData(),
+    Column("id", Integer, primary_key=True),
+    Column("status", String(20), nullable=False),
+    Column("run_at", DateTime, nullable=False),
+    Index("ix_sync_jobs_status_run_at", "status", "run_at", "id"),
+)
+
+
+def upgrade(connection) -> None:
+    """
+    Swap ix_sync_jobs_queued_run_at for ix_sync_jobs_status_run_at.
+
+    Args:
+        connection: SQLAlchemy connection inside a transaction
+    """
+    connection.execute(text("DROP INDEX IF EXISTS ix_sync_jobs_queued_run_at"))
+    for index in sync_jobs.indexes:
+        index.create(connection, checkfirst=True)
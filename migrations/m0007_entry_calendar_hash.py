@@ -0,0 +1,20 @@
+"""Add the calendar_content_hash and calendar_etag columns of journal entries."""
+from sqlalchemy import inspect, text
+
+NEW_COLUMNS = {
+    "calendar_content_hash": "VARCHAR(64)",
+    "calendar_etag": "VARCHAR(255)",
+}
+
+
+def upgrade(connection) -> None:
+    """
+    Add the columns, if needed; existing entries are PUT once more on their next sync.
+
+    Args:
+        connection: SQLAlchemy connection inside a transaction
+    """
+    existing = {column["name"] for column in inspect(connection).get_columns("journal_entries")}
+    for name, column_type in NEW_COLUMNS.items():
+        if name not in existing:
+            connection.execute(text(f"ALTER TABLE journal_entries ADD COLUMN {name} {column_type}"))
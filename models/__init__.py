@@ -1,11 +1,27 @@
 """Database models and initialization."""
 from flask_sqlalchemy import SQLAlchemy
+from .read_routing import RoutingSession
 
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={"class_": RoutingSession})
 
 from .user import User
 from .journal_entry import JournalEntry
 from .calendar_event import CalendarEvent
+from .calendar_sync_state import CalendarSyncState
+from .sync_job import SyncJob
+from .sync_outbox import SyncOutbox
+from .journal_stats import JournalUserStats, JournalDailyRollup
+from . import search_index  # noqa: F401  registers the FTS5 DDL hook
 
-__all__ = ["db", "User", "JournalEntry", "CalendarEvent"]
+__all__ = [
+    "db",
+    "User",
+    "JournalEntry",
+    "CalendarEvent",
+    "CalendarSyncState",
+    "SyncJob",
+    "SyncOutbox",
+    "JournalUserStats",
+    "JournalDailyRollup",
+]
 
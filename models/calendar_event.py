@@ -4,17 +4,40 @@ from . import db
 
 
 class CalendarEvent(db.Model):
-    """Calendar Event model representing a calendar event synced from/to iPhone Calendar."""
+    """Calendar Event model representing a calendar event synced from/to iPhone Calendar.
+
+    Each user's rows mirror the events of the CalDAV calendar as of their
+    last pull, so listings are served locally instead of from the server.
+    """
 
     __tablename__ = "calendar_events"
+    __table_args__ = (
+        # The pull upserts on (user_id, UID): a shared calendar is mirrored
+        # once per user
+        db.Index(
+            "ix_calendar_events_user_external_event",
+            "user_id",
+            "external_event_id",
+            unique=True,
+        ),
+        # Covers the listing order so pages are keyset seeks
+        db.Index(
+            "ix_calendar_events_user_start_id",
+            "user_id",
+            "start_datetime",
+            "id",
+        ),
+        # Deletions reported by sync-collection name the resource, not the UID
+        db.Index("ix_calendar_events_user_href", "user_id", "href"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
-    user_id = db.Column(
-        db.Integer, db.ForeignKey("users.id"), nullable=False, index=True
-    )
-    external_event_id = db.Column(
-        db.String(255), unique=True, nullable=False, index=True
-    )  # CalDAV UID
+    # user_id leads the composite indexes above
+    user_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False)
+    external_event_id = db.Column(db.String(255), nullable=False)  # CalDAV UID
+    # Resource href on the CalDAV server and its ETag at the last pull
+    href = db.Column(db.String(1000), nullable=True)
+    etag = db.Column(db.String(255), nullable=True)
     journal_entry_id = db.Column(
         db.Integer, db.ForeignKey("journal_entries.id"), nullable=True, index=True
     )
@@ -0,0 +1,25 @@
+"""Per-user pull state of a CalDAV calendar."""
+from . import db
+
+
+class CalendarSyncState(db.Model):
+    """Where a user's last pull of a calendar collection left off.
+
+    ctag changes whenever anything in the calendar changes, so comparing it
+    (and the server's current sync-token) tells with one small request
+    whether there is anything to pull; sync_token is the RFC 6578 token
+    the next sync-collection REPORT starts from.
+    """
+
+    __tablename__ = "calendar_sync_state"
+
+    user_id = db.Column(
+        db.Integer, db.ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    calendar_url = db.Column(db.String(500), primary_key=True)
+    ctag = db.Column(db.String(255), nullable=True)
+    sync_token = db.Column(db.String(500), nullable=True)
+    synced_at = db.Column(db.DateTime, nullable=True)
+
+    def __repr__(self):
+        return f"<CalendarSyncState {self.user_id} {self.calendar_url}: {self.sync_token}>"
@@ -1,6 +1,7 @@
 """Journal Entry model for journal entries."""
 from datetime import datetime, date, timezone
 from . import db
+from .partial_index import partial_index
 
 
 class JournalEntry(db.Model):
@@ -8,25 +9,96 @@ class JournalEntry(db.Model):
 
     __tablename__ = "journal_entries"
 
+    # Columns a listing may project with ?fields= ("preview" is computed)
+    LIST_FIELDS = (
+        "id",
+        "title",
+        "content",
+        "date",
+        "calendar_event_id",
+        "sync_status",
+        "completion_status",
+        "created_at",
+        "updated_at",
+        "preview",
+    )
+    # Projection for the default listing view, matching to_dict()
+    FULL_FIELDS = (
+        "id",
+        "title",
+        "content",
+        "date",
+        "calendar_event_id",
+        "sync_status",
+        "completion_status",
+        "created_at",
+        "updated_at",
+    )
+    # Projection for ?view=summary: everything the index page shows, no content
+    SUMMARY_FIELDS = (
+        "id",
+        "title",
+        "date",
+        "sync_status",
+        "completion_status",
+        "created_at",
+        "updated_at",
+        "preview",
+    )
+    # Length of the content preview returned by summary listings
+    PREVIEW_LENGTH = 100
+    __table_args__ = (
+        # Covers the list ordering (date desc, created_at desc, id desc) so
+        # keyset pagination seeks straight to the next page
+        db.Index(
+            "ix_journal_entries_user_date_created_id",
+            "user_id",
+            "date",
+            "created_at",
+            "id",
+        ),
+        # Pending-sync lookups only ever touch the queue, so the index holds
+        # just those rows and shrinks as entries get synced
+        partial_index(
+            "ix_journal_entries_user_pending",
+            "user_id",
+            "id",
+            where="sync_status = 'sync_pending'",
+        ),
+        # Calendar deletions look entries up by (user_id, calendar_event_id)
+        db.Index(
+            "ix_journal_entries_user_calendar_event",
+            "user_id",
+            "calendar_event_id",
+        ),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
-    user_id = db.Column(
-        db.Integer, db.ForeignKey("users.id"), nullable=False, index=True
-    )  # Indexed for user-based queries (T107)
+    # user_id and date lead the composite indexes above; single-column
+    # indexes on them would only cost writes
+    user_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False)
     title = db.Column(db.String(200), nullable=False)
     content = db.Column(db.Text, nullable=False)
-    date = db.Column(db.Date, nullable=False, index=True)  # Indexed for date-based queries (T107)
+    # active_history keeps the previous date/sync_status on assignment, even
+    # when the attribute was expired, so the daily rollup can move the entry
+    date = db.mapped_column(db.Date, nullable=False, active_history=True)
 
     # Calendar sync fields
-    calendar_event_id = db.Column(db.String(255), nullable=True, index=True)  # Indexed for calendar sync queries (T107)
-    sync_status = db.Column(
+    calendar_event_id = db.Column(db.String(255), nullable=True)
+    sync_status = db.mapped_column(
         db.String(20),
         default="not_synced",
         nullable=False,
-        index=True,
-    )  # 'not_synced', 'synced', 'sync_pending', 'sync_conflict' - Indexed for sync status queries (T107)
+        active_history=True,
+    )  # 'not_synced', 'synced', 'sync_pending', 'sync_conflict'
     completion_status = db.Column(
         db.String(20), nullable=True
     )  # 'not_started', 'in_progress', 'completed', 'cancelled'
+    # SHA-256 of the event last PUT to the calendar and the ETag the server
+    # gave it: re-syncing an entry that renders the same event skips the PUT,
+    # and a changed one only overwrites that version (If-Match)
+    calendar_content_hash = db.Column(db.String(64), nullable=True)
+    calendar_etag = db.Column(db.String(255), nullable=True)
 
     # Timestamps
     created_at = db.Column(
@@ -0,0 +1,233 @@
+"""Per-user journal statistics kept up to date on every flush."""
+from collections import defaultdict
+from datetime import datetime, timezone
+from sqlalchemy import event, func, select, insert, update, delete, inspect, case
+from sqlalchemy.orm import Session
+from . import db
+from .journal_entry import JournalEntry
+
+
+class JournalUserStats(db.Model):
+    """Running entry count and change version for a user.
+
+    change_version increases on every flush that touches one of the user's
+    entries, so it identifies a snapshot of the journal for HTTP caching.
+    """
+
+    __tablename__ = "journal_user_stats"
+
+    user_id = db.Column(
+        db.Integer, db.ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    entry_count = db.Column(db.Integer, default=0, nullable=False)
+    change_version = db.Column(db.BigInteger, default=0, nullable=False)
+    changed_at = db.Column(db.DateTime, nullable=True)
+
+    def __repr__(self):
+        return f"<JournalUserStats {self.user_id}: {self.entry_count}>"
+
+
+class JournalDailyRollup(db.Model):
+    """Entry count and sync-status breakdown for a user on a single date."""
+
+    __tablename__ = "journal_daily_rollup"
+
+    # sync_status value -> counter column
+    STATUS_COLUMNS = {
+        "not_synced": "not_synced_count",
+        "synced": "synced_count",
+        "sync_pending": "sync_pending_count",
+        "sync_conflict": "sync_conflict_count",
+        "sync_error": "sync_error_count",
+    }
+
+    user_id = db.Column(
+        db.Integer, db.ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    date = db.Column(db.Date, primary_key=True)
+    entry_count = db.Column(db.Integer, default=0, nullable=False)
+    not_synced_count = db.Column(db.Integer, default=0, nullable=False)
+    synced_count = db.Column(db.Integer, default=0, nullable=False)
+    sync_pending_count = db.Column(db.Integer, default=0, nullable=False)
+    sync_conflict_count = db.Column(db.Integer, default=0, nullable=False)
+    sync_error_count = db.Column(db.Integer, default=0, nullable=False)
+
+    def __repr__(self):
+        return f"<JournalDailyRollup {self.user_id} {self.date}: {self.entry_count}>"
+
+
+def rebuild_entry_counts(connection, user_id):
+    """
+    Recompute a user's counters and daily rollup from journal_entries.
+
+    The change version is bumped rather than reset, so a rebuild can never
+    hand out a version a client has already cached.
+
+    Args:
+        connection: Connection to run the statements on
+        user_id: ID of the user whose counters are rebuilt
+    """
+    user_stats = JournalUserStats.__table__
+    rollup = JournalDailyRollup.__table__
+    entries = JournalEntry.__table__
+
+    status_sums = [
+        func.sum(case((entries.c.sync_status == status, 1), else_=0))
+        for status in JournalDailyRollup.STATUS_COLUMNS
+    ]
+    connection.execute(delete(rollup).where(rollup.c.user_id == user_id))
+    connection.execute(
+        insert(rollup).from_select(
+            ["user_id", "date", "entry_count"]
+            + list(JournalDailyRollup.STATUS_COLUMNS.values()),
+            select(entries.c.user_id, entries.c.date, func.count(), *status_sums)
+            .where(entries.c.user_id == user_id)
+            .group_by(entries.c.user_id, entries.c.date),
+        )
+    )
+    total = connection.execute(
+        select(func.count()).select_from(entries).where(entries.c.user_id == user_id)
+    ).scalar()
+    now = datetime.now(timezone.utc)
+    result = connection.execute(
+        update(user_stats)
+        .where(user_stats.c.user_id == user_id)
+        .values(
+            entry_count=total,
+            change_version=user_stats.c.change_version + 1,
+            changed_at=now,
+        )
+    )
+    if result.rowcount == 0:
+        connection.execute(
+            insert(user_stats).values(
+                user_id=user_id, entry_count=total, change_version=1, changed_at=now
+            )
+        )
+
+
+def _committed_value(obj, key):
+    """Return an attribute's value as it was before the pending flush."""
+    history = inspect(obj).attrs[key].history
+    if history.deleted:
+        return history.deleted[0]
+    if history.unchanged:
+        return history.unchanged[0]
+    return getattr(obj, key)
+
+
+def _rollup_key(obj, committed=False):
+    """Return the (user_id, date, sync_status) an entry is counted under."""
+    if committed:
+        return tuple(
+            _committed_value(obj, key) for key in ("user_id", "date", "sync_status")
+        )
+    return obj.user_id, obj.date, obj.sync_status
+
+
+def _apply_rollup_delta(connection, user_id, entry_date, status_deltas):
+    """Add per-status deltas to one rollup row, creating it when missing."""
+    rollup = JournalDailyRollup.__table__
+    values = {"entry_count": sum(status_deltas.values())}
+    for status, delta in status_deltas.items():
+        column = JournalDailyRollup.STATUS_COLUMNS.get(status)
+        if column:
+            values[column] = delta
+
+    result = connection.execute(
+        update(rollup)
+        .where(rollup.c.user_id == user_id, rollup.c.date == entry_date)
+        .values({column: rollup.c[column] + delta for column, delta in values.items()})
+    )
+    if result.rowcount == 0 and values["entry_count"] > 0:
+        connection.execute(
+            insert(rollup).values(user_id=user_id, date=entry_date, **values)
+        )
+
+
+@event.listens_for(Session, "after_flush")
+def _track_entry_changes(session, flush_context):
+    """Apply rollup deltas and version bumps of a flush in the same transaction."""
+    deltas = defaultdict(int)
+    touched_users = set()
+
+    for obj in session.new:
+        if isinstance(obj, JournalEntry):
+            # Column defaults are applied by the flush, so this is populated
+            deltas[_rollup_key(obj)] += 1
+            touched_users.add(obj.user_id)
+
+    for obj in session.deleted:
+        if isinstance(obj, JournalEntry):
+            key = _rollup_key(obj, committed=True)
+            deltas[key] -= 1
+            touched_users.add(key[0])
+
+    for obj in session.dirty:
+        if isinstance(obj, JournalEntry) and session.is_modified(obj):
+            old_key = _rollup_key(obj, committed=True)
+            new_key = _rollup_key(obj)
+            if old_key != new_key:
+                deltas[old_key] -= 1
+                deltas[new_key] += 1
+            touched_users.update((old_key[0], new_key[0]))
+
+    if touched_users:
+        apply_entry_deltas(session.connection(), deltas, touched_users)
+
+
+def apply_entry_deltas(connection, deltas, touched_users=None):
+    """
+    Apply entry-count deltas to the counters, rollup and change versions.
+
+    Used by the flush listener, and directly by code that writes
+    journal_entries with Core statements the listener cannot see.
+
+    Args:
+        connection: Connection of the transaction that made the changes
+        deltas: Mapping of (user_id, date, sync_status) to a count delta
+        touched_users: Users whose change version is bumped (defaults to
+            the users in deltas)
+    """
+    if touched_users is None:
+        touched_users = {user_id for user_id, _, _ in deltas}
+    user_stats = JournalUserStats.__table__
+    rollup = JournalDailyRollup.__table__
+    now = datetime.now(timezone.utc)
+
+    # user_id -> date -> sync_status -> delta
+    by_user = defaultdict(lambda: defaultdict(dict))
+    for (user_id, entry_date, status), delta in deltas.items():
+        if delta:
+            by_user[user_id][entry_date][status] = delta
+
+    for user_id in touched_users:
+        date_deltas = by_user.get(user_id, {})
+        tracked = connection.execute(
+            select(user_stats.c.user_id).where(user_stats.c.user_id == user_id)
+        ).first()
+        if tracked is None:
+            # First write since the counters were introduced: the flushed
+            # rows are already visible, so rebuilding includes this change
+            rebuild_entry_counts(connection, user_id)
+            continue
+
+        total_delta = sum(
+            delta for statuses in date_deltas.values() for delta in statuses.values()
+        )
+        connection.execute(
+            update(user_stats)
+            .where(user_stats.c.user_id == user_id)
+            .values(
+                entry_count=user_stats.c.entry_count + total_delta,
+                change_version=user_stats.c.change_version + 1,
+                changed_at=now,
+            )
+        )
+        if not date_deltas:
+            continue
+        for entry_date, status_deltas in date_deltas.items():
+            _apply_rollup_delta(connection, user_id, entry_date, status_deltas)
+        connection.execute(
+            delete(rollup).where(rollup.c.user_id == user_id, rollup.c.entry_count <= 0)
+        )
@@ -0,0 +1,120 @@
+"""Route reads of safe (GET/HEAD) requests to a read-only engine."""
+import logging
+from flask import g, has_request_context, request
+from flask_sqlalchemy.session import Session as FlaskSession
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+
+logger = logging.getLogger(__name__)
+
+READER_BIND = "reader"
+
+
+def reads_routed() -> bool:
+    """Return True if the current request reads from the reader engine."""
+    return has_request_context() and g.get("db_read_only", False)
+
+
+class RoutingSession(FlaskSession):
+    """
+    Session that sends statements of read-only requests to the reader bind.
+
+    Flushes always go to the writer, so a handler that does write during a
+    read-only request still works, just without the separate pool.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and not self._flushing and reads_routed():
+            reader = self._db.engines.get(READER_BIND)
+            if reader is not None:
+                return reader
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+def reader_database_uri(app):
+    """
+    Derive the read-only database URI for an app.
+
+    DATABASE_READ_URL wins when set. Otherwise a file-backed SQLite database
+    is reopened with mode=ro; in-memory and other databases get no reader.
+
+    Args:
+        app: Flask application instance
+
+    Returns:
+        URI string, or None if reads should stay on the writer
+    """
+    if app.config.get("DATABASE_READ_URL"):
+        return app.config["DATABASE_READ_URL"]
+
+    url = make_url(app.config["SQLALCHEMY_DATABASE_URI"])
+    if url.drivername not in ("sqlite", "sqlite+pysqlite"):
+        return None
+    if url.database in (None, "", ":memory:") or url.query.get("uri"):
+        return None
+    # Relative paths are resolved against the instance folder like the writer's
+    return url.set(
+        database=f"file:{url.database}",
+        query={**url.query, "mode": "ro", "uri": "true"},
+    ).render_as_string(hide_password=False)
+
+
+def configure_reader_bind(app):
+    """
+    Add the reader bind to SQLALCHEMY_BINDS; call before db.init_app.
+
+    Args:
+        app: Flask application instance
+    """
+    if not app.config.get("DB_READER_ENABLED", True):
+        return
+    uri = reader_database_uri(app)
+    if uri is None:
+        return
+    options = {**app.config.get("SQLALCHEMY_ENGINE_OPTIONS", {}), "url": uri}
+    options["pool_size"] = app.config.get("DB_READER_POOL_SIZE", options.get("pool_size", 5))
+    app.config["SQLALCHEMY_BINDS"] = {**app.config.get("SQLALCHEMY_BINDS", {}), READER_BIND: options}
+
+
+def init_read_routing(app, db):
+    """
+    Make reader connections query-only; call after db.init_app.
+
+    db.init_app registers an empty MetaData for every bind on the shared
+    extension. No model lives on the reader, and left in place the entry
+    would make db.create_all() of any later app without a reader fail
+    with UnboundExecutionError, so it is removed again.
+
+    Args:
+        app: Flask application instance
+        db: Flask-SQLAlchemy extension bound to the app
+    """
+    metadata = db.metadatas.get(READER_BIND)
+    if metadata is not None and not metadata.tables:
+        del db.metadatas[READER_BIND]
+
+    with app.app_context():
+        reader = db.engines.get(READER_BIND)
+    if reader is None or reader.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(reader, "connect")
+    def _query_only(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA query_only=ON")
+        cursor.close()
+
+    logger.info(f"Routing read-only requests to {reader.url}")
+
+
+def route_safe_methods_to_reader(blueprint):
+    """
+    Route database reads of a blueprint's GET/HEAD handlers to the reader.
+
+    Args:
+        blueprint: Blueprint whose safe-method requests only read
+    """
+
+    @blueprint.before_request
+    def _use_reader():
+        g.db_read_only = request.method in ("GET", "HEAD")
@@ -0,0 +1,99 @@
+"""SQLite FTS5 index over journal entry titles and content."""
+import sqlite3
+from flask import current_app, has_app_context
+from sqlalchemy import event, text
+from .journal_entry import JournalEntry
+
+FTS_TABLE = "journal_entries_fts"
+
+# trigram (SQLite 3.34+) matches substrings, which also works for CJK text
+# that unicode61 cannot split into words
+DEFAULT_TOKENIZER = (
+    "trigram" if sqlite3.sqlite_version_info >= (3, 34, 0) else "unicode61"
+)
+
+_TRIGGERS = (
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON journal_entries
+    BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, content)
+        VALUES (new.id, new.title, new.content);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON journal_entries
+    BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, content)
+        VALUES ('delete', old.id, old.title, old.content);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au
+    AFTER UPDATE OF title, content ON journal_entries
+    BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, content)
+        VALUES ('delete', old.id, old.title, old.content);
+        INSERT INTO {FTS_TABLE}(rowid, title, content)
+        VALUES (new.id, new.title, new.content);
+    END
+    """,
+)
+
+
+def configured_tokenizer():
+    """Return the FTS5 tokenizer from SEARCH_TOKENIZER, or the default."""
+    if has_app_context():
+        return current_app.config.get("SEARCH_TOKENIZER") or DEFAULT_TOKENIZER
+    return DEFAULT_TOKENIZER
+
+
+def create_search_index(connection, tokenizer=None):
+    """
+    Create the FTS5 table and the triggers that keep it in sync.
+
+    Safe to run repeatedly; existing objects are left alone.
+
+    Args:
+        connection: SQLite connection to run the DDL on
+        tokenizer: FTS5 tokenizer spec (defaults to configured_tokenizer())
+    """
+    tokenizer = tokenizer or configured_tokenizer()
+    connection.execute(
+        text(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+            f"title, content, content='journal_entries', content_rowid='id', "
+            f"tokenize='{tokenizer}')"
+        )
+    )
+    for trigger in _TRIGGERS:
+        connection.execute(text(trigger))
+
+
+def rebuild_search_index(connection):
+    """
+    Re-read every journal entry into the FTS5 index.
+
+    Args:
+        connection: SQLite connection to run the rebuild on
+    """
+    connection.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"))
+
+
+def search_index_exists(connection):
+    """Return True if the FTS5 table is present in the database."""
+    if connection.dialect.name != "sqlite":
+        return False
+    return (
+        connection.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {"name": FTS_TABLE},
+        ).first()
+        is not None
+    )
+
+
+@event.listens_for(JournalEntry.__table__, "after_create")
+def _create_search_index(target, connection, **kw):
+    """Create the search index alongside journal_entries on SQLite."""
+    if connection.dialect.name == "sqlite":
+        create_search_index(connection)
@@ -0,0 +1,136 @@
+"""Background calendar sync jobs."""
+from datetime import datetime, timedelta, timezone
+from flask import current_app, has_app_context
+from sqlalchemy import insert, select, update
+from . import db
+from .partial_index import partial_index
+from .user import User
+
+
+class SyncJob(db.Model):
+    """A calendar sync requested over HTTP and run by `flask sync-worker`.
+
+    Jobs move from queued to running when a worker claims them, and end as
+    succeeded or failed; a failed attempt that is worth retrying goes back
+    to queued with run_at pushed out by the backoff.
+    """
+
+    __tablename__ = "sync_jobs"
+    __table_args__ = (
+        # Workers claim the oldest due job, after counting the running ones
+        # and checking their users (a partial index could only be scanned)
+        db.Index("ix_sync_jobs_status_run_at", "status", "run_at", "id"),
+        # Enqueueing reuses a user's identical job that is still waiting
+        partial_index(
+            "ix_sync_jobs_queued_user_kind",
+            "user_id",
+            "kind",
+            where="status = 'queued'",
+        ),
+        # Stale leases of crashed workers are found by locked_at
+        partial_index(
+            "ix_sync_jobs_running_locked_at",
+            "locked_at",
+            where="status = 'running'",
+        ),
+    )
+
+    # kind values and what their payload holds
+    KIND_SYNC_ALL = "sync_all"  # {"entry_ids": [...] or null}
+    KIND_SYNC_ENTRY = "sync_entry"  # {"entry_id": n}
+    KIND_AUTO_SYNC = "auto_sync"  # null; pushes queued changes only
+
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(
+        db.Integer, db.ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    kind = db.Column(db.String(20), nullable=False)
+    payload = db.Column(db.JSON, nullable=True)
+    status = db.Column(
+        db.String(20), default="queued", nullable=False
+    )  # 'queued', 'running', 'succeeded', 'failed'
+    attempts = db.Column(db.Integer, default=0, nullable=False)
+    max_attempts = db.Column(db.Integer, nullable=False)
+    run_at = db.Column(
+        db.DateTime, default=lambda: datetime.now(timezone.utc), nullable=False
+    )
+    locked_by = db.Column(db.String(100), nullable=True)
+    locked_at = db.Column(db.DateTime, nullable=True)
+    result = db.Column(db.JSON, nullable=True)
+    last_error = db.Column(db.Text, nullable=True)
+    created_at = db.Column(
+        db.DateTime, default=lambda: datetime.now(timezone.utc), nullable=False
+    )
+    finished_at = db.Column(db.DateTime, nullable=True)
+
+    def to_dict(self):
+        """Convert sync job to dictionary."""
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "attempts": self.attempts,
+            "max_attempts": self.max_attempts,
+            "run_at": self.run_at.isoformat() if self.run_at else None,
+            "result": self.result,
+            "error": self.last_error,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+        }
+
+    def __repr__(self):
+        return f"<SyncJob {self.id} {self.kind}: {self.status}>"
+
+
+def schedule_auto_sync(connection, user_ids) -> None:
+    """
+    Debounce a push of journal changes for users in automatic sync mode.
+
+    Each such user has at most one queued auto_sync job. Every write moves
+    it to AUTO_SYNC_DELAY seconds from now, but never past
+    AUTO_SYNC_MAX_DELAY seconds after it was queued, so a burst of edits
+    (autosave) is pushed once and a steady stream of them still syncs.
+
+    Args:
+        connection: Connection of the transaction that wrote the changes
+        user_ids: Users whose journals changed
+    """
+    if not user_ids or not has_app_context():
+        return
+    config = current_app.config
+    automatic = connection.execute(
+        select(User.id).where(User.id.in_(user_ids), User.calendar_sync_mode == "automatic")
+    ).scalars().all()
+    if not automatic:
+        return
+
+    jobs = SyncJob.__table__
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    run_at = now + timedelta(seconds=config.get("AUTO_SYNC_DELAY", 10))
+    max_delay = timedelta(seconds=config.get("AUTO_SYNC_MAX_DELAY", 120))
+    queued = connection.execute(
+        select(jobs.c.id, jobs.c.user_id, jobs.c.created_at).where(
+            jobs.c.user_id.in_(automatic),
+            jobs.c.kind == SyncJob.KIND_AUTO_SYNC,
+            jobs.c.status == "queued",
+        )
+    ).all()
+    for job in queued:
+        connection.execute(
+            update(jobs).where(jobs.c.id == job.id).values(run_at=min(run_at, job.created_at + max_delay))
+        )
+
+    waiting = {job.user_id for job in queued}
+    new_jobs = [
+        {
+            "user_id": user_id,
+            "kind": SyncJob.KIND_AUTO_SYNC,
+            "max_attempts": config.get("SYNC_JOB_MAX_ATTEMPTS", 5),
+            "run_at": run_at,
+            "created_at": now,
+        }
+        for user_id in automatic
+        if user_id not in waiting
+    ]
+    if new_jobs:
+        connection.execute(insert(jobs), new_jobs)
@@ -0,0 +1,123 @@
+"""Outbox of journal changes still to be sent to the calendar."""
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from sqlalchemy import event, insert, inspect
+from sqlalchemy.orm import Session
+from . import db
+from .journal_entry import JournalEntry
+from .sync_job import schedule_auto_sync
+
+
+class SyncOutbox(db.Model):
+    """One create, update or delete of a journal entry, in commit order.
+
+    Rows are written by a flush listener in the same transaction as the
+    change, and removed by calendar sync once the change reached the
+    calendar. A delete row keeps the UID of the deleted entry's event.
+    """
+
+    __tablename__ = "sync_outbox"
+    __table_args__ = (
+        # Sync reads a user's changes in the order they were made
+        db.Index("ix_sync_outbox_user_id", "user_id", "id"),
+        # A single-entry sync consumes that entry's rows
+        db.Index("ix_sync_outbox_entry_id", "entry_id"),
+    )
+
+    OP_CREATE = "create"
+    OP_UPDATE = "update"
+    OP_DELETE = "delete"
+
+    # Entry fields that reach the calendar event; other changes (sync
+    # status, timestamps) are not recorded
+    SYNCED_FIELDS = ("title", "content", "date", "completion_status")
+
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(
+        db.Integer, db.ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    # No foreign key: delete rows outlive their entry
+    entry_id = db.Column(db.Integer, nullable=False)
+    op = db.Column(db.String(10), nullable=False)
+    calendar_event_id = db.Column(db.String(255), nullable=True)
+    created_at = db.Column(
+        db.DateTime, default=lambda: datetime.now(timezone.utc), nullable=False
+    )
+
+    def __repr__(self):
+        return f"<SyncOutbox {self.id} {self.op} entry {self.entry_id}>"
+
+
+@contextmanager
+def calendar_origin(session):
+    """
+    Keep journal changes flushed inside the block out of the outbox.
+
+    For changes that came from the calendar, which must not be sent back.
+
+    Args:
+        session: Session the changes are flushed on
+    """
+    session.info["calendar_origin"] = session.info.get("calendar_origin", 0) + 1
+    try:
+        yield
+    finally:
+        session.info["calendar_origin"] -= 1
+
+
+def record_entry_changes(connection, changes):
+    """
+    Add outbox rows for journal entry changes.
+
+    Used by the flush listener, and directly by code that writes
+    journal_entries with Core statements the listener cannot see. Users in
+    automatic sync mode get their push scheduled (see schedule_auto_sync).
+
+    Args:
+        connection: Connection of the transaction that made the changes
+        changes: Dicts with user_id, entry_id, op and, for deletes,
+            calendar_event_id
+    """
+    if not changes:
+        return
+    now = datetime.now(timezone.utc)
+    connection.execute(
+        insert(SyncOutbox.__table__),
+        [{"calendar_event_id": None, "created_at": now, **change} for change in changes],
+    )
+    schedule_auto_sync(connection, {change["user_id"] for change in changes})
+
+
+def _synced_fields_changed(obj):
+    state = inspect(obj)
+    return any(state.attrs[key].history.has_changes() for key in SyncOutbox.SYNCED_FIELDS)
+
+
+@event.listens_for(Session, "after_flush")
+def _record_outbox_changes(session, flush_context):
+    """Record the flush's journal entry changes in the outbox, in the same transaction."""
+    if session.info.get("calendar_origin"):
+        return
+    changes = []
+    for obj in session.new:
+        if isinstance(obj, JournalEntry):
+            changes.append({"user_id": obj.user_id, "entry_id": obj.id, "op": SyncOutbox.OP_CREATE})
+
+    for obj in session.dirty:
+        if isinstance(obj, JournalEntry) and session.is_modified(obj) and _synced_fields_changed(obj):
+            changes.append({"user_id": obj.user_id, "entry_id": obj.id, "op": SyncOutbox.OP_UPDATE})
+
+    for obj in session.deleted:
+        if isinstance(obj, JournalEntry):
+            changes.append(
+                {
+                    "user_id": obj.user_id,
+                    "entry_id": obj.id,
+                    "op": SyncOutbox.OP_DELETE,
+                    "calendar_event_id": obj.calendar_event_id,
+                }
+            )
+
+    if changes:
+        # Ascending ids keep the outbox in the order the flush saw the changes
+        record_entry_changes(session.connection(), changes)
@@ -2,7 +2,9 @@
 import logging
 from flask import session
 from flask_login import login_user, logout_user, current_user
-from models import db, User
+from sqlalchemy import select
+from models import db, User, SyncOutbox
+from models.sync_job import schedule_auto_sync
 
 logger = logging.getLogger(__name__)
 
@@ -104,3 +106,38 @@ class AuthService:
         db.session.commit()
         logger.info(f"User {username} created successfully")
         return user
+
+    @staticmethod
+    def update_sync_settings(user_id, calendar_sync_enabled=None, calendar_sync_mode=None):
+        """
+        Update a user's calendar sync preferences.
+
+        Switching to automatic mode schedules a push of any journal changes
+        still waiting in the outbox.
+
+        Args:
+            user_id: ID of the user
+            calendar_sync_enabled: New value, or None to keep the current one
+            calendar_sync_mode: 'automatic', 'manual', or None to keep it
+
+        Returns:
+            Updated User object, or None if the user does not exist
+        """
+        user = db.session.get(User, user_id)
+        if user is None:
+            return None
+        if calendar_sync_enabled is not None:
+            user.calendar_sync_enabled = calendar_sync_enabled
+        if calendar_sync_mode is not None:
+            user.calendar_sync_mode = calendar_sync_mode
+        db.session.flush()
+
+        if calendar_sync_mode == "automatic":
+            waiting = db.session.scalar(
+                select(SyncOutbox.id).where(SyncOutbox.user_id == user_id).limit(1)
+            )
+            if waiting is not None:
+                schedule_auto_sync(db.session.connection(), {user_id})
+        db.session.commit()
+        logger.info(f"User {user_id} sync settings updated: mode={user.calendar_sync_mode}")
+        return user
@@ -1,13 +1,42 @@
 """CalDAV service for bidirectional calendar synchronization."""
+import hashlib
 import logging
+import posixpath
+import time
 from datetime import datetime, date, timedelta, timezone
-from typing import Optional, List, Dict
-from models import db, JournalEntry, User, CalendarEvent
+from typing import NamedTuple, Optional, List, Dict, Tuple
+from urllib.parse import unquote
+from flask import current_app
+from sqlalchemy import delete, select, tuple_
+from models import db, JournalEntry, User, CalendarEvent, CalendarSyncState, SyncOutbox
+from models.sync_outbox import calendar_origin, record_entry_changes
+from services.caldav_transport import (
+    CalDAVTransportError,
+    PreconditionFailedError,
+    RequestTimeoutError,
+    SyncTokenExpiredError,
+    get_transport,
+)
+from services.connectivity import get_health_tracker
 from services.ics_generator import ICSGenerator
+from services.journal_service import IN_CLAUSE_CHUNK_SIZE, JournalService
+from utils.pagination import decode_event_cursor, encode_event_cursor
 
 logger = logging.getLogger(__name__)
 
 
+class PendingChange(NamedTuple):
+    """The queued outbox changes of one entry, coalesced into what to send."""
+
+    entry_id: int
+    # PUT the entry's current state
+    upsert: bool
+    # DELETE this event (of a deleted entry whose id was not reused)
+    delete_uid: Optional[str]
+    # Outbox rows consumed once the change reached the calendar
+    outbox_ids: List[int]
+
+
 class CalDAVService:
     """Service for handling CalDAV calendar synchronization."""
 
@@ -24,49 +53,202 @@ class CalDAVService:
         """
         try:
             # Check if offline (FR-023)
+            queued = CalDAVService._queued_outbox_ids(entry.id)
             if CalDAVService.is_offline():
                 logger.warning(f"Device is offline, cannot sync entry {entry.id}")
-                entry.sync_status = "sync_pending"
-                db.session.commit()
+                CalDAVService._keep_queued(entry, queued, "sync_pending")
                 return False
 
-            # Generate iCalendar event from journal entry
-            event = ICSGenerator.generate_event_from_entry(entry)
-            calendar = ICSGenerator.generate_calendar_from_entries([entry])
-
-            # TODO: Implement actual CalDAV PUT request to sync to calendar
-            # For now, mark as synced (simulated sync)
-            # In production, this would make actual CalDAV PUT request to iPhone Calendar
-            entry.sync_status = "synced"
-            entry.calendar_event_id = event.uid
+            event_uid = CalDAVService._push_entry(entry)
+            CalDAVService._consume_outbox(queued)
             db.session.commit()
 
-            logger.info(f"Synced journal entry {entry.id} to calendar (event ID: {event.uid})")
+            logger.info(f"Synced journal entry {entry.id} to calendar (event ID: {event_uid})")
             return True
+        except PreconditionFailedError as e:
+            logger.warning(f"Not syncing entry {entry.id}: {str(e)}")
+            db.session.rollback()
+            CalDAVService._keep_queued(entry, queued, "sync_conflict")
+            return False
+        except RequestTimeoutError as e:
+            logger.error(f"Error syncing entry {entry.id} to calendar: {str(e)}")
+            db.session.rollback()
+            CalDAVService._forget_etag(entry)
+            CalDAVService._keep_queued(entry, queued, "sync_pending")
+            return False
         except Exception as e:
-            error_msg = str(e).lower()
-            # Handle calendar full or permission restrictions (T068)
-            if "full" in error_msg or "quota" in error_msg or "space" in error_msg:
-                logger.error(
-                    f"Calendar is full or has quota restrictions for entry {entry.id}: {str(e)}"
-                )
-                entry.sync_status = "sync_error"
-                db.session.commit()
-                raise ValueError("Calendar is full. Please free up space and try again.")
-            elif "permission" in error_msg or "unauthorized" in error_msg or "forbidden" in error_msg:
-                logger.error(
-                    f"Permission denied for calendar sync of entry {entry.id}: {str(e)}"
-                )
+            message = CalDAVService._fatal_sync_error(entry.id, e)
+            if message:
                 entry.sync_status = "sync_error"
                 db.session.commit()
-                raise ValueError("Calendar permission denied. Please grant permissions and try again.")
-            else:
-                logger.error(
-                    f"Error syncing entry {entry.id} to calendar: {str(e)}", exc_info=True
-                )
-                entry.sync_status = "sync_pending"
-                db.session.rollback()
-                return False
+                raise ValueError(message)
+            logger.error(
+                f"Error syncing entry {entry.id} to calendar: {str(e)}", exc_info=True
+            )
+            entry.sync_status = "sync_pending"
+            db.session.rollback()
+            return False
+
+    @staticmethod
+    def _keep_queued(entry: JournalEntry, queued: List[int], sync_status: str) -> None:
+        """Leave an entry that was not pushed for the next sync of pending changes, and commit."""
+        entry.sync_status = sync_status
+        if not queued:
+            record_entry_changes(
+                db.session.connection(),
+                [{"user_id": entry.user_id, "entry_id": entry.id, "op": SyncOutbox.OP_UPDATE}],
+            )
+        db.session.commit()
+
+    @staticmethod
+    def _push_entry(entry: JournalEntry) -> str:
+        """
+        Send an entry to the calendar and mark it synced, without committing.
+
+        The PUT is skipped when the calendar already holds the event the
+        entry renders to (see _unchanged_on_calendar).
+
+        Args:
+            entry: JournalEntry to push
+
+        Returns:
+            UID of the calendar event
+
+        Raises:
+            PreconditionFailedError: If the event was changed on the calendar
+                since this app last wrote it
+        """
+        uid, ics = CalDAVService._render_entry(entry)
+        content_hash = CalDAVService._content_hash(ics)
+
+        # Without a configured server the sync is simulated
+        transport = get_transport()
+        if transport is None:
+            CalDAVService._mark_synced(entry, uid)
+            return uid
+        if CalDAVService._unchanged_on_calendar(entry, uid, content_hash):
+            logger.debug(f"Calendar event of entry {entry.id} is unchanged, not sending it")
+            CalDAVService._mark_synced(entry, uid, content_hash, entry.calendar_etag)
+            return uid
+
+        tracker = get_health_tracker()
+        try:
+            etag = transport.put_event(uid, ics, CalDAVService._if_match(entry, uid))
+        except Exception as e:
+            CalDAVService._record_error(tracker, transport.server_url, e)
+            raise
+        if tracker is not None:
+            tracker.record_success(transport.server_url)
+
+        CalDAVService._mark_synced(entry, uid, content_hash, etag)
+        return uid
+
+    @staticmethod
+    def _render_entry(entry: JournalEntry) -> Tuple[str, str]:
+        """
+        Generate the calendar event of an entry.
+
+        Args:
+            entry: JournalEntry to render
+
+        Returns:
+            Tuple of (event UID, VCALENDAR text holding the event)
+        """
+        from ics import Calendar
+
+        event = ICSGenerator.generate_event_from_entry(entry)
+        calendar = Calendar()
+        calendar.events.add(event)
+        return event.uid, calendar.serialize()
+
+    @staticmethod
+    def _content_hash(ics: str) -> str:
+        """
+        Hash a rendered event.
+
+        The rendering carries no DTSTAMP or other render-time values, so
+        the hash only changes when something that reaches the calendar
+        does; edits lost to the title and description truncation do not.
+        """
+        return hashlib.sha256(ics.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _unchanged_on_calendar(entry: JournalEntry, uid: str, content_hash: str) -> bool:
+        """Whether the calendar holds exactly this rendering of the entry, as last PUT."""
+        return entry.calendar_event_id == uid and entry.calendar_content_hash == content_hash
+
+    @staticmethod
+    def _if_match(entry: JournalEntry, uid: str) -> Optional[str]:
+        """ETag a PUT of the entry's event must match, if this app wrote the event before."""
+        return entry.calendar_etag if entry.calendar_event_id == uid else None
+
+    @staticmethod
+    def _forget_etag(entry: JournalEntry) -> None:
+        """
+        Drop the stored ETag after a PUT timed out.
+
+        The server may have stored the event after the client gave up, so
+        the ETag no longer names the current version; keeping it would make
+        the next If-Match PUT fail on this app's own write as a conflict.
+        """
+        entry.calendar_etag = None
+
+    @staticmethod
+    def _mark_synced(
+        entry: JournalEntry,
+        uid: str,
+        content_hash: Optional[str] = None,
+        etag: Optional[str] = None,
+    ) -> None:
+        entry.sync_status = "synced"
+        entry.calendar_event_id = uid
+        entry.calendar_content_hash = content_hash
+        entry.calendar_etag = etag
+
+    @staticmethod
+    def _record_error(tracker, server_url: str, error: Exception) -> None:
+        """
+        Report a failed CalDAV call to the health tracker.
+
+        Only an unreachable or failing server (no response, a timeout, a
+        5xx) counts against its circuit breaker. A request the server
+        answered and refused (412, 401/403, 507 for a full calendar)
+        shows it is up, and retrying sooner would not help.
+        """
+        if tracker is None:
+            return
+        status = error.status if isinstance(error, CalDAVTransportError) else None
+        if status is None or (status >= 500 and status != 507):
+            tracker.record_failure(server_url)
+        else:
+            tracker.record_success(server_url)
+
+    @staticmethod
+    def _fatal_sync_error(entry_id: int, error: Exception) -> Optional[str]:
+        """
+        Classify a sync error that retrying cannot fix (T068).
+
+        Args:
+            entry_id: ID of the JournalEntry whose sync failed
+            error: Exception raised by the sync
+
+        Returns:
+            User-facing message for a full calendar or missing permission,
+            None for errors worth retrying
+        """
+        error_msg = str(error).lower()
+        # Handle calendar full or permission restrictions (T068)
+        if "full" in error_msg or "quota" in error_msg or "space" in error_msg:
+            logger.error(
+                f"Calendar is full or has quota restrictions for entry {entry_id}: {str(error)}"
+            )
+            return "Calendar is full. Please free up space and try again."
+        if "permission" in error_msg or "unauthorized" in error_msg or "forbidden" in error_msg:
+            logger.error(
+                f"Permission denied for calendar sync of entry {entry_id}: {str(error)}"
+            )
+            return "Calendar permission denied. Please grant permissions and try again."
+        return None
 
     @staticmethod
     def sync_calendar_to_entry(
@@ -77,22 +259,357 @@ class CalDAVService:
 
         Args:
             user_id: ID of the user
-            calendar_event_data: Dictionary containing calendar event data
+            calendar_event_data: Dictionary containing calendar event data,
+                as returned by ICSGenerator.parse_events
 
         Returns:
-            Created or updated JournalEntry if successful, None otherwise
+            Updated JournalEntry if the event is linked to one and is newer
+            (FR-018), None otherwise
         """
         try:
-            # TODO: Parse calendar event data and create/update journal entry
-            # For now, return None as placeholder
-            logger.info(f"Syncing calendar event to journal entry for user {user_id}")
-            return None
+            uid = calendar_event_data.get("uid")
+            entry = CalDAVService._linked_entries(user_id, [uid]).get(uid) if uid else None
+            with calendar_origin(db.session):
+                if entry is None or not CalDAVService._apply_remote_event(entry, calendar_event_data):
+                    return None
+                db.session.commit()
+            logger.info(f"Synced calendar event to journal entry {entry.id} for user {user_id}")
+            return entry
         except Exception as e:
             logger.error(
                 f"Error syncing calendar event to entry: {str(e)}", exc_info=True
             )
+            db.session.rollback()
             return None
 
+    @staticmethod
+    def _linked_entries(user_id: int, uids: List[str]) -> Dict[str, JournalEntry]:
+        """
+        Load the user's journal entries linked to calendar events, in one query.
+
+        Args:
+            user_id: ID of the user
+            uids: Calendar event UIDs
+
+        Returns:
+            Dictionary of event UID to JournalEntry, for UIDs that have one
+        """
+        if not uids:
+            return {}
+        entries = db.session.scalars(
+            select(JournalEntry).where(
+                JournalEntry.user_id == user_id, JournalEntry.calendar_event_id.in_(uids)
+            )
+        )
+        return {entry.calendar_event_id: entry for entry in entries}
+
+    @staticmethod
+    def _apply_remote_event(entry: JournalEntry, data: Dict) -> bool:
+        """
+        Update a journal entry from its calendar event, without committing.
+
+        Only fields that differ from what the entry itself renders to are
+        taken, so a title-only edit on the iPhone does not replace long
+        content with its truncated event description.
+
+        Args:
+            entry: JournalEntry linked to the event
+            data: Calendar event data
+
+        Returns:
+            True if the entry was changed
+        """
+        # Last-write-wins (FR-018): local edits newer than the event stay
+        if not CalDAVService.detect_conflict(entry, data):
+            return False
+
+        changes = {}
+        title = data.get("title")
+        if title is not None and title != ICSGenerator.event_title(entry.title):
+            changes["title"] = title
+        description = data.get("description")
+        if description is not None and description != ICSGenerator.event_description(entry.content):
+            changes["content"] = description
+        completion_status = data.get("completion_status")
+        if completion_status is not None and completion_status != entry.completion_status:
+            changes["completion_status"] = completion_status
+        if not changes:
+            return False
+
+        for field, value in changes.items():
+            setattr(entry, field, value)
+        entry.sync_status = "synced"
+        entry.updated_at = datetime.now(timezone.utc)
+        return True
+
+    @staticmethod
+    def pull_calendar_changes(user_id: int) -> Dict[str, any]:
+        """
+        Mirror calendar changes locally and apply them to linked entries (iPhone to web).
+
+        A Depth 0 PROPFIND reads the calendar's CTag and sync-token; if
+        both match the user's CalendarSyncState nothing changed and the
+        pull ends after that one request, whatever the calendar size.
+        Otherwise a sync-collection REPORT (RFC 6578) from the stored token
+        lists the changed and deleted hrefs. Changed events are fetched with
+        calendar-multiget REPORTs of CALDAV_MULTIGET_BATCH_SIZE, parsed as
+        the response streams in, upserted into the user's CalendarEvent
+        mirror with one statement per batch and applied to linked entries;
+        each batch is committed on its own. Servers without sync-tokens get
+        a full listing once their CTag changes, as does a user whose token
+        has expired; the listing is diffed against the mirror, so only new
+        or re-tagged hrefs are fetched and mirrored hrefs missing from it
+        are treated as deleted. The new CTag and token are stored last, so
+        an interrupted pull is repeated from the old token.
+
+        Args:
+            user_id: ID of the user
+
+        Returns:
+            Dictionary with 'changed' (events fetched), 'updated' and
+            'deleted' (journal entries) counts, and 'unchanged' (the
+            calendar had not changed since the last pull)
+        """
+        result = {"changed": 0, "updated": 0, "deleted": 0, "unchanged": True}
+        # Without a configured server there is nothing to pull
+        transport = get_transport()
+        if transport is None:
+            return result
+        if CalDAVService.is_offline():
+            logger.warning(f"Device is offline, cannot pull calendar for user {user_id}")
+            return result
+
+        tracker = get_health_tracker()
+        state = db.session.get(CalendarSyncState, (user_id, transport.server_url))
+        if state is None:
+            state = CalendarSyncState(user_id=user_id, calendar_url=transport.server_url)
+        batch_size = current_app.config.get("CALDAV_MULTIGET_BATCH_SIZE", 100)
+        # Entry changes made here came from the calendar; none go back
+        with calendar_origin(db.session):
+            try:
+                ctag, sync_token = transport.get_collection_state()
+                if (ctag or sync_token) and (ctag, sync_token) == (state.ctag, state.sync_token):
+                    return result
+                result["unchanged"] = False
+
+                if sync_token:
+                    try:
+                        changes = transport.sync_collection(state.sync_token)
+                        changed = [href for href, _ in changes.changed]
+                        deleted = changes.deleted
+                    except SyncTokenExpiredError:
+                        logger.info(f"Sync-token expired for user {user_id}, pulling the full calendar")
+                        changes = transport.sync_collection(None)
+                        changed, deleted = CalDAVService._diff_listing(user_id, changes.changed)
+                    sync_token = changes.sync_token
+                else:
+                    changed, deleted = CalDAVService._diff_listing(user_id, transport.list_events())
+
+                for i in range(0, len(changed), batch_size):
+                    events = {}
+                    for href, etag, ics in transport.iter_multiget(changed[i : i + batch_size]):
+                        result["changed"] += 1
+                        for data in ICSGenerator.parse_events(ics):
+                            # Recurrence overrides share the master's UID
+                            if data["uid"] and data["uid"] not in events:
+                                events[data["uid"]] = {**data, "href": href, "etag": etag}
+                    result["updated"] += CalDAVService._store_remote_events(user_id, list(events.values()))
+                    db.session.commit()
+
+                for i in range(0, len(deleted), batch_size):
+                    result["deleted"] += CalDAVService._remove_remote_events(
+                        user_id, deleted[i : i + batch_size]
+                    )
+                    db.session.commit()
+            except CalDAVTransportError as e:
+                logger.error(f"Error pulling calendar for user {user_id}: {str(e)}")
+                db.session.rollback()
+                CalDAVService._record_error(tracker, transport.server_url, e)
+                return result
+
+        if tracker is not None:
+            tracker.record_success(transport.server_url)
+        state.ctag = ctag
+        state.sync_token = sync_token
+        state.synced_at = datetime.now(timezone.utc)
+        db.session.add(state)
+        db.session.commit()
+
+        logger.info(
+            f"Pulled {result['changed']} changed events for user {user_id}: "
+            f"{result['updated']} entries updated, {result['deleted']} deleted"
+        )
+        return result
+
+    @staticmethod
+    def _diff_listing(user_id: int, listing: List[Tuple[str, str]]) -> Tuple[List[str], List[str]]:
+        """
+        Compare a full calendar listing with the user's CalendarEvent mirror.
+
+        Args:
+            user_id: ID of the user
+            listing: (href, etag) of every event on the calendar
+
+        Returns:
+            Tuple of the hrefs that are new or whose etag changed, and the
+            mirrored hrefs no longer on the calendar
+        """
+        mirrored = dict(
+            db.session.execute(
+                select(CalendarEvent.href, CalendarEvent.etag).where(
+                    CalendarEvent.user_id == user_id, CalendarEvent.href.is_not(None)
+                )
+            ).all()
+        )
+        listed = dict(listing)
+        # A listing without etags cannot tell what changed; fetch everything
+        changed = [href for href, etag in listed.items() if etag is None or mirrored.get(href) != etag]
+        deleted = [href for href in mirrored if href not in listed]
+        return changed, deleted
+
+    @staticmethod
+    def _store_remote_events(user_id: int, events: List[Dict]) -> int:
+        """
+        Upsert a batch of pulled events into the mirror and apply them to entries.
+
+        Linked entries are loaded with one query and the mirror rows are
+        written with one INSERT ... ON CONFLICT (user_id, external_event_id)
+        DO UPDATE statement for the whole batch. Nothing is committed.
+
+        Args:
+            user_id: ID of the user
+            events: Calendar event data with href and etag, one per UID
+
+        Returns:
+            Number of journal entries updated
+        """
+        entries = CalDAVService._linked_entries(user_id, [data["uid"] for data in events])
+        updated = 0
+        now = datetime.now(timezone.utc)
+        rows = []
+        for data in events:
+            entry = entries.get(data["uid"])
+            if entry is not None and data["etag"] != entry.calendar_etag:
+                # Changed on the calendar, not by this app's last PUT: the
+                # next push has to send the entry again, over this version
+                entry.calendar_content_hash = None
+                entry.calendar_etag = data["etag"]
+            if entry is not None and CalDAVService._apply_remote_event(entry, data):
+                updated += 1
+            if data["start_datetime"] is None:
+                continue
+            rows.append(
+                {
+                    "user_id": user_id,
+                    "external_event_id": data["uid"],
+                    "href": data["href"],
+                    "etag": data["etag"],
+                    "journal_entry_id": entry.id if entry is not None else None,
+                    "title": (data["title"] or "Untitled")[:200],
+                    "start_datetime": _utc(data["start_datetime"]),
+                    "end_datetime": _utc(data["end_datetime"]),
+                    "description": data["description"],
+                    "completion_status": data["completion_status"],
+                    "sync_direction": "bidirectional" if entry is not None else "iphone_to_web",
+                    "last_synced_at": now,
+                }
+            )
+        if rows:
+            db.session.execute(_upsert_statement(CalendarEvent.__table__, rows[0].keys()), rows)
+        return updated
+
+    @staticmethod
+    def _remove_remote_events(user_id: int, hrefs: List[str]) -> int:
+        """
+        Drop deleted events from the mirror and delete their linked entries (FR-024).
+
+        Args:
+            user_id: ID of the user
+            hrefs: hrefs reported deleted by sync-collection
+
+        Returns:
+            Number of journal entries deleted
+        """
+        uids = set(
+            db.session.scalars(
+                select(CalendarEvent.external_event_id).where(
+                    CalendarEvent.user_id == user_id, CalendarEvent.href.in_(hrefs)
+                )
+            )
+        )
+        # Events pushed by this app are named after their UID, mirrored or not
+        uids.update(CalDAVService._uid_from_href(href) for href in hrefs)
+        entries = CalDAVService._linked_entries(user_id, list(uids))
+        for entry in entries.values():
+            db.session.delete(entry)
+            logger.info(f"Deleted journal entry {entry.id} due to calendar event deletion")
+        db.session.flush()
+        db.session.execute(
+            delete(CalendarEvent).where(
+                CalendarEvent.user_id == user_id, CalendarEvent.href.in_(hrefs)
+            )
+        )
+        return len(entries)
+
+    @staticmethod
+    def list_calendar_events(
+        user_id: int,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> Dict[str, any]:
+        """
+        List mirrored calendar events in start order, one keyset page at a time.
+
+        Reads only the local CalendarEvent mirror kept by
+        pull_calendar_changes; the CalDAV server is not contacted.
+
+        Args:
+            user_id: ID of the user
+            start_date: Only events starting on or after this date
+            end_date: Only events starting on or before this date
+            limit: Maximum number of events to return
+            cursor: Opaque cursor returned as next_cursor by a previous call
+
+        Returns:
+            Dictionary with 'events' (CalendarEvent objects) and 'next_cursor'
+            (None when there are no further events)
+
+        Raises:
+            ValidationError: If the cursor is malformed
+        """
+        stmt = select(CalendarEvent).where(CalendarEvent.user_id == user_id)
+        if start_date:
+            stmt = stmt.where(
+                CalendarEvent.start_datetime >= datetime.combine(start_date, datetime.min.time())
+            )
+        if end_date:
+            stmt = stmt.where(
+                CalendarEvent.start_datetime
+                < datetime.combine(end_date + timedelta(days=1), datetime.min.time())
+            )
+        if cursor:
+            stmt = stmt.where(
+                tuple_(CalendarEvent.start_datetime, CalendarEvent.id)
+                > tuple_(*decode_event_cursor(cursor))
+            )
+        # Fetch one extra row to find out whether another page exists
+        stmt = stmt.order_by(CalendarEvent.start_datetime, CalendarEvent.id).limit(limit + 1)
+        events = db.session.scalars(stmt).all()
+
+        next_cursor = None
+        if len(events) > limit:
+            events = events[:limit]
+            next_cursor = encode_event_cursor(events[-1].start_datetime, events[-1].id)
+        return {"events": events, "next_cursor": next_cursor}
+
+    @staticmethod
+    def _uid_from_href(href: str) -> str:
+        """Return the event UID of a resource named <uid>.ics, as pushed by this app."""
+        name = unquote(posixpath.basename(href.rstrip("/")))
+        return name[: -len(".ics")] if name.endswith(".ics") else name
+
     @staticmethod
     def detect_conflict(entry: JournalEntry, calendar_event_data: Dict) -> bool:
         """
@@ -167,7 +684,8 @@ class CalDAVService:
         try:
             entry.completion_status = completion_status
             entry.sync_status = "synced"
-            db.session.commit()
+            with calendar_origin(db.session):
+                db.session.commit()
 
             logger.info(
                 f"Synced completion status '{completion_status}' for entry {entry.id}"
@@ -191,17 +709,10 @@ class CalDAVService:
             True if entry deleted, False otherwise
         """
         try:
-            entry = JournalEntry.query.filter_by(
-                calendar_event_id=calendar_event_id, user_id=user_id
-            ).first()
-
-            if entry:
-                db.session.delete(entry)
-                db.session.commit()
-                logger.info(
-                    f"Deleted journal entry {entry.id} due to calendar event deletion"
-                )
-                return True
+            with calendar_origin(db.session):
+                if CalDAVService._delete_linked_entry(calendar_event_id, user_id):
+                    db.session.commit()
+                    return True
 
             return False
         except Exception as e:
@@ -211,54 +722,317 @@ class CalDAVService:
             db.session.rollback()
             return False
 
+    @staticmethod
+    def _delete_linked_entry(calendar_event_id: str, user_id: int) -> bool:
+        """Delete the entry linked to a calendar event, without committing."""
+        entry = JournalEntry.query.filter_by(
+            calendar_event_id=calendar_event_id, user_id=user_id
+        ).first()
+        if entry is None:
+            return False
+        db.session.delete(entry)
+        logger.info(f"Deleted journal entry {entry.id} due to calendar event deletion")
+        return True
+
     @staticmethod
     def is_offline() -> bool:
         """
-        Check if device is offline (FR-023).
+        Check if the CalDAV server is unreachable (FR-023).
+
+        Reachability of CALDAV_SERVER_URL comes from the shared health
+        tracker, which probes at most once per CALDAV_HEALTH_TTL and stops
+        probing while the host's circuit breaker is open. Without a
+        configured server there is nothing to reach, so sync is never
+        considered offline.
 
         Returns:
             True if offline, False otherwise
         """
-        # Check network connectivity by attempting to resolve a DNS query
-        # In a web application, we can use navigator.onLine if available
-        # For server-side, we can try a simple network check
-        try:
-            import socket
-            socket.create_connection(("8.8.8.8", 53), timeout=3)
+        server_url = current_app.config.get("CALDAV_SERVER_URL")
+        if not server_url:
             return False
-        except OSError:
-            logger.warning("Device appears to be offline")
-            return True
+        tracker = get_health_tracker()
+        if tracker is None:
+            return False
+        return not tracker.is_reachable(server_url)
 
     @staticmethod
-    def sync_all_pending_entries(user_id: int) -> Dict[str, int]:
+    def sync_all_pending_entries(
+        user_id: int, entry_ids: Optional[List[int]] = None
+    ) -> Dict[str, any]:
         """
-        Sync all pending journal entries for a user.
+        Send a user's queued journal changes to the calendar.
+
+        Changes are read from the sync outbox in the order they were made
+        and coalesced per entry: any run of creates and updates becomes one
+        PUT of the entry's current state, and a delete one DELETE of its
+        event (or nothing, if the entry never reached the calendar). They
+        are sent CALDAV_SYNC_CHUNK_SIZE entries at a time, and each chunk's
+        status changes and consumed outbox rows are committed together, so
+        a change made while the sync runs stays queued for the next one.
 
         Args:
             user_id: ID of the user
+            entry_ids: Optional subset of entries to sync; entries that are
+                missing or have no queued change are counted as skipped
 
         Returns:
-            Dictionary with sync statistics
+            Dictionary with success (PUTs), unchanged (entries whose event
+            the calendar already held, so no PUT was sent), deleted
+            (DELETEs), failed and skipped counts and 'chunks', one {'entries', 'success',
+            'failed', 'duration_ms'} per chunk
+
+        Raises:
+            ValueError: If the calendar is full or denies permission; chunks
+                already synced stay committed
         """
         if CalDAVService.is_offline():
             logger.warning(f"Device is offline, cannot sync entries for user {user_id}")
-            return {"success": 0, "failed": 0, "skipped": 0}
+            return {"success": 0, "unchanged": 0, "deleted": 0, "failed": 0, "skipped": 0, "chunks": []}
 
-        pending_entries = JournalEntry.query.filter_by(
-            user_id=user_id, sync_status="sync_pending"
-        ).all()
+        chunk_size = current_app.config.get("CALDAV_SYNC_CHUNK_SIZE", 200)
+        changes = CalDAVService._pending_changes(user_id, entry_ids)
+        skipped_count = len(entry_ids) - len(changes) if entry_ids is not None else 0
 
         success_count = 0
+        unchanged_count = 0
+        deleted_count = 0
         failed_count = 0
+        chunk_stats = []
 
-        for entry in pending_entries:
-            if CalDAVService.sync_entry_to_calendar(entry):
-                success_count += 1
-            else:
-                failed_count += 1
+        for start in range(0, len(changes), chunk_size):
+            if chunk_stats and CalDAVService.is_offline():
+                logger.warning(f"Went offline during sync for user {user_id}")
+                break
+            chunk = changes[start : start + chunk_size]
+            started = time.perf_counter()
+            success, unchanged, deleted, failed = CalDAVService._sync_chunk(user_id, chunk)
+            success_count += success
+            unchanged_count += unchanged
+            deleted_count += deleted
+            failed_count += failed
+            chunk_stats.append(
+                {
+                    "entries": len(chunk),
+                    "success": success,
+                    "failed": failed,
+                    "duration_ms": round((time.perf_counter() - started) * 1000, 3),
+                }
+            )
 
         logger.info(
-            f"Synced {success_count} entries, {failed_count} failed for user {user_id}"
+            f"Synced {success_count} entries ({unchanged_count} unchanged), deleted {deleted_count} events, "
+            f"{failed_count} failed for user {user_id} in {len(chunk_stats)} chunks "
+            f"({sum(len(change.outbox_ids) for change in changes)} queued changes)"
+        )
+        return {
+            "success": success_count,
+            "unchanged": unchanged_count,
+            "deleted": deleted_count,
+            "failed": failed_count,
+            "skipped": skipped_count,
+            "chunks": chunk_stats,
+        }
+
+    @staticmethod
+    def _pending_changes(user_id: int, entry_ids: Optional[List[int]] = None) -> List[PendingChange]:
+        """
+        Read a user's outbox in order and coalesce it per entry.
+
+        Args:
+            user_id: ID of the user
+            entry_ids: Only read changes of these entries
+
+        Returns:
+            One PendingChange per entry, ordered by the entry's first change
+        """
+        query = (
+            select(SyncOutbox.id, SyncOutbox.entry_id, SyncOutbox.op, SyncOutbox.calendar_event_id)
+            .where(SyncOutbox.user_id == user_id)
+            .order_by(SyncOutbox.id)
+        )
+        if entry_ids is not None:
+            query = query.where(SyncOutbox.entry_id.in_(entry_ids))
+
+        changes = {}
+        for row in db.session.execute(query):
+            upsert, delete_uid, outbox_ids = changes.get(row.entry_id, (False, None, []))
+            if row.op == SyncOutbox.OP_DELETE:
+                upsert, delete_uid = False, row.calendar_event_id or delete_uid
+            else:
+                upsert = True
+            outbox_ids.append(row.id)
+            changes[row.entry_id] = (upsert, delete_uid, outbox_ids)
+        return [PendingChange(entry_id, *change) for entry_id, change in changes.items()]
+
+    @staticmethod
+    def _queued_outbox_ids(entry_id: int) -> List[int]:
+        """IDs of the outbox rows a push of the entry's current state consumes."""
+        return list(
+            db.session.scalars(
+                select(SyncOutbox.id).where(
+                    SyncOutbox.entry_id == entry_id, SyncOutbox.op != SyncOutbox.OP_DELETE
+                )
+            )
         )
-        return {"success": success_count, "failed": failed_count, "skipped": 0}
+
+    @staticmethod
+    def _consume_outbox(outbox_ids: List[int]) -> None:
+        """Delete sent outbox rows, without committing."""
+        for start in range(0, len(outbox_ids), IN_CLAUSE_CHUNK_SIZE):
+            db.session.execute(
+                delete(SyncOutbox)
+                .where(SyncOutbox.id.in_(outbox_ids[start : start + IN_CLAUSE_CHUNK_SIZE]))
+                .execution_options(synchronize_session=False)
+            )
+
+    @staticmethod
+    def _sync_chunk(user_id: int, changes: List[PendingChange]) -> Tuple[int, int, int, int]:
+        """
+        Send a chunk of coalesced changes and commit their results together.
+
+        Entries to upsert are loaded with one query and rendered here;
+        entries whose event the calendar already holds are not sent again.
+        Deletes and then PUTs (conditional on the ETag of this app's last
+        write) run in parallel on the server's transport (at most
+        CALDAV_MAX_CONCURRENCY at a time, each request timing out after
+        CALDAV_PUSH_TIMEOUT seconds). The results are applied in chunk
+        order, and the outbox rows of every change that went through are
+        consumed, before the single commit.
+
+        Args:
+            user_id: ID of the user
+            changes: Coalesced changes to send
+
+        Returns:
+            Tuple of (entries put, entries unchanged, events deleted,
+            failed); failed changes stay queued, and entries whose event
+            was changed on the calendar are marked sync_conflict
+
+        Raises:
+            ValueError: If the calendar is full or denies permission; the
+                rest of the chunk is still applied and committed first
+        """
+        entries = {
+            entry.id: entry
+            for entry in JournalService.get_entries(
+                [change.entry_id for change in changes if change.upsert], user_id
+            )
+        }
+        # Without a configured server the sync is simulated
+        transport = get_transport()
+        failed_ids = set()
+        rendered = []
+        deletes = []
+        unchanged = 0
+        for change in changes:
+            entry = entries.get(change.entry_id)
+            uid = None
+            if entry is not None:
+                try:
+                    uid, ics = CalDAVService._render_entry(entry)
+                except Exception as e:
+                    logger.error(f"Error rendering entry {entry.id} for calendar: {str(e)}", exc_info=True)
+                    failed_ids.add(change.entry_id)
+                    continue
+                content_hash = CalDAVService._content_hash(ics)
+                if transport is not None and CalDAVService._unchanged_on_calendar(entry, uid, content_hash):
+                    CalDAVService._mark_synced(entry, uid, content_hash, entry.calendar_etag)
+                    unchanged += 1
+                else:
+                    rendered.append((change, entry, uid, ics, content_hash))
+            # An entry that reused a deleted entry's id replaces its event
+            if change.delete_uid and change.delete_uid != uid:
+                deletes.append((change, change.delete_uid))
+
+        if transport is None:
+            delete_results = [None] * len(deletes)
+            put_results = [None] * len(rendered)
+        else:
+            timeout = current_app.config.get("CALDAV_PUSH_TIMEOUT")
+            delete_results = transport.delete_events([uid for _, uid in deletes], timeout=timeout)
+            put_results = transport.put_events(
+                [(uid, ics, CalDAVService._if_match(entry, uid)) for _, entry, uid, ics, _ in rendered],
+                timeout=timeout,
+            )
+        tracker = get_health_tracker() if transport is not None else None
+
+        success = 0
+        deleted = 0
+        fatal_message = None
+        results = [(change, None, uid, None, outcome) for (change, uid), outcome in zip(deletes, delete_results)]
+        results += [
+            (change, entry, uid, content_hash if transport is not None else None, outcome)
+            for (change, entry, uid, _, content_hash), outcome in zip(rendered, put_results)
+        ]
+        for change, entry, uid, content_hash, outcome in results:
+            if not isinstance(outcome, Exception):
+                if entry is None:
+                    deleted += 1
+                else:
+                    CalDAVService._mark_synced(entry, uid, content_hash, outcome)
+                    success += 1
+                if tracker is not None:
+                    tracker.record_success(transport.server_url)
+                continue
+            error = outcome
+            failed_ids.add(change.entry_id)
+            CalDAVService._record_error(tracker, transport.server_url, error)
+            if isinstance(error, PreconditionFailedError):
+                # The next pull brings the calendar's version
+                logger.warning(f"Not syncing entry {change.entry_id}: {str(error)}")
+                entry.sync_status = "sync_conflict"
+                continue
+            if isinstance(error, RequestTimeoutError) and entry is not None:
+                CalDAVService._forget_etag(entry)
+            message = CalDAVService._fatal_sync_error(change.entry_id, error)
+            if message:
+                if entry is not None:
+                    entry.sync_status = "sync_error"
+                fatal_message = fatal_message or message
+            else:
+                logger.error(f"Error syncing entry {change.entry_id} to calendar: {str(error)}")
+
+        CalDAVService._consume_outbox(
+            [
+                outbox_id
+                for change in changes
+                if change.entry_id not in failed_ids
+                for outbox_id in change.outbox_ids
+            ]
+        )
+        db.session.commit()
+        if fatal_message:
+            raise ValueError(fatal_message)
+        return success, unchanged, deleted, len(failed_ids)
+
+
+def _utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Convert an aware datetime to naive UTC, as DateTime columns store it."""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _upsert_statement(table, columns):
+    """
+    Build an INSERT that updates the row on a (user_id, external_event_id) conflict.
+
+    Args:
+        table: Table to write
+        columns: Column names of the rows; all but the key are updated
+
+    Returns:
+        Insert statement for executemany
+    """
+    if db.session.get_bind().dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+
+    key = ("user_id", "external_event_id")
+    stmt = insert(table)
+    return stmt.on_conflict_do_update(
+        index_elements=list(key),
+        set_={name: stmt.excluded[name] for name in columns if name not in key},
+    )
@@ -0,0 +1,487 @@
+"""CalDAV transport: one pooled keep-alive HTTP session per server."""
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+from urllib.parse import quote
+from xml.etree import ElementTree
+from xml.sax.saxutils import escape
+from flask import current_app, has_app_context
+
+logger = logging.getLogger(__name__)
+
+DAV_NS = "DAV:"
+CALDAV_NS = "urn:ietf:params:xml:ns:caldav"
+CALENDARSERVER_NS = "http://calendarserver.org/ns/"
+
+# Bytes read from a streamed multiget response per parser feed
+MULTIGET_READ_SIZE = 64 * 1024
+
+PROPFIND_COLLECTION_STATE = (
+    '<?xml version="1.0" encoding="utf-8"?>'
+    f'<D:propfind xmlns:D="{DAV_NS}" xmlns:CS="{CALENDARSERVER_NS}">'
+    "<D:prop><CS:getctag/><D:sync-token/></D:prop></D:propfind>"
+)
+
+PROPFIND_ETAGS = (
+    '<?xml version="1.0" encoding="utf-8"?>'
+    f'<D:propfind xmlns:D="{DAV_NS}"><D:prop><D:getetag/></D:prop></D:propfind>'
+)
+
+
+class CalDAVTransportError(Exception):
+    """Raised when the CalDAV server rejects or fails a request."""
+
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+
+
+class SyncTokenExpiredError(CalDAVTransportError):
+    """Raised when the server no longer accepts a stored sync-token."""
+
+
+class PreconditionFailedError(CalDAVTransportError):
+    """Raised when a conditional PUT finds the event changed on the server."""
+
+
+class RequestTimeoutError(CalDAVTransportError):
+    """Raised when a request times out; the server may still have applied it."""
+
+
+class SyncChanges(NamedTuple):
+    """Result of a sync-collection REPORT."""
+
+    sync_token: str
+    # (href, etag) of created or modified events
+    changed: List[Tuple[str, str]]
+    # hrefs of deleted events
+    deleted: List[str]
+
+
+class CalDAVTransport:
+    """
+    Sends events to one CalDAV calendar collection.
+
+    Wraps a caldav.DAVClient whose HTTP session keeps up to pool_size
+    connections alive, so consecutive requests, from any user or request
+    thread, reuse an open TCP/TLS connection instead of paying a new
+    handshake per event. put_events() and delete_events() run on the
+    transport's own thread pool, so at most max_concurrency requests are in
+    flight to the server however many syncs run at once. The read side (collection
+    state, sync-collection, calendar-multiget) speaks raw WebDAV XML.
+    Instances are shared; see get_transport().
+    """
+
+    def __init__(
+        self,
+        server_url: str,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        pool_size: int = 10,
+        timeout: float = 10,
+        verify=True,
+        keepalive: float = 600,
+        max_concurrency: int = 4,
+        auth_type: str = "basic",
+    ):
+        # caldav pulls in niquests and lxml; only pay for them when syncing
+        import niquests
+        from caldav import DAVClient
+
+        self.server_url = server_url.rstrip("/") + "/"
+        self.client = DAVClient(
+            url=self.server_url,
+            username=username or None,
+            password=password or None,
+            # Sending credentials up front avoids a 401 round trip per
+            # connection, and the client's negotiation is not thread-safe
+            auth_type=auth_type if username else None,
+            timeout=timeout,
+            ssl_verify_cert=verify,
+            enable_rfc6764=False,
+        )
+        self.client.session = niquests.Session(
+            pool_connections=1,
+            # Every concurrent PUT needs its own kept-alive connection
+            pool_maxsize=max(pool_size, max_concurrency),
+            keepalive_delay=keepalive,
+        )
+        self.max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="caldav-put"
+        )
+
+    def event_url(self, uid: str) -> str:
+        """Return the URL of the event resource with the given UID."""
+        return f"{self.server_url}{quote(uid, safe='')}.ics"
+
+    def put_event(
+        self, uid: str, ics: str, etag: Optional[str] = None, timeout: Optional[float] = None
+    ) -> Optional[str]:
+        """
+        Create or replace an event.
+
+        Args:
+            uid: Event UID, also used as the resource name
+            ics: iCalendar text of a VCALENDAR holding the event
+            etag: Only replace the event if it is still at this ETag
+                (If-Match); None writes unconditionally
+            timeout: Connect and read timeout of the request in seconds;
+                None uses the transport's timeout
+
+        Returns:
+            ETag of the stored event, or None if the server sent none
+
+        Raises:
+            PreconditionFailedError: If the event no longer matches etag
+            RequestTimeoutError: If the server does not answer in time
+            CalDAVTransportError: If the server does not store the event
+        """
+        url = self.event_url(uid)
+        headers = {"Content-Type": "text/calendar; charset=utf-8"}
+        if etag:
+            headers["If-Match"] = etag
+        response = self._send("PUT", url, ics, headers, timeout)
+        if response.status_code == 412:
+            raise PreconditionFailedError(f"PUT {url} failed: event changed on the server", 412)
+        if response.status_code == 507:
+            raise CalDAVTransportError(f"PUT {url} failed: calendar quota exceeded", 507)
+        if response.status_code not in (200, 201, 204):
+            raise CalDAVTransportError(
+                f"PUT {url} failed with HTTP {response.status_code}", response.status_code
+            )
+        return response.headers.get("ETag")
+
+    def put_events(
+        self, events: List[Tuple[str, str, Optional[str]]], timeout: Optional[float] = None
+    ) -> List[Union[str, None, Exception]]:
+        """
+        PUT several events in parallel.
+
+        Each request is sent with timeout, so one that times out is
+        abandoned rather than left running behind the caller. Requests wait
+        for a free worker, so the batch as a whole can take up to
+        ceil(len(events) / max_concurrency) * timeout, and longer for a
+        server that keeps sending data slowly (timeout bounds each read).
+
+        Args:
+            events: List of (uid, ics, etag) tuples, as for put_event()
+            timeout: Timeout of each request, as for put_event()
+
+        Returns:
+            One entry per event, in order: the exception it failed with, or
+            else the stored event's ETag (None if the server sent none)
+        """
+        return self._run_parallel(
+            self.put_event, [(uid, ics, etag, timeout) for uid, ics, etag in events]
+        )
+
+    def delete_event(self, uid: str, timeout: Optional[float] = None) -> None:
+        """
+        Delete an event; one that is already gone counts as deleted.
+
+        Args:
+            uid: Event UID
+            timeout: Timeout of the request, as for put_event()
+
+        Raises:
+            RequestTimeoutError: If the server does not answer in time
+            CalDAVTransportError: If the server does not delete the event
+        """
+        url = self.event_url(uid)
+        response = self._send("DELETE", url, None, {}, timeout)
+        if response.status_code not in (200, 204, 404):
+            raise CalDAVTransportError(
+                f"DELETE {url} failed with HTTP {response.status_code}", response.status_code
+            )
+
+    def delete_events(
+        self, uids: List[str], timeout: Optional[float] = None
+    ) -> List[Optional[Exception]]:
+        """
+        DELETE several events in parallel, like put_events().
+
+        Args:
+            uids: Event UIDs
+            timeout: Timeout of each request, as for put_event()
+
+        Returns:
+            One entry per UID, in order: None if it was deleted, otherwise
+            the exception it failed with
+        """
+        return self._run_parallel(self.delete_event, [(uid, timeout) for uid in uids])
+
+    def _run_parallel(self, call, calls):
+        """
+        Run call(*args) for each args on the thread pool, collecting results (or errors) in order.
+
+        Every call is waited for: the requests carry their own timeout, so
+        a result is never given up on while its request may still succeed.
+        """
+        futures = [self._executor.submit(call, *args) for args in calls]
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(e)
+        return results
+
+    def _send(self, method: str, url: str, body: Optional[str], headers: Dict[str, str], timeout: Optional[float]):
+        """
+        Send one request on the pooled session with its own timeout.
+
+        Returns:
+            niquests response
+
+        Raises:
+            RequestTimeoutError: If connecting or a read times out
+            CalDAVTransportError: If the server refuses the credentials
+        """
+        import niquests
+
+        client = self.client
+        timeout = timeout or client.timeout
+        try:
+            response = client.session.request(
+                method,
+                url,
+                data=body.encode("utf-8") if body is not None else None,
+                headers=headers,
+                auth=client.auth,
+                timeout=timeout,
+                verify=client.ssl_verify_cert,
+            )
+        except niquests.exceptions.Timeout as e:
+            raise RequestTimeoutError(f"{method} {url} timed out after {timeout}s") from e
+        if response.status_code in (401, 403):
+            raise CalDAVTransportError(
+                f"{method} {url} forbidden: HTTP {response.status_code}", response.status_code
+            )
+        return response
+
+    def get_collection_state(self) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Read the calendar's CTag and current sync-token.
+
+        One Depth 0 PROPFIND whose response size does not depend on the
+        number of events.
+
+        Returns:
+            Tuple of (ctag, sync_token); either is None if the server does
+            not report it (no sync-token means no sync-collection support)
+        """
+        tree = self._request("PROPFIND", self.server_url, PROPFIND_COLLECTION_STATE, depth=0)
+        ctag = tree.findtext(f".//{{{CALENDARSERVER_NS}}}getctag") or None
+        sync_token = tree.findtext(f".//{{{DAV_NS}}}prop/{{{DAV_NS}}}sync-token") or None
+        return ctag, sync_token
+
+    def sync_collection(self, sync_token: Optional[str]) -> SyncChanges:
+        """
+        List the events changed and deleted since a sync-token (RFC 6578).
+
+        Args:
+            sync_token: Token of the last sync, or None for every event
+
+        Returns:
+            SyncChanges with the new token and the changed/deleted hrefs
+
+        Raises:
+            SyncTokenExpiredError: If the server rejects sync_token; sync
+                again with None
+        """
+        body = (
+            '<?xml version="1.0" encoding="utf-8"?>'
+            f'<D:sync-collection xmlns:D="{DAV_NS}">'
+            f"<D:sync-token>{escape(sync_token or '')}</D:sync-token>"
+            "<D:sync-level>1</D:sync-level>"
+            "<D:prop><D:getetag/></D:prop></D:sync-collection>"
+        )
+        try:
+            tree = self._request("REPORT", self.server_url, body, depth=1)
+        except CalDAVTransportError as e:
+            # RFC 6578 3.2: an invalid token fails the valid-sync-token
+            # precondition (403, or 409 on some servers)
+            if sync_token and e.status in (403, 409):
+                raise SyncTokenExpiredError(str(e), e.status) from e
+            raise
+
+        changed = []
+        deleted = []
+        for href, status, etag, _ in self._responses(tree):
+            if status == 404:
+                deleted.append(href)
+            elif not href.endswith("/"):
+                changed.append((href, etag))
+        new_token = tree.findtext(f"{{{DAV_NS}}}sync-token")
+        return SyncChanges(new_token, changed, deleted)
+
+    def list_events(self) -> List[Tuple[str, str]]:
+        """
+        List every event of the calendar, for servers without sync-tokens.
+
+        Returns:
+            List of (href, etag) pairs
+        """
+        tree = self._request("PROPFIND", self.server_url, PROPFIND_ETAGS, depth=1)
+        return [
+            (href, etag)
+            for href, status, etag, _ in self._responses(tree)
+            if status != 404 and not href.endswith("/")
+        ]
+
+    def iter_multiget(self, hrefs: List[str]) -> Iterator[Tuple[str, str, str]]:
+        """
+        Fetch several events in one calendar-multiget REPORT (RFC 4791 7.9).
+
+        The multistatus body is parsed as it streams in and every event is
+        yielded as soon as its response element is complete, so memory
+        holds one event at a time rather than the whole batch.
+
+        Args:
+            hrefs: Event hrefs as returned by sync_collection or list_events
+
+        Yields:
+            (href, etag, iCalendar text) per event; missing events are left out
+
+        Raises:
+            CalDAVTransportError: If the server does not answer with a multistatus
+        """
+        body = (
+            '<?xml version="1.0" encoding="utf-8"?>'
+            f'<C:calendar-multiget xmlns:D="{DAV_NS}" xmlns:C="{CALDAV_NS}">'
+            "<D:prop><D:getetag/><C:calendar-data/></D:prop>"
+            f"{''.join(f'<D:href>{escape(href)}</D:href>' for href in hrefs)}"
+            "</C:calendar-multiget>"
+        )
+        client = self.client
+        response = client.session.request(
+            "REPORT",
+            self.server_url,
+            data=body.encode("utf-8"),
+            headers={"Depth": "1", "Content-Type": "application/xml; charset=utf-8"},
+            auth=client.auth,
+            timeout=client.timeout,
+            verify=client.ssl_verify_cert,
+            stream=True,
+        )
+        try:
+            if response.status_code != 207:
+                raise CalDAVTransportError(
+                    f"REPORT {self.server_url} failed with HTTP {response.status_code}",
+                    response.status_code,
+                )
+            parser = ElementTree.XMLPullParser(events=("end",))
+            for chunk in response.iter_content(chunk_size=MULTIGET_READ_SIZE):
+                parser.feed(chunk)
+                for _, element in parser.read_events():
+                    if element.tag != f"{{{DAV_NS}}}response":
+                        continue
+                    for href, status, etag, data in self._responses(element):
+                        if status != 404 and data:
+                            yield href, etag, data
+                    element.clear()
+            parser.close()
+        except ElementTree.ParseError as e:
+            raise CalDAVTransportError(f"REPORT {self.server_url} returned invalid XML: {e}") from e
+        finally:
+            response.close()
+
+    def _request(self, method: str, url: str, body: str, depth: int):
+        """
+        Send a WebDAV request that answers with a 207 multistatus.
+
+        Returns:
+            Parsed multistatus element
+
+        Raises:
+            CalDAVTransportError: On any other status
+        """
+        from caldav.lib.error import AuthorizationError
+
+        try:
+            response = self.client.request(
+                url,
+                method,
+                body,
+                {"Depth": str(depth), "Content-Type": "application/xml; charset=utf-8"},
+            )
+        except AuthorizationError as e:
+            raise CalDAVTransportError(f"{method} {url} forbidden: {e}", 403) from e
+        if response.status != 207 or response.tree is None:
+            raise CalDAVTransportError(
+                f"{method} {url} failed with HTTP {response.status}", response.status
+            )
+        return response.tree
+
+    @staticmethod
+    def _responses(tree):
+        """
+        Yield (href, status, etag, calendar-data) per multistatus response.
+
+        status is 404 for a response reporting a missing resource and 200
+        otherwise. tree may also be a single response element.
+        """
+        for response in tree.iter(f"{{{DAV_NS}}}response"):
+            href = response.findtext(f"{{{DAV_NS}}}href")
+            status = response.findtext(f"{{{DAV_NS}}}status") or ""
+            yield (
+                href,
+                404 if " 404 " in status else 200,
+                response.findtext(f".//{{{DAV_NS}}}getetag"),
+                response.findtext(f".//{{{CALDAV_NS}}}calendar-data"),
+            )
+
+    def close(self) -> None:
+        """Stop the worker threads and close the pooled connections."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self.client.session.close()
+
+
+def init_caldav_transport(app) -> None:
+    """
+    Prepare the app's transport registry; transports are built on first use.
+
+    Args:
+        app: Flask application instance
+    """
+    app.extensions["caldav_transports"] = ({}, threading.Lock())
+
+
+def get_transport() -> Optional[CalDAVTransport]:
+    """
+    Return the shared transport of the configured CalDAV server.
+
+    Returns:
+        CalDAVTransport for CALDAV_SERVER_URL, or None when no server is
+        configured (sync is then simulated)
+    """
+    if not has_app_context():
+        return None
+    config = current_app.config
+    server_url = config.get("CALDAV_SERVER_URL")
+    registry = current_app.extensions.get("caldav_transports")
+    if not server_url or registry is None:
+        return None
+
+    transports: Dict[str, CalDAVTransport] = registry[0]
+    transport = transports.get(server_url)
+    if transport is None:
+        with registry[1]:
+            transport = transports.get(server_url)
+            if transport is None:
+                transport = CalDAVTransport(
+                    server_url,
+                    username=config.get("CALDAV_USERNAME"),
+                    password=config.get("CALDAV_PASSWORD"),
+                    pool_size=config.get("CALDAV_POOL_SIZE", 10),
+                    timeout=config.get("CALDAV_TIMEOUT", 10),
+                    verify=config.get("CALDAV_TLS_VERIFY", True),
+                    keepalive=config.get("CALDAV_KEEPALIVE", 600),
+                    max_concurrency=config.get("CALDAV_MAX_CONCURRENCY", 4),
+                    auth_type=config.get("CALDAV_AUTH_TYPE", "basic"),
+                )
+                transports[server_url] = transport
+                logger.info(f"Created pooled CalDAV transport for {server_url}")
+    return transport
@@ -0,0 +1,217 @@
+"""Cached reachability of CalDAV servers with a per-host circuit breaker."""
+import logging
+import socket
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+from flask import current_app, has_app_context
+from werkzeug.utils import import_string
+
+logger = logging.getLogger(__name__)
+
+# probe(host, port, timeout) -> True if the host accepted a connection
+Probe = Callable[[str, int, float], bool]
+
+
+def tcp_probe(host: str, port: int, timeout: float) -> bool:
+    """
+    Probe a host by opening (and closing) a TCP connection.
+
+    Args:
+        host: Host name or address
+        port: TCP port
+        timeout: Connect timeout in seconds
+
+    Returns:
+        True if the connection succeeded, False otherwise
+    """
+    try:
+        with socket.create_connection((host, port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+def host_key(url: str) -> Tuple[str, int]:
+    """
+    Return the (host, port) a server URL connects to.
+
+    Args:
+        url: Server URL, e.g. https://caldav.example.com/dav/
+
+    Returns:
+        Tuple of (host, port); the port defaults from the scheme
+    """
+    parts = urlsplit(url)
+    port = parts.port or (80 if parts.scheme == "http" else 443)
+    return parts.hostname or "", port
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for one host.
+
+    Closed while calls succeed. After failure_threshold consecutive failures
+    it opens and rejects calls for reset_timeout seconds, then lets a single
+    trial call through (half-open); its outcome closes or re-opens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_timeout: float, clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return self.CLOSED
+        if self._clock() - self.opened_at >= self.reset_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def allow(self) -> bool:
+        """Return True if a call may go out now."""
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        if state == self.HALF_OPEN and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._trial_in_flight = False
+        if self.opened_at is not None or self.failures >= self.failure_threshold:
+            self.opened_at = self._clock()
+
+
+class HealthTracker:
+    """
+    Shared reachability cache for CalDAV servers.
+
+    A probe result is reused for ttl seconds, so a sync of many entries
+    costs at most one probe. Probe failures and failures reported by
+    callers feed a per-host CircuitBreaker; while it is open the host is
+    reported unreachable without probing.
+    """
+
+    def __init__(
+        self,
+        probe: Probe = tcp_probe,
+        ttl: float = 30,
+        probe_timeout: float = 3,
+        failure_threshold: int = 3,
+        reset_timeout: float = 60,
+        clock=time.monotonic,
+    ):
+        self.probe = probe
+        self.ttl = ttl
+        self.probe_timeout = probe_timeout
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._cache: Dict[Tuple[str, int], Tuple[bool, float]] = {}
+        self._breakers: Dict[Tuple[str, int], CircuitBreaker] = {}
+
+    def breaker(self, url: str) -> CircuitBreaker:
+        """Return the circuit breaker of a server's host."""
+        key = host_key(url)
+        with self._lock:
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                breaker = CircuitBreaker(self.failure_threshold, self.reset_timeout, self._clock)
+                self._breakers[key] = breaker
+            return breaker
+
+    def is_reachable(self, url: str) -> bool:
+        """
+        Return whether a server is reachable, probing at most once per ttl.
+
+        Args:
+            url: Server URL
+
+        Returns:
+            True if the last probe within ttl succeeded, or a new one does
+        """
+        key = host_key(url)
+        now = self._clock()
+        with self._lock:
+            cached = self._cache.get(key)
+        if cached is not None and now - cached[1] < self.ttl:
+            return cached[0]
+
+        breaker = self.breaker(url)
+        with self._lock:
+            allowed = breaker.allow()
+        if not allowed:
+            return False
+
+        reachable = self.probe(key[0], key[1], self.probe_timeout)
+        with self._lock:
+            self._cache[key] = (reachable, self._clock())
+            if reachable:
+                breaker.record_success()
+            else:
+                breaker.record_failure()
+        if not reachable:
+            logger.warning(f"CalDAV server {key[0]}:{key[1]} is unreachable")
+        return reachable
+
+    def record_success(self, url: str) -> None:
+        """Report a successful call to a server."""
+        breaker = self.breaker(url)
+        with self._lock:
+            breaker.record_success()
+
+    def record_failure(self, url: str) -> None:
+        """Report a failed call to a server; drops its cached reachability."""
+        key = host_key(url)
+        breaker = self.breaker(url)
+        with self._lock:
+            breaker.record_failure()
+            self._cache.pop(key, None)
+            opened = breaker.state != CircuitBreaker.CLOSED
+        if opened:
+            logger.warning(f"Circuit breaker open for CalDAV server {key[0]}:{key[1]}")
+
+
+def init_health_tracker(app) -> None:
+    """
+    Install the CalDAV health tracker on an app according to its configuration.
+
+    CALDAV_HEALTH_PROBE may name a probe function ("package.module:func")
+    to replace the TCP connect, e.g. for tests that must stay offline.
+
+    Args:
+        app: Flask application instance
+    """
+    probe_path = app.config.get("CALDAV_HEALTH_PROBE")
+    app.extensions["caldav_health"] = HealthTracker(
+        probe=import_string(probe_path) if probe_path else tcp_probe,
+        ttl=app.config.get("CALDAV_HEALTH_TTL", 30),
+        probe_timeout=app.config.get("CALDAV_PROBE_TIMEOUT", 3),
+        failure_threshold=app.config.get("CALDAV_BREAKER_THRESHOLD", 3),
+        reset_timeout=app.config.get("CALDAV_BREAKER_RESET", 60),
+    )
+
+
+def get_health_tracker() -> Optional[HealthTracker]:
+    """Return the current app's CalDAV health tracker, if installed."""
+    if not has_app_context():
+        return None
+    return current_app.extensions.get("caldav_health")
@@ -1,10 +1,16 @@
 """iCalendar generator service for converting journal entries to .ics format."""
+from __future__ import annotations
+
 import logging
 from datetime import datetime, date, timedelta, timezone
-from typing import Optional
-from ics import Calendar, Event
+from typing import TYPE_CHECKING, Optional
 from models.journal_entry import JournalEntry
 
+if TYPE_CHECKING:
+    # ics (and its parser generator) takes over 100 ms to import, so it is only
+    # loaded when an event is actually generated
+    from ics import Calendar, Event
+
 logger = logging.getLogger(__name__)
 
 
@@ -60,6 +66,35 @@ class ICSGenerator:
         # Preserve emoji and special characters
         return text.strip()
 
+    @staticmethod
+    def event_title(title: Optional[str]) -> str:
+        """
+        Return the calendar event title of a journal entry title.
+
+        Args:
+            title: Journal entry title
+
+        Returns:
+            Plain title truncated to MAX_TITLE_LENGTH (FR-026)
+        """
+        title = ICSGenerator.strip_formatting(title or "Untitled")
+        return ICSGenerator.truncate_text(title, ICSGenerator.MAX_TITLE_LENGTH)
+
+    @staticmethod
+    def event_description(content: Optional[str]) -> str:
+        """
+        Return the calendar event description of a journal entry's content.
+
+        Args:
+            content: Journal entry content
+
+        Returns:
+            Plain text truncated to MAX_DESCRIPTION_LENGTH (FR-026), keeping
+            emoji and special characters (FR-027)
+        """
+        description = ICSGenerator.strip_formatting(content or "")
+        return ICSGenerator.truncate_text(description, ICSGenerator.MAX_DESCRIPTION_LENGTH)
+
     @staticmethod
     def generate_event_from_entry(
         entry: JournalEntry, time_offset_minutes: int = 0
@@ -74,16 +109,8 @@ class ICSGenerator:
         Returns:
             iCalendar Event object
         """
-        # Prepare title (truncate if needed, FR-026)
-        title = ICSGenerator.strip_formatting(entry.title or "Untitled")
-        title = ICSGenerator.truncate_text(title, ICSGenerator.MAX_TITLE_LENGTH)
-
-        # Prepare description (truncate if needed, FR-026)
-        # Preserve text content including emoji and special characters (FR-027)
-        description = ICSGenerator.strip_formatting(entry.content or "")
-        description = ICSGenerator.truncate_text(
-            description, ICSGenerator.MAX_DESCRIPTION_LENGTH
-        )
+        title = ICSGenerator.event_title(entry.title)
+        description = ICSGenerator.event_description(entry.content)
 
         # Convert date to datetime (use UTC, FR-025)
         entry_date = entry.date
@@ -100,6 +127,8 @@ class ICSGenerator:
         end_datetime = start_datetime + timedelta(hours=1)
 
         # Create event
+        from ics import Event
+
         event = Event()
         event.name = title
         event.description = description
@@ -125,6 +154,8 @@ class ICSGenerator:
         Returns:
             iCalendar Calendar object
         """
+        from ics import Calendar
+
         calendar = Calendar()
 
         # Group entries by date and time to handle multiple entries on same date/time (FR-028)
@@ -163,3 +194,145 @@ class ICSGenerator:
         calendar = ICSGenerator.generate_calendar_from_entries(entries)
         # Use str() for ics 0.7.x compatibility
         return str(calendar)
+
+    @staticmethod
+    def parse_events(ics_text: str) -> list[dict]:
+        """
+        Parse the events of an iCalendar text (iPhone to web).
+
+        A single pass over the content lines that reads only the VEVENT
+        properties the journal uses; much cheaper than building ics objects
+        for every event of a large calendar pull.
+
+        Args:
+            ics_text: iCalendar text of a VCALENDAR
+
+        Returns:
+            One dictionary per VEVENT with uid, title, description,
+            start_datetime, end_datetime, last_modified (timezone-aware
+            datetimes or None) and completion_status ('cancelled' for a
+            cancelled event, otherwise None)
+        """
+        events = []
+        properties = None
+        # Depth of components nested in the current VEVENT (e.g. VALARM)
+        nested = 0
+        for line in _unfold(ics_text):
+            name, params, value = _split_content_line(line)
+            if name == "BEGIN":
+                if properties is not None:
+                    nested += 1
+                elif value.upper() == "VEVENT":
+                    properties = {}
+            elif name == "END":
+                if nested:
+                    nested -= 1
+                elif properties is not None and value.upper() == "VEVENT":
+                    events.append(_event_data(properties))
+                    properties = None
+            elif properties is not None and not nested and name in _EVENT_PROPERTIES:
+                properties.setdefault(name, (params, value))
+        return events
+
+
+# VEVENT properties read by ICSGenerator.parse_events
+_EVENT_PROPERTIES = {"UID", "SUMMARY", "DESCRIPTION", "DTSTART", "DTEND", "LAST-MODIFIED", "STATUS"}
+
+_TEXT_ESCAPES = {"n": "\n", "N": "\n", ",": ",", ";": ";", "\\": "\\"}
+
+
+def _unfold(ics_text: str):
+    """Yield the content lines of an iCalendar text, unfolded (RFC 5545 3.1)."""
+    current = None
+    for line in ics_text.splitlines():
+        if line[:1] in (" ", "\t") and current is not None:
+            current += line[1:]
+            continue
+        if current:
+            yield current
+        current = line
+    if current:
+        yield current
+
+
+def _split_content_line(line: str):
+    """Split a content line into (NAME, {PARAM: value}, value)."""
+    quoted = False
+    cut = len(line)
+    for i, char in enumerate(line):
+        if char == '"':
+            quoted = not quoted
+        elif char == ":" and not quoted:
+            cut = i
+            break
+    head, value = line[:cut], line[cut + 1 :]
+    name, *raw_params = head.split(";")
+    params = {}
+    for param in raw_params:
+        key, _, param_value = param.partition("=")
+        params[key.upper()] = param_value.strip('"')
+    return name.upper(), params, value
+
+
+def _unescape_text(value: str) -> str:
+    if "\\" not in value:
+        return value
+    out = []
+    i = 0
+    while i < len(value):
+        char = value[i]
+        if char == "\\" and i + 1 < len(value):
+            out.append(_TEXT_ESCAPES.get(value[i + 1], value[i + 1]))
+            i += 2
+            continue
+        out.append(char)
+        i += 1
+    return "".join(out)
+
+
+def _parse_datetime(params: dict, value: str) -> Optional[datetime]:
+    """Parse a DATE or DATE-TIME value as a timezone-aware datetime."""
+    value = value.strip()
+    try:
+        if len(value) == 8:
+            # All-day (VALUE=DATE): midnight UTC of that day
+            return datetime.strptime(value, "%Y%m%d").replace(tzinfo=timezone.utc)
+        if value.endswith("Z"):
+            return datetime.strptime(value, "%Y%m%dT%H%M%SZ").replace(tzinfo=timezone.utc)
+        parsed = datetime.strptime(value, "%Y%m%dT%H%M%S")
+    except ValueError:
+        return None
+    tzinfo = timezone.utc
+    if "TZID" in params:
+        from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+        try:
+            tzinfo = ZoneInfo(params["TZID"])
+        except (ZoneInfoNotFoundError, ValueError):
+            # Custom VTIMEZONE names; floating times are read as UTC too
+            pass
+    return parsed.replace(tzinfo=tzinfo)
+
+
+def _event_data(properties: dict) -> dict:
+    def _text(name):
+        if name not in properties:
+            return None
+        return _unescape_text(properties[name][1])
+
+    def _datetime(name):
+        if name not in properties:
+            return None
+        return _parse_datetime(*properties[name])
+
+    return {
+        "uid": _text("UID"),
+        "title": _text("SUMMARY"),
+        "description": _text("DESCRIPTION"),
+        "start_datetime": _datetime("DTSTART"),
+        "end_datetime": _datetime("DTEND"),
+        "last_modified": _datetime("LAST-MODIFIED"),
+        "completion_status": "cancelled"
+        if (_text("STATUS") or "").upper() == "CANCELLED"
+        else None,
+    }
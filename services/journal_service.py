@@ -1,11 +1,20 @@
 """Journal service for journal entry CRUD operations."""
 import logging
+from collections import defaultdict
 from datetime import datetime, date, timezone
-from typing import Optional, List, Dict
-from models import db, JournalEntry
+from typing import Optional, List, Dict, Tuple
+from sqlalchemy import tuple_, select, insert, func, case
+from models import db, JournalEntry, JournalUserStats, JournalDailyRollup
+from models.journal_stats import apply_entry_deltas
+from models.sync_outbox import SyncOutbox, calendar_origin, record_entry_changes
+from utils.pagination import encode_cursor, decode_cursor
+from utils.validation import ValidationError
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of ids bound into one IN (...) clause
+IN_CLAUSE_CHUNK_SIZE = 900
+
 
 class JournalService:
     """Service for handling journal entry operations."""
@@ -68,42 +77,124 @@ class JournalService:
             logger.warning(f"Journal entry {entry_id} not found for user {user_id}")
         return entry
 
+    @staticmethod
+    def get_entries(entry_ids: List[int], user_id: int) -> List[JournalEntry]:
+        """
+        Get several journal entries for a user with a single IN query.
+
+        Args:
+            entry_ids: IDs of the journal entries, in the order wanted
+            user_id: ID of the user (for owner verification)
+
+        Returns:
+            JournalEntry objects in the order of entry_ids; ids that do not
+            exist or belong to another user are left out
+        """
+        unique_ids = list(dict.fromkeys(entry_ids))
+        found = {}
+        # Chunked to stay under SQLite's bound-parameter limit
+        for start in range(0, len(unique_ids), IN_CLAUSE_CHUNK_SIZE):
+            chunk = unique_ids[start : start + IN_CLAUSE_CHUNK_SIZE]
+            found.update(
+                (entry.id, entry)
+                for entry in db.session.scalars(
+                    select(JournalEntry).where(
+                        JournalEntry.user_id == user_id, JournalEntry.id.in_(chunk)
+                    )
+                )
+            )
+
+        missing = len(unique_ids) - len(found)
+        if missing:
+            logger.warning(
+                f"{missing} of {len(unique_ids)} journal entries not found for user {user_id}"
+            )
+        return [found[entry_id] for entry_id in entry_ids if entry_id in found]
+
     @staticmethod
     def list_entries(
         user_id: int,
         entry_date: Optional[date] = None,
         limit: int = 50,
         offset: int = 0,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+        fields: Optional[List[str]] = None,
     ) -> Dict[str, any]:
         """
         List journal entries for a user, optionally filtered by date.
 
+        Entries are ordered by (date desc, created_at desc, id desc). When a
+        cursor is given the page starts right after the row it encodes and
+        offset is ignored, so every page costs the same index seek.
+
+        With fields, only those columns are selected and no ORM objects are
+        built; "preview" is the first PREVIEW_LENGTH characters of content,
+        computed by the database so the full text never leaves it. id, date
+        and created_at are always included because they form the cursor.
+
         Args:
             user_id: ID of the user
             entry_date: Optional date filter (YYYY-MM-DD format)
             limit: Maximum number of entries to return
             offset: Number of entries to skip
+            cursor: Opaque cursor returned as next_cursor by a previous call
+            include_total: Whether to look up the total count (None when False)
+            fields: Optional projection, a subset of JournalEntry.LIST_FIELDS
 
         Returns:
-            Dictionary with 'entries' list and 'total' count
+            Dictionary with 'entries' list (JournalEntry objects, or rows when
+            fields is given), 'total' count and 'next_cursor' (None when there
+            are no more entries)
+
+        Raises:
+            ValidationError: If the cursor is malformed or a field is unknown
         """
+        if fields is None:
+            stmt = select(JournalEntry)
+        else:
+            stmt = select(*JournalService._projection(fields))
+
         # Use indexed columns for performance (user_id, date are indexed)
-        query = JournalEntry.query.filter_by(user_id=user_id)
+        stmt = stmt.where(JournalEntry.user_id == user_id)
 
         if entry_date:
-            query = query.filter_by(date=entry_date)
+            stmt = stmt.where(JournalEntry.date == entry_date)
 
-        # Optimize: count before pagination for better performance
-        total = query.count()
+        # Total comes from the maintained counters, not a COUNT(*) scan
+        total = (
+            JournalService.count_entries(user_id, entry_date) if include_total else None
+        )
 
-        # Use indexed columns for ordering (date, created_at)
-        entries = (
-            query.order_by(JournalEntry.date.desc(), JournalEntry.created_at.desc())
-            .limit(limit)
-            .offset(offset)
-            .all()
+        # Ordering matches ix_journal_entries_user_date_created_id; id breaks
+        # ties between entries created in the same instant
+        stmt = stmt.order_by(
+            JournalEntry.date.desc(),
+            JournalEntry.created_at.desc(),
+            JournalEntry.id.desc(),
         )
 
+        if cursor:
+            stmt = stmt.where(
+                tuple_(JournalEntry.date, JournalEntry.created_at, JournalEntry.id)
+                < tuple_(*decode_cursor(cursor))
+            )
+        elif offset:
+            stmt = stmt.offset(offset)
+
+        # Fetch one extra row to find out whether another page exists
+        stmt = stmt.limit(limit + 1)
+        if fields is None:
+            entries = db.session.scalars(stmt).all()
+        else:
+            entries = db.session.execute(stmt).all()
+
+        next_cursor = None
+        if len(entries) > limit:
+            entries = entries[:limit]
+            last = entries[-1]
+            next_cursor = encode_cursor(last.date, last.created_at, last.id)
+
         # Log date-based browsing operations (T050)
         if entry_date:
             logger.info(
@@ -113,7 +204,183 @@ class JournalService:
             logger.info(
                 f"Retrieved {len(entries)} journal entries for user {user_id} (date: {entry_date}, total: {total})"
             )
-        return {"entries": entries, "total": total}
+        return {"entries": entries, "total": total, "next_cursor": next_cursor}
+
+    @staticmethod
+    def _projection(fields: List[str]) -> list:
+        """
+        Build the column list for a projected listing.
+
+        Args:
+            fields: Requested field names
+
+        Returns:
+            List of column expressions labelled with their field names
+
+        Raises:
+            ValidationError: If a field is not in JournalEntry.LIST_FIELDS
+        """
+        unknown = [name for name in fields if name not in JournalEntry.LIST_FIELDS]
+        if unknown:
+            raise ValidationError(f"Unknown field: {', '.join(unknown)}")
+
+        names = ["id", "date", "created_at"]
+        names += [name for name in fields if name not in names]
+
+        columns = []
+        for name in names:
+            if name == "preview":
+                length = JournalEntry.PREVIEW_LENGTH
+                head = func.substr(JournalEntry.content, 1, length + 1, type_=db.Text)
+                columns.append(
+                    case(
+                        (
+                            func.length(head) > length,
+                            func.substr(JournalEntry.content, 1, length, type_=db.Text)
+                            + "...",
+                        ),
+                        else_=head,
+                    ).label("preview")
+                )
+            else:
+                columns.append(getattr(JournalEntry, name))
+        return columns
+
+    @staticmethod
+    def count_entries(user_id: int, entry_date: Optional[date] = None) -> int:
+        """
+        Count a user's journal entries, optionally on a single date.
+
+        Reads the journal_user_stats / journal_daily_rollup counters, which
+        every flush keeps current. Users whose counters have not been built
+        yet (entries written before they existed) fall back to COUNT(*);
+        their counters are built on their next write or by
+        `flask rebuild-journal-stats`.
+
+        Args:
+            user_id: ID of the user
+            entry_date: Optional date filter
+
+        Returns:
+            Number of entries
+        """
+        user_total = db.session.execute(
+            select(JournalUserStats.entry_count).where(
+                JournalUserStats.user_id == user_id
+            )
+        ).scalar()
+
+        if user_total is None:
+            query = JournalEntry.query.filter_by(user_id=user_id)
+            if entry_date:
+                query = query.filter_by(date=entry_date)
+            return query.count()
+
+        if entry_date is None:
+            return user_total
+
+        date_total = db.session.execute(
+            select(JournalDailyRollup.entry_count).where(
+                JournalDailyRollup.user_id == user_id,
+                JournalDailyRollup.date == entry_date,
+            )
+        ).scalar()
+        return date_total or 0
+
+    @staticmethod
+    def get_daily_histogram(
+        user_id: int, start_date: date, end_date: date
+    ) -> List[Dict[str, any]]:
+        """
+        Get per-day entry and sync-status counts for a date range.
+
+        Reads journal_daily_rollup, one row per day that has entries, so a
+        month costs at most 31 primary-key rows whatever the entry volume.
+        Users without counters yet fall back to a GROUP BY over their entries.
+
+        Args:
+            user_id: ID of the user
+            start_date: First day of the range (inclusive)
+            end_date: Last day of the range (inclusive)
+
+        Returns:
+            List of {'date', 'total', 'sync_status': {status: count}} dicts
+            ordered by date, for days with at least one entry
+        """
+        statuses = JournalDailyRollup.STATUS_COLUMNS
+        tracked = db.session.execute(
+            select(JournalUserStats.user_id).where(JournalUserStats.user_id == user_id)
+        ).first()
+
+        if tracked is not None:
+            rows = db.session.execute(
+                select(JournalDailyRollup)
+                .where(
+                    JournalDailyRollup.user_id == user_id,
+                    JournalDailyRollup.date >= start_date,
+                    JournalDailyRollup.date <= end_date,
+                )
+                .order_by(JournalDailyRollup.date)
+            ).scalars()
+            return [
+                {
+                    "date": row.date,
+                    "total": row.entry_count,
+                    "sync_status": {
+                        status: getattr(row, column) for status, column in statuses.items()
+                    },
+                }
+                for row in rows
+            ]
+
+        # One group per day, so the (user_id, date, ...) index yields the
+        # groups in order without a sort
+        rows = db.session.execute(
+            select(
+                JournalEntry.date,
+                func.count(),
+                *(
+                    func.sum(case((JournalEntry.sync_status == status, 1), else_=0))
+                    for status in statuses
+                ),
+            )
+            .where(
+                JournalEntry.user_id == user_id,
+                JournalEntry.date >= start_date,
+                JournalEntry.date <= end_date,
+            )
+            .group_by(JournalEntry.date)
+            .order_by(JournalEntry.date)
+        )
+        return [
+            {
+                "date": entry_date,
+                "total": total,
+                "sync_status": dict(zip(statuses, counts)),
+            }
+            for entry_date, total, *counts in rows
+        ]
+
+    @staticmethod
+    def get_change_version(user_id: int) -> Tuple[int, Optional[datetime]]:
+        """
+        Get the version of a user's journal, bumped by every entry write.
+
+        Args:
+            user_id: ID of the user
+
+        Returns:
+            Tuple of (change_version, changed_at); (0, None) before the
+            user's first tracked write
+        """
+        row = db.session.execute(
+            select(JournalUserStats.change_version, JournalUserStats.changed_at).where(
+                JournalUserStats.user_id == user_id
+            )
+        ).first()
+        if row is None:
+            return 0, None
+        return row.change_version, row.changed_at
 
     @staticmethod
     def update_entry(
@@ -185,6 +452,120 @@ class JournalService:
         logger.info(f"Journal entry {entry_id} deleted for user {user_id}")
         return True
 
+    @staticmethod
+    def apply_bulk_operations(user_id: int, operations: List[Dict]) -> List[Dict]:
+        """
+        Apply a batch of validated create/update/delete operations in one transaction.
+
+        Entries referenced by updates and deletes are loaded with a single
+        query and flushed as batched UPDATE/DELETE statements; creates go
+        out as one executemany INSERT. Everything commits once.
+
+        Args:
+            user_id: ID of the user (for owner verification)
+            operations: Dicts with "index" and "op" ("create", "update" or
+                "delete"), plus "id" for update/delete and the already
+                validated "title", "content" and "entry_date" fields
+
+        Returns:
+            One result per operation, in order, with "index", "op",
+            "status" (201, 200, 204 or 404) and "id" when known
+        """
+        existing = {
+            entry.id: entry
+            for entry in JournalService.get_entries(
+                [op["id"] for op in operations if op["op"] != "create"], user_id
+            )
+        }
+
+        now = datetime.now(timezone.utc)
+        results = []
+        created = []
+        for op in operations:
+            result = {"index": op["index"], "op": op["op"]}
+            if op["op"] == "create":
+                title = op.get("title")
+                content = op.get("content")
+                created.append(
+                    (
+                        result,
+                        {
+                            "user_id": user_id,
+                            "title": title.strip() if title and title.strip() else "Untitled",
+                            "content": content.strip() if content else "",
+                            "date": op.get("entry_date") or date.today(),
+                            "sync_status": "not_synced",
+                            "created_at": now,
+                            "updated_at": now,
+                        },
+                    )
+                )
+                result["status"] = 201
+            else:
+                entry = existing.get(op["id"])
+                result["id"] = op["id"]
+                if entry is None:
+                    result["status"] = 404
+                    result["error"] = "Journal entry not found"
+                elif op["op"] == "delete":
+                    db.session.delete(entry)
+                    # A later operation on the same id sees it as gone
+                    del existing[op["id"]]
+                    result["status"] = 204
+                else:
+                    if op.get("title") is not None:
+                        entry.title = op["title"].strip() or "Untitled"
+                    if op.get("content") is not None:
+                        entry.content = op["content"].strip()
+                    if op.get("entry_date") is not None:
+                        entry.date = op["entry_date"]
+                    entry.updated_at = now
+                    entry.sync_status = "sync_pending"
+                    result["status"] = 200
+            results.append(result)
+
+        if created:
+            # Flush the ORM updates/deletes first so the counters see them
+            db.session.flush()
+            rows = [row for _, row in created]
+            # RETURNING order is unspecified, so each returned row is paired
+            # with a create holding the same values; rows with equal values
+            # are interchangeable, and they go to their creates in order
+            pending = defaultdict(list)
+            for result, row in reversed(created):
+                pending[(row["title"], row["content"], row["date"])].append(result)
+            new_ids = []
+            for entry_id, title, content, entry_date in db.session.execute(
+                insert(JournalEntry.__table__).returning(
+                    JournalEntry.id, JournalEntry.title, JournalEntry.content, JournalEntry.date
+                ),
+                rows,
+            ):
+                pending[(title, content, entry_date)].pop()["id"] = entry_id
+                new_ids.append(entry_id)
+
+            # Core inserts bypass the flush listeners, so count them and
+            # queue them for calendar sync here
+            deltas = defaultdict(int)
+            for row in rows:
+                deltas[(user_id, row["date"], row["sync_status"])] += 1
+            apply_entry_deltas(db.session.connection(), deltas)
+            record_entry_changes(
+                db.session.connection(),
+                [
+                    {"user_id": user_id, "entry_id": entry_id, "op": SyncOutbox.OP_CREATE}
+                    for entry_id in new_ids
+                ],
+            )
+
+        db.session.commit()
+
+        logger.info(
+            f"Applied {len(operations)} bulk operations for user {user_id} "
+            f"({len(created)} created)"
+        )
+        return results
+
     @staticmethod
     def create_entry_from_calendar_event(
         user_id: int,
@@ -227,7 +608,9 @@ class JournalService:
         )
 
         db.session.add(entry)
-        db.session.commit()
+        # The event is already on the calendar
+        with calendar_origin(db.session):
+            db.session.commit()
 
         logger.info(
             f"Journal entry {entry.id} created from calendar event {calendar_event_id} for user {user_id}"
@@ -0,0 +1,190 @@
+"""Search service for full-text queries over journal entries."""
+import html
+import logging
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import Date, text
+from models import db
+from models.search_index import FTS_TABLE, configured_tokenizer, search_index_exists
+from utils.pagination import encode_search_cursor, decode_search_cursor
+from utils.validation import ValidationError
+
+logger = logging.getLogger(__name__)
+
+# Private-use characters mark matches inside snippets, so the text can be
+# HTML-escaped before the markers are turned into <mark> tags
+_MATCH_START = "\ue000"
+_MATCH_END = "\ue001"
+SNIPPET_TOKENS = 16
+TITLE_WEIGHT = 10
+MAX_QUERY_LENGTH = 200
+
+
+class SearchService:
+    """Service for ranked full-text search over journal entries."""
+
+    @staticmethod
+    def is_available() -> bool:
+        """
+        Check whether the database has a full-text search index.
+
+        Returns:
+            True on SQLite with the FTS5 table created
+        """
+        return search_index_exists(db.session.connection())
+
+    @staticmethod
+    def search_entries(
+        user_id: int,
+        query: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> Dict:
+        """
+        Search a user's entries, best matches first.
+
+        Results are ranked by how often the terms occur in each entry, a
+        title hit counting ten content hits. The score is computed from the
+        entry's own text only, not from statistics over the shared index
+        (as BM25 would be), so other users' writes never reorder a user's
+        results or move their cursor. Terms are ANDed; terms too short for
+        the tokenizer are matched as substrings of the user's entries
+        instead.
+
+        Args:
+            user_id: ID of the user (for owner verification)
+            query: Free-text query
+            start_date: Only include entries on or after this date
+            end_date: Only include entries on or before this date
+            limit: Maximum number of results to return
+            cursor: Opaque cursor from a previous page's next_cursor
+
+        Returns:
+            Dictionary with "results" (id, title, date, sync_status,
+            snippet, score) and "next_cursor" (None on the last page)
+
+        Raises:
+            ValidationError: If the query or cursor is invalid
+        """
+        match, like_terms = SearchService._parse_query(query)
+
+        params = {"user_id": user_id, "limit": limit + 1}
+        where = ["e.user_id = :user_id"]
+        if match:
+            # highlight() reads the matched row alone; bm25() would read
+            # index-wide statistics that every user's writes change
+            score = (
+                f"({TITLE_WEIGHT} * {SearchService._hits(0)} + {SearchService._hits(1)})"
+            )
+            source = f"{FTS_TABLE} JOIN journal_entries e ON e.id = {FTS_TABLE}.rowid"
+            where.insert(0, f"{FTS_TABLE} MATCH :match")
+            params["match"] = match
+        else:
+            score = "0"
+            source = "journal_entries e"
+
+        for i, term in enumerate(like_terms):
+            where.append(
+                f"(e.title LIKE :like{i} ESCAPE '\\' OR e.content LIKE :like{i} ESCAPE '\\')"
+            )
+            params[f"like{i}"] = f"%{SearchService._escape_like(term)}%"
+        if start_date:
+            where.append("e.date >= :start_date")
+            params["start_date"] = start_date.isoformat()
+        if end_date:
+            where.append("e.date <= :end_date")
+            params["end_date"] = end_date.isoformat()
+        if cursor:
+            after_score, after_id = decode_search_cursor(cursor)
+            where.append(
+                f"({score} < :after_score OR ({score} = :after_score AND e.id < :after_id))"
+            )
+            params.update(after_score=after_score, after_id=after_id)
+
+        page = (
+            f"SELECT e.id AS id, {score} AS score FROM {source} "
+            f"WHERE {' AND '.join(where)} ORDER BY score DESC, e.id DESC LIMIT :limit"
+        )
+        # Snippets are built only for the page, not for every match
+        if match:
+            snippet = (
+                f"snippet({FTS_TABLE}, -1, '{_MATCH_START}', '{_MATCH_END}', "
+                f"'…', {SNIPPET_TOKENS})"
+            )
+            outer = (
+                f"FROM ({page}) AS page JOIN {FTS_TABLE} ON {FTS_TABLE}.rowid = page.id "
+                f"JOIN journal_entries e ON e.id = page.id "
+                f"WHERE {FTS_TABLE} MATCH :match"
+            )
+        else:
+            snippet = f"substr(e.content, 1, {SNIPPET_TOKENS * 8})"
+            outer = f"FROM ({page}) AS page JOIN journal_entries e ON e.id = page.id"
+        sql = text(
+            f"SELECT e.id, e.title, e.date, e.sync_status, {snippet} AS snippet, "
+            f"page.score AS score {outer} ORDER BY page.score DESC, e.id DESC"
+        ).columns(date=Date)
+        rows = db.session.execute(sql, params).all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_search_cursor(rows[-1].score, rows[-1].id)
+
+        results = [
+            {
+                "id": row.id,
+                "title": row.title,
+                "date": row.date,
+                "sync_status": row.sync_status,
+                "snippet": SearchService._highlight(row.snippet),
+                "score": float(row.score),
+            }
+            for row in rows
+        ]
+        logger.debug(f"Search for user {user_id} returned {len(results)} results")
+        return {"results": results, "next_cursor": next_cursor}
+
+    @staticmethod
+    def _parse_query(query: str) -> Tuple[str, List[str]]:
+        """
+        Split a query into an FTS5 MATCH expression and substring terms.
+
+        Each term is quoted so user input never reaches the FTS5 query
+        syntax. The trigram tokenizer cannot match terms under three
+        characters (e.g. most two-character Chinese words), so those are
+        returned separately for a LIKE filter.
+        """
+        query = (query or "").strip()
+        if not query:
+            raise ValidationError("Search query is required")
+        if len(query) > MAX_QUERY_LENGTH:
+            raise ValidationError(
+                f"Search query must be at most {MAX_QUERY_LENGTH} characters"
+            )
+
+        min_length = 3 if configured_tokenizer().startswith("trigram") else 1
+        match_terms, like_terms = [], []
+        for term in query.split():
+            if len(term) >= min_length:
+                match_terms.append('"' + term.replace('"', '""') + '"')
+            else:
+                like_terms.append(term)
+        return " ".join(match_terms), like_terms
+
+    @staticmethod
+    def _hits(column: int) -> str:
+        """SQL counting the matches highlight() marks in one FTS column."""
+        marked = f"highlight({FTS_TABLE}, {column}, '{_MATCH_START}', '')"
+        return f"(length({marked}) - length(replace({marked}, '{_MATCH_START}', '')))"
+
+    @staticmethod
+    def _escape_like(term: str) -> str:
+        return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+    @staticmethod
+    def _highlight(snippet: Optional[str]) -> str:
+        """HTML-escape a snippet and turn match markers into <mark> tags."""
+        escaped = html.escape(snippet or "")
+        return escaped.replace(_MATCH_START, "<mark>").replace(_MATCH_END, "</mark>")
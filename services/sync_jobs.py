@@ -0,0 +1,384 @@
+"""Durable queue of background calendar sync jobs and the worker that runs them."""
+import logging
+import os
+import random
+import socket
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Optional, Tuple
+from flask import current_app
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import aliased
+from models import db, SyncJob
+from services.caldav_service import CalDAVService
+from services.journal_service import JournalService
+
+logger = logging.getLogger(__name__)
+
+# PostgreSQL advisory lock key held while a job is claimed
+CLAIM_LOCK_KEY = 0x53594E43  # "SYNC"
+
+
+class SyncJobService:
+    """Service for queueing calendar syncs and running them outside requests."""
+
+    @staticmethod
+    def enqueue(user_id: int, kind: str, payload: Optional[Dict] = None) -> SyncJob:
+        """
+        Queue a sync job for a user.
+
+        A job of the same kind and payload that is still waiting in the
+        queue is returned instead of adding another, so repeated clicks
+        cost one sync.
+
+        Args:
+            user_id: ID of the user
+            kind: SyncJob.KIND_SYNC_ALL or SyncJob.KIND_SYNC_ENTRY
+            payload: Job arguments (see SyncJob)
+
+        Returns:
+            The queued SyncJob
+        """
+        waiting = db.session.scalars(
+            select(SyncJob).where(
+                SyncJob.user_id == user_id,
+                SyncJob.kind == kind,
+                SyncJob.status == "queued",
+            )
+        )
+        for job in waiting:
+            if job.payload == payload:
+                logger.info(f"Reusing queued sync job {job.id} for user {user_id}")
+                return job
+
+        job = SyncJob(
+            user_id=user_id,
+            kind=kind,
+            payload=payload,
+            max_attempts=current_app.config.get("SYNC_JOB_MAX_ATTEMPTS", 5),
+        )
+        db.session.add(job)
+        db.session.commit()
+        logger.info(f"Queued sync job {job.id} ({kind}) for user {user_id}")
+        return job
+
+    @staticmethod
+    def get_job(job_id: int, user_id: int) -> Optional[SyncJob]:
+        """
+        Get a user's sync job.
+
+        Args:
+            job_id: ID of the job
+            user_id: ID of the user (for authorization)
+
+        Returns:
+            SyncJob if found and owned by the user, None otherwise
+        """
+        job = db.session.get(SyncJob, job_id)
+        if job is None or job.user_id != user_id:
+            return None
+        return job
+
+    @staticmethod
+    def claim(worker_id: str, job_id: Optional[int] = None) -> Optional[int]:
+        """
+        Take the oldest due job (or the given one, if due) off the queue.
+
+        The job is marked running in a single UPDATE that re-checks its
+        status, so two workers never run the same job. A user runs one job
+        at a time, and no job is claimed while SYNC_MAX_RUNNING_JOBS are
+        running, so a burst of users cannot open unbounded CalDAV sessions;
+        the others wait their turn in run_at order.
+
+        Both limits count the running jobs inside the claiming UPDATE, so
+        claims must not overlap. SQLite serializes them with its write
+        lock. On PostgreSQL, READ COMMITTED would let two workers count the
+        same running jobs and both claim, so each claim first takes a
+        transaction-scoped advisory lock; the UPDATE then sees every claim
+        committed before it.
+
+        Args:
+            worker_id: Name of the claiming worker
+            job_id: Claim only this job
+
+        Returns:
+            ID of the claimed job, or None if there was nothing to claim
+        """
+        if db.session.get_bind().dialect.name == "postgresql":
+            # Released by the commit below
+            db.session.execute(select(func.pg_advisory_xact_lock(CLAIM_LOCK_KEY)))
+        now = _now()
+        running = aliased(SyncJob)
+        claimable = (
+            SyncJob.status == "queued",
+            SyncJob.run_at <= now,
+            ~select(running.id)
+            .where(running.user_id == SyncJob.user_id, running.status == "running")
+            .exists(),
+            select(func.count(running.id)).where(running.status == "running").scalar_subquery()
+            < current_app.config.get("SYNC_MAX_RUNNING_JOBS", 4),
+        )
+        if job_id is None:
+            job_id = (
+                select(SyncJob.id)
+                .where(*claimable)
+                .order_by(SyncJob.run_at, SyncJob.id)
+                .limit(1)
+                .with_for_update(skip_locked=True)
+                .scalar_subquery()
+            )
+        claimed = db.session.execute(
+            update(SyncJob)
+            .where(SyncJob.id == job_id, *claimable)
+            .values(
+                status="running",
+                locked_by=worker_id,
+                locked_at=now,
+                attempts=SyncJob.attempts + 1,
+            )
+            .returning(SyncJob.id)
+            .execution_options(synchronize_session=False)
+        ).scalar()
+        db.session.commit()
+        return claimed
+
+    @staticmethod
+    def release_stale_jobs() -> int:
+        """
+        Return jobs whose worker stopped mid-run to the queue.
+
+        A job running for longer than SYNC_JOB_LEASE seconds is requeued,
+        or failed if it has used up its attempts.
+
+        Returns:
+            Number of jobs released
+        """
+        now = _now()
+        expired = now - timedelta(seconds=current_app.config.get("SYNC_JOB_LEASE", 900))
+        stale = (SyncJob.status == "running", SyncJob.locked_at < expired)
+        failed = db.session.execute(
+            update(SyncJob)
+            .where(*stale, SyncJob.attempts >= SyncJob.max_attempts)
+            .values(status="failed", last_error="Worker stopped while running the job", finished_at=now)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        requeued = db.session.execute(
+            update(SyncJob)
+            .where(*stale)
+            .values(status="queued", run_at=now, locked_by=None, locked_at=None)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        db.session.commit()
+        if failed or requeued:
+            logger.warning(f"Released stale sync jobs: {requeued} requeued, {failed} failed")
+        return failed + requeued
+
+    @staticmethod
+    def run_job(job_id: int) -> SyncJob:
+        """
+        Run a claimed job and record its outcome.
+
+        Calendar-full and permission errors (ValueError) fail the job at
+        once; other errors and partial failures are retried after
+        backoff_delay() until max_attempts is reached.
+
+        Args:
+            job_id: ID of a job in the running state
+
+        Returns:
+            The job with its new status
+        """
+        job = db.session.get(SyncJob, job_id)
+        user_id, kind, payload = job.user_id, job.kind, job.payload or {}
+        started = time.perf_counter()
+        try:
+            result, retry_reason = SyncJobService._execute(user_id, kind, payload)
+        except ValueError as e:
+            db.session.rollback()
+            return SyncJobService._finish(job_id, "failed", error=str(e))
+        except Exception as e:
+            logger.error(f"Sync job {job_id} raised: {str(e)}", exc_info=True)
+            db.session.rollback()
+            return SyncJobService._retry_or_fail(job_id, str(e))
+
+        logger.info(
+            f"Sync job {job_id} ({kind}) for user {user_id} ran in "
+            f"{(time.perf_counter() - started) * 1000:.0f} ms"
+        )
+        if retry_reason:
+            return SyncJobService._retry_or_fail(job_id, retry_reason, result)
+        return SyncJobService._finish(job_id, "succeeded", result=result)
+
+    @staticmethod
+    def _execute(user_id: int, kind: str, payload: Dict) -> Tuple[Dict, Optional[str]]:
+        """
+        Do the work of a job.
+
+        Returns:
+            Tuple of (result, reason to retry or None)
+
+        Raises:
+            ValueError: For failures that retrying cannot fix
+        """
+        if kind == SyncJob.KIND_SYNC_ALL:
+            if CalDAVService.is_offline():
+                return {}, "CalDAV server is offline"
+            result = CalDAVService.sync_all_pending_entries(user_id, payload.get("entry_ids"))
+            result["pulled"] = CalDAVService.pull_calendar_changes(user_id)
+            if result["failed"]:
+                return result, f"{result['failed']} entries failed to sync"
+            return result, None
+
+        if kind == SyncJob.KIND_AUTO_SYNC:
+            if CalDAVService.is_offline():
+                return {}, "CalDAV server is offline"
+            result = CalDAVService.sync_all_pending_entries(user_id)
+            if result["failed"]:
+                return result, f"{result['failed']} entries failed to sync"
+            return result, None
+
+        if kind == SyncJob.KIND_SYNC_ENTRY:
+            entry = JournalService.get_entry(payload.get("entry_id"), user_id)
+            if entry is None:
+                raise ValueError("Journal entry not found")
+            if not CalDAVService.sync_entry_to_calendar(entry):
+                return {}, "Failed to sync entry"
+            return {"entry": entry.to_dict()}, None
+
+        raise ValueError(f"Unknown sync job kind: {kind}")
+
+    @staticmethod
+    def _retry_or_fail(job_id: int, error: str, result: Optional[Dict] = None) -> SyncJob:
+        job = db.session.get(SyncJob, job_id)
+        if job.attempts >= job.max_attempts:
+            return SyncJobService._finish(job_id, "failed", result=result, error=error)
+        delay = SyncJobService.backoff_delay(job.attempts)
+        job.status = "queued"
+        job.run_at = _now() + timedelta(seconds=delay)
+        job.locked_by = None
+        job.locked_at = None
+        job.result = result
+        job.last_error = error
+        db.session.commit()
+        logger.warning(
+            f"Sync job {job_id} attempt {job.attempts}/{job.max_attempts} failed ({error}); "
+            f"retrying in {delay:.1f}s"
+        )
+        return job
+
+    @staticmethod
+    def _finish(job_id: int, status: str, result: Optional[Dict] = None, error: Optional[str] = None) -> SyncJob:
+        job = db.session.get(SyncJob, job_id)
+        job.status = status
+        job.result = result
+        job.last_error = error
+        job.locked_by = None
+        job.locked_at = None
+        job.finished_at = _now()
+        db.session.commit()
+        log = logger.info if status == "succeeded" else logger.warning
+        log(f"Sync job {job_id} {status} after {job.attempts} attempts" + (f": {error}" if error else ""))
+        return job
+
+    @staticmethod
+    def backoff_delay(attempt: int, rand: Callable[[], float] = random.random) -> float:
+        """
+        Seconds to wait before retrying after the given failed attempt.
+
+        Exponential (SYNC_JOB_BACKOFF_BASE doubled per attempt, capped at
+        SYNC_JOB_BACKOFF_MAX) with "equal jitter": half the delay is fixed
+        and half random, so jobs that failed together do not retry together
+        but never retry immediately.
+
+        Args:
+            attempt: Number of attempts made so far (1 for the first)
+            rand: Source of uniform numbers in [0, 1)
+
+        Returns:
+            Delay in seconds
+        """
+        config = current_app.config
+        delay = min(
+            config.get("SYNC_JOB_BACKOFF_MAX", 600),
+            config.get("SYNC_JOB_BACKOFF_BASE", 5) * 2 ** (attempt - 1),
+        )
+        return delay / 2 + rand() * delay / 2
+
+
+def default_worker_id() -> str:
+    """Name a worker after its host and process."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def run_worker(
+    worker_id: Optional[str] = None,
+    once: bool = False,
+    max_jobs: Optional[int] = None,
+    sleep: Callable[[float], None] = time.sleep,
+) -> int:
+    """
+    Claim and run sync jobs until stopped.
+
+    Must run inside an application context. Each job gets a fresh session.
+
+    Args:
+        worker_id: Name recorded on claimed jobs
+        once: Return as soon as no job is due instead of polling
+        max_jobs: Return after running this many jobs
+        sleep: Called with SYNC_WORKER_POLL_INTERVAL while the queue is empty
+
+    Returns:
+        Number of jobs run
+    """
+    worker_id = worker_id or default_worker_id()
+    poll_interval = current_app.config.get("SYNC_WORKER_POLL_INTERVAL", 2)
+    processed = 0
+    logger.info(f"Sync worker {worker_id} started")
+    while max_jobs is None or processed < max_jobs:
+        SyncJobService.release_stale_jobs()
+        job_id = SyncJobService.claim(worker_id)
+        if job_id is None:
+            if once:
+                break
+            sleep(poll_interval)
+            continue
+        try:
+            SyncJobService.run_job(job_id)
+        finally:
+            db.session.remove()
+        processed += 1
+    logger.info(f"Sync worker {worker_id} stopped after {processed} jobs")
+    return processed
+
+
+def run_after_response(response, job_id: Optional[int] = None) -> None:
+    """
+    Run a queued job in this process once the response has been sent.
+
+    Only when SYNC_JOBS_RUN_AFTER_RESPONSE is set, for hosts that cannot
+    run `flask sync-worker`; the job is claimed like a worker would, so a
+    worker that gets to it first runs it instead.
+
+    Args:
+        response: Flask response of the request that queued the job
+        job_id: ID of the queued job; None runs the oldest due job, if any
+    """
+    if not current_app.config.get("SYNC_JOBS_RUN_AFTER_RESPONSE", False):
+        return
+    app = current_app._get_current_object()
+
+    def _run():
+        with app.app_context():
+            try:
+                claimed = SyncJobService.claim(f"inline:{os.getpid()}", job_id)
+                if claimed is not None:
+                    SyncJobService.run_job(claimed)
+            finally:
+                db.session.remove()
+
+    response.call_on_close(_run)
+
+
+def _now() -> datetime:
+    """Current UTC time, naive like the DateTime columns store it."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
@@ -0,0 +1,204 @@
+"""TTL cache of authenticated users, invalidated by per-user versions."""
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+from flask import current_app, has_app_context
+from sqlalchemy import event
+from sqlalchemy.orm import Session, make_transient_to_detached
+from werkzeug.utils import import_string
+from models import db, User
+
+logger = logging.getLogger(__name__)
+
+_PENDING_KEY = "user_cache_invalidate"
+
+# Columns kept in the cache, which is all requests read from current_user;
+# the password hashes in particular never reach a (possibly shared) store
+CACHED_COLUMNS = ("id", "username", "email", "calendar_sync_enabled", "calendar_sync_mode")
+
+
+class UserCacheBackend(ABC):
+    """
+    Storage interface for the user cache.
+
+    The default keeps entries in process memory. A shared store (Redis,
+    memcached, ...) implementing these four methods makes invalidations
+    visible to every worker; values are plain dicts of column values.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Return the value stored under key, or None if missing or expired."""
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Store value under key, expiring after ttl seconds (None: never)."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove key if present."""
+
+    @abstractmethod
+    def incr(self, key: str) -> int:
+        """Atomically increment the integer under key and return the new value."""
+
+
+class InProcessUserCacheBackend(UserCacheBackend):
+    """Thread-safe in-memory backend with TTL expiry and an LRU size bound."""
+
+    def __init__(self, max_entries: int = 1024, clock=time.monotonic):
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_entries = max_entries
+        self._clock = clock
+
+    def get(self, key):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            value, expires_at = item
+            if expires_at is not None and expires_at <= self._clock():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl=None):
+        expires_at = self._clock() + ttl if ttl else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self._max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def incr(self, key):
+        with self._lock:
+            value = (self._data.get(key, (0, None))[0] or 0) + 1
+            self._data[key] = (value, None)
+            self._data.move_to_end(key)
+            return value
+
+
+class UserCache:
+    """
+    Caches User column values so load_user can skip the per-request SELECT.
+
+    Only CACHED_COLUMNS are stored; a cached user loads any other column
+    from the database on first access.
+
+    Each entry records the user's version at the time it was read; an
+    invalidation bumps the version, so an entry written by a request that
+    read the row before a change committed is never served.
+    """
+
+    def __init__(self, backend: UserCacheBackend, ttl: int):
+        self.backend = backend
+        self.ttl = ttl
+
+    @staticmethod
+    def _key(user_id: int) -> str:
+        return f"user:{user_id}"
+
+    @staticmethod
+    def _version_key(user_id: int) -> str:
+        return f"user:{user_id}:version"
+
+    def load(self, user_id: int) -> Optional[User]:
+        """
+        Return the user, from the cache when possible.
+
+        A cached user is attached to the current session without a
+        query, so it behaves like a loaded instance.
+
+        Args:
+            user_id: ID of the user
+
+        Returns:
+            User object, or None if no such user exists
+        """
+        version = self.backend.get(self._version_key(user_id)) or 0
+        cached = self.backend.get(self._key(user_id))
+        if cached is not None and cached["version"] == version:
+            user = User(**cached["data"])
+            make_transient_to_detached(user)
+            return db.session.merge(user, load=False)
+
+        user = db.session.get(User, user_id)
+        if user is not None:
+            data = {column: getattr(user, column) for column in CACHED_COLUMNS}
+            self.backend.set(
+                self._key(user_id), {"version": version, "data": data}, self.ttl
+            )
+        return user
+
+    def invalidate(self, user_id: int) -> None:
+        """
+        Drop a user's cached entry and reject any in-flight refills.
+
+        Args:
+            user_id: ID of the user
+        """
+        self.backend.incr(self._version_key(user_id))
+        self.backend.delete(self._key(user_id))
+        logger.debug(f"Invalidated cached user {user_id}")
+
+
+def init_user_cache(app) -> None:
+    """
+    Install the user cache on an app according to its configuration.
+
+    USER_CACHE_TTL of 0 disables the cache; USER_CACHE_BACKEND may name a
+    UserCacheBackend subclass ("package.module:Class") to share it.
+
+    Args:
+        app: Flask application instance
+    """
+    ttl = app.config.get("USER_CACHE_TTL", 0)
+    if ttl <= 0:
+        return
+    backend_path = app.config.get("USER_CACHE_BACKEND")
+    backend = import_string(backend_path)() if backend_path else InProcessUserCacheBackend()
+    app.extensions["user_cache"] = UserCache(backend, ttl)
+
+
+def get_user_cache() -> Optional[UserCache]:
+    """Return the current app's user cache, or None if it is disabled."""
+    if not has_app_context():
+        return None
+    return current_app.extensions.get("user_cache")
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_users(session, flush_context):
+    """Remember users updated or deleted by this flush."""
+    changed = {
+        obj.id
+        for obj in session.dirty
+        if isinstance(obj, User) and session.is_modified(obj, include_collections=False)
+    }
+    changed.update(obj.id for obj in session.deleted if isinstance(obj, User))
+    if changed:
+        session.info.setdefault(_PENDING_KEY, set()).update(changed)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_changed_users(session):
+    """Invalidate cached users once their changes are committed."""
+    changed = session.info.pop(_PENDING_KEY, None)
+    cache = get_user_cache()
+    if changed and cache is not None:
+        for user_id in changed:
+            cache.invalidate(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changed_users(session):
+    session.info.pop(_PENDING_KEY, None)
@@ -9,9 +9,8 @@ document.addEventListener('DOMContentLoaded', function() {
     // Load current sync settings
     async function loadSyncSettings() {
         try {
-            // TODO: Implement GET /api/user/settings endpoint to load sync preferences
-            // For now, default to false
-            autoSyncCheckbox.checked = false;
+            const settings = await UserAPI.getSettings();
+            autoSyncCheckbox.checked = settings.calendar_sync_mode === 'automatic';
         } catch (error) {
             console.error('Error loading sync settings:', error);
         }
@@ -20,11 +19,10 @@ document.addEventListener('DOMContentLoaded', function() {
     // Save sync settings
     async function saveSyncSettings(enabled) {
         try {
-            // TODO: Implement PUT /api/user/settings endpoint to save sync preferences
-            // For now, just log
-            console.log('Auto sync:', enabled ? 'enabled' : 'disabled');
+            await UserAPI.updateSettings({ calendar_sync_mode: enabled ? 'automatic' : 'manual' });
         } catch (error) {
             console.error('Error saving sync settings:', error);
+            autoSyncCheckbox.checked = !enabled;
             alert('保存设置失败: ' + error.message);
         }
     }
@@ -49,8 +47,13 @@ document.addEventListener('DOMContentLoaded', function() {
 
             try {
                 const result = await SyncAPI.sync();
-                syncStatusMessage.textContent = `同步完成：成功 ${result.success} 条，失败 ${result.failed} 条`;
-                syncStatusMessage.className = 'sync-status-message success';
+                if (result.queued) {
+                    syncStatusMessage.textContent = '同步已排队，将在后台继续';
+                    syncStatusMessage.className = 'sync-status-message pending';
+                } else {
+                    syncStatusMessage.textContent = `同步完成：成功 ${result.success} 条，失败 ${result.failed} 条`;
+                    syncStatusMessage.className = 'sync-status-message success';
+                }
                 
                 // Refresh journal list if on home page
                 if (window.location.pathname === '/' || window.location.pathname === '/home') {
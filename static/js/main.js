@@ -4,38 +4,85 @@
 // API Base URL
 const API_BASE = '/api';
 
+// Small ETag cache for journal GETs: revalidate with If-None-Match and reuse
+// the cached body when the server answers 304 Not Modified
+const ConditionalCache = {
+    maxEntries: 50,
+    entries: new Map(),
+
+    async fetchJson(url) {
+        const cached = this.entries.get(url);
+        const headers = cached ? { 'If-None-Match': cached.etag } : {};
+        const response = await fetch(url, {
+            credentials: 'same-origin',
+            cache: 'no-store', // Validation is handled here, not by the HTTP cache
+            headers
+        });
+        if (response.status === 304 && cached) {
+            // Refresh recency so frequently viewed pages stay cached
+            this.entries.delete(url);
+            this.entries.set(url, cached);
+            return { response, data: cached.data };
+        }
+        if (!response.ok) {
+            return { response, data: null };
+        }
+        const data = await response.json();
+        const etag = response.headers.get('ETag');
+        if (etag) {
+            this.entries.delete(url);
+            this.entries.set(url, { etag, data });
+            if (this.entries.size > this.maxEntries) {
+                this.entries.delete(this.entries.keys().next().value);
+            }
+        }
+        return { response, data };
+    }
+};
+
 // Journal API functions
 const JournalAPI = {
     async listEntries(date = null) {
         const url = date 
             ? `${API_BASE}/journal/entries?date=${date}`
             : `${API_BASE}/journal/entries`;
-        const response = await fetch(url, {
-            credentials: 'same-origin' // Include cookies for authentication
-        });
-        if (!response.ok) {
+        const { response, data } = await ConditionalCache.fetchJson(url);
+        if (!data) {
             if (response.status === 401) {
                 window.location.href = '/login';
                 return;
             }
             throw new Error('Failed to fetch entries');
         }
-        const data = await response.json();
         return data.entries || data; // Return entries array directly
     },
 
+    // Fetch one page of entry summaries; pass the previous page's next_cursor to continue
+    async listEntriesPage(date = null, cursor = null) {
+        const params = new URLSearchParams({ view: 'summary' });
+        if (date) params.set('date', date);
+        if (cursor) params.set('cursor', cursor);
+        const { response, data } = await ConditionalCache.fetchJson(`${API_BASE}/journal/entries?${params}`);
+        if (!data) {
+            if (response.status === 401) {
+                window.location.href = '/login';
+                return;
+            }
+            throw new Error('Failed to fetch entries');
+        }
+        return data;
+    },
+
     async getEntry(id) {
-        const response = await fetch(`${API_BASE}/journal/entries/${id}`, {
-            credentials: 'same-origin'
-        });
-        if (!response.ok) {
+        const { response, data } = await ConditionalCache.fetchJson(`${API_BASE}/journal/entries/${id}`);
+        if (!data) {
             if (response.status === 401) {
                 window.location.href = '/login';
                 return;
             }
             throw new Error('Failed to fetch entry');
         }
-        return response.json();
+        return data;
     },
 
     async createEntry(entry) {
@@ -99,6 +146,31 @@ const AuthAPI = {
     }
 };
 
+// User settings API functions
+const UserAPI = {
+    async getSettings() {
+        const response = await fetch(`${API_BASE}/user/settings`, {
+            credentials: 'same-origin'
+        });
+        if (!response.ok) throw new Error('Failed to load settings');
+        return response.json();
+    },
+
+    async updateSettings(settings) {
+        const response = await fetch(`${API_BASE}/user/settings`, {
+            method: 'PUT',
+            headers: { 'Content-Type': 'application/json' },
+            credentials: 'same-origin',
+            body: JSON.stringify(settings)
+        });
+        if (!response.ok) {
+            const error = await response.json().catch(() => ({ error: 'Failed to save settings' }));
+            throw new Error(error.error || 'Failed to save settings');
+        }
+        return response.json();
+    }
+};
+
 // Sync API functions
 const SyncAPI = {
     async sync() {
@@ -110,7 +182,8 @@ const SyncAPI = {
             const error = await response.json().catch(() => ({ error: 'Sync failed' }));
             throw new Error(error.error || 'Sync failed');
         }
-        return response.json();
+        const data = await response.json();
+        return this.waitForJob(data.job);
     },
 
     async syncEntry(entryId) {
@@ -122,7 +195,30 @@ const SyncAPI = {
             const error = await response.json().catch(() => ({ error: 'Sync failed' }));
             throw new Error(error.error || 'Sync failed');
         }
-        return response.json();
+        const data = await response.json();
+        return this.waitForJob(data.job);
+    },
+
+    // Sync requests are queued as background jobs; poll the job until it
+    // finishes and return its result. A job still waiting after timeoutMs
+    // (e.g. retrying while the server is offline) resolves as { queued: true }.
+    async waitForJob(job, timeoutMs = 60000, intervalMs = 1000) {
+        const deadline = Date.now() + timeoutMs;
+        while (job.status === 'queued' || job.status === 'running') {
+            if (Date.now() >= deadline) {
+                return { queued: true, job };
+            }
+            await new Promise(resolve => setTimeout(resolve, intervalMs));
+            const response = await fetch(`${API_BASE}/calendar/jobs/${job.id}`, {
+                credentials: 'same-origin'
+            });
+            if (!response.ok) throw new Error('Failed to get sync status');
+            job = await response.json();
+        }
+        if (job.status === 'failed') {
+            throw new Error(job.error || 'Sync failed');
+        }
+        return job.result;
     },
 
     async getSyncStatus() {
@@ -467,16 +563,49 @@ document.addEventListener('DOMContentLoaded', function() {
     }
 });
 
-// Load journal list
-async function loadJournalList(listId, date = null) {
+// Render a single journal list item
+function renderJournalEntry(entry, isBatchMode) {
+    // Sync status indicator (T079)
+    let syncStatusIcon = '';
+    if (entry.sync_status === 'synced') {
+        syncStatusIcon = '<span class="sync-status synced" title="已同步">✓</span>';
+    } else if (entry.sync_status === 'sync_pending') {
+        syncStatusIcon = '<span class="sync-status pending" title="待同步">⏳</span>';
+    } else if (entry.sync_status === 'sync_error') {
+        syncStatusIcon = '<span class="sync-status error" title="同步失败">⚠</span>';
+    }
+
+    // Batch export checkbox (T091)
+    const checkbox = isBatchMode
+        ? `<input type="checkbox" class="entry-checkbox" data-entry-id="${entry.id}" onclick="event.stopPropagation();">`
+        : '';
+
+    return `
+            <div class="journal-entry ${isBatchMode ? 'batch-mode' : ''}" onclick="${isBatchMode ? '' : `window.location.href='/entry/${entry.id}'`}">
+                ${checkbox}
+                <div class="journal-entry-header">
+                    <div class="journal-entry-title">${entry.title || '无标题'}</div>
+                    ${syncStatusIcon}
+                </div>
+                <div class="journal-entry-date">${Utils.formatDate(entry.date)}</div>
+                <div class="journal-entry-content">${entry.preview ?? Utils.truncateText(entry.content || '')}</div>
+            </div>
+        `;
+}
+
+// Load journal list; with a cursor the next page is appended to the current list
+async function loadJournalList(listId, date = null, cursor = null) {
     const listElement = document.getElementById(`journalList${listId.charAt(0).toUpperCase() + listId.slice(1)}`);
     if (!listElement) return;
     
     try {
-        listElement.innerHTML = '<div class="empty-state">加载中...</div>';
-        const entries = await JournalAPI.listEntries(date);
+        if (!cursor) {
+            listElement.innerHTML = '<div class="empty-state">加载中...</div>';
+        }
+        const page = await JournalAPI.listEntriesPage(date, cursor);
+        const entries = page ? page.entries : [];
         
-        if (!entries || entries.length === 0) {
+        if (!cursor && (!entries || entries.length === 0)) {
             // Show appropriate empty state message based on context
             let emptyMessage = '<div class="empty-state"><div class="empty-state-icon">📝</div><div class="empty-state-text">暂无日志</div>';
             
@@ -496,37 +625,29 @@ async function loadJournalList(listId, date = null) {
         const batchExportControls = document.getElementById('batchExportControls');
         const isBatchMode = batchExportControls && batchExportControls.style.display !== 'none';
         
-        listElement.innerHTML = entries.map(entry => {
-            // Sync status indicator (T079)
-            let syncStatusIcon = '';
-            if (entry.sync_status === 'synced') {
-                syncStatusIcon = '<span class="sync-status synced" title="已同步">✓</span>';
-            } else if (entry.sync_status === 'sync_pending') {
-                syncStatusIcon = '<span class="sync-status pending" title="待同步">⏳</span>';
-            } else if (entry.sync_status === 'sync_error') {
-                syncStatusIcon = '<span class="sync-status error" title="同步失败">⚠</span>';
-            }
-            
-            // Batch export checkbox (T091)
-            const checkbox = isBatchMode 
-                ? `<input type="checkbox" class="entry-checkbox" data-entry-id="${entry.id}" onclick="event.stopPropagation();">`
-                : '';
-            
-            return `
-            <div class="journal-entry ${isBatchMode ? 'batch-mode' : ''}" onclick="${isBatchMode ? '' : `window.location.href='/entry/${entry.id}'`}">
-                ${checkbox}
-                <div class="journal-entry-header">
-                    <div class="journal-entry-title">${entry.title || '无标题'}</div>
-                    ${syncStatusIcon}
-                </div>
-                <div class="journal-entry-date">${Utils.formatDate(entry.date)}</div>
-                <div class="journal-entry-content">${Utils.truncateText(entry.content || '')}</div>
-            </div>
-        `;
-        }).join('');
+        const html = entries.map(entry => renderJournalEntry(entry, isBatchMode)).join('');
+        const existingLoadMore = listElement.querySelector('.load-more-btn');
+        if (existingLoadMore) existingLoadMore.remove();
+        if (cursor) {
+            listElement.insertAdjacentHTML('beforeend', html);
+        } else {
+            listElement.innerHTML = html;
+        }
+
+        // Keyset pagination: offer the next page while the server returns a cursor
+        if (page.next_cursor) {
+            const loadMoreBtn = document.createElement('button');
+            loadMoreBtn.className = 'btn btn-secondary load-more-btn';
+            loadMoreBtn.textContent = '加载更多';
+            loadMoreBtn.addEventListener('click', function() {
+                this.disabled = true;
+                this.textContent = '加载中...';
+                loadJournalList(listId, date, page.next_cursor);
+            });
+            listElement.appendChild(loadMoreBtn);
+        }
     } catch (error) {
         console.error('Error loading journal list:', error);
         listElement.innerHTML = `<div class="empty-state"><div class="empty-state-icon">⚠️</div><div class="empty-state-text">加载失败: ${error.message}</div></div>`;
     }
 }
-
@@ -0,0 +1,312 @@
+"""In-process CalDAV stand-in server for tests and benchmarks.
+
+Stores PUT event bodies in memory and counts accepted TCP connections, so
+tests can check that consecutive requests reuse a pooled connection. An
+injected latency and the peak number of requests in flight let tests
+measure parallel pushes.
+
+Every change bumps a collection version that serves as the CTag and, as
+http://stub/sync/<version>, as the RFC 6578 sync-token; PROPFIND and the
+sync-collection and calendar-multiget REPORTs are answered from it.
+edit() and remove() change events the way another client (the iPhone)
+would. PUTs honour If-Match, answering 412 when the event's ETag differs,
+and stored PUTs are counted in puts.
+"""
+import base64
+import socket
+import ssl
+import threading
+import time
+import xml.etree.ElementTree as ET
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+from xml.sax.saxutils import escape
+
+DAV = "{DAV:}"
+CALDAV = "{urn:ietf:params:xml:ns:caldav}"
+SYNC_TOKEN_PREFIX = "http://stub/sync/"
+
+
+class CalDAVStubServer:
+    """
+    Minimal CalDAV collection served over HTTP(S) on localhost.
+
+    Args:
+        username / password: Require HTTP Basic auth when set
+        certfile / keyfile: Serve HTTPS with this certificate when set
+        put_status: Status returned for PUT (e.g. 507 to simulate a full
+            calendar); None stores the event and returns 201/204
+        latency: Seconds each request takes before it is answered
+        sync_collection: Support sync-tokens; when False only the CTag is
+            advertised and sync-collection REPORTs are refused
+    """
+
+    def __init__(
+        self,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        certfile: Optional[str] = None,
+        keyfile: Optional[str] = None,
+        put_status: Optional[int] = None,
+        latency: float = 0,
+        sync_collection: bool = True,
+    ):
+        self.events: Dict[str, str] = {}
+        self.version = 0
+        # path -> collection version of its last change, and of its deletion
+        self.changed: Dict[str, int] = {}
+        self.deleted: Dict[str, int] = {}
+        self.sync_collection = sync_collection
+        self.reports = []
+        self.connections = 0
+        self.requests = 0
+        self.puts = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.put_status = put_status
+        self.latency = latency
+        self._lock = threading.Lock()
+        expected_auth = None
+        if username:
+            token = base64.b64encode(f"{username}:{password}".encode()).decode()
+            expected_auth = f"Basic {token}"
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                # Headers and body go out in separate writes; without this
+                # Nagle's algorithm stalls each response on a delayed ACK
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                with stub._lock:
+                    stub.connections += 1
+
+            def log_message(self, format, *args):
+                pass
+
+            def _reply(self, status, headers=None, body=b""):
+                self.send_response(status)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _multistatus(self, responses, sync_token=None):
+                token = f"<D:sync-token>{sync_token}</D:sync-token>" if sync_token else ""
+                body = (
+                    '<?xml version="1.0" encoding="utf-8"?>'
+                    '<D:multistatus xmlns:D="DAV:" xmlns:C="urn:ietf:params:xml:ns:caldav" '
+                    'xmlns:CS="http://calendarserver.org/ns/">'
+                    f"{''.join(responses)}{token}</D:multistatus>"
+                )
+                self._reply(207, {"Content-Type": "application/xml; charset=utf-8"}, body.encode())
+
+            def _read_body(self):
+                return self.rfile.read(int(self.headers.get("Content-Length", 0))).decode()
+
+            def _authorized(self):
+                if expected_auth is None or self.headers.get("Authorization") == expected_auth:
+                    return True
+                self._reply(401, {"WWW-Authenticate": 'Basic realm="caldav"'})
+                return False
+
+            def _begin(self):
+                with stub._lock:
+                    stub.requests += 1
+                    stub.in_flight += 1
+                    stub.max_in_flight = max(stub.max_in_flight, stub.in_flight)
+                if stub.latency:
+                    time.sleep(stub.latency)
+
+            def _end(self):
+                with stub._lock:
+                    stub.in_flight -= 1
+
+            def do_PUT(self):
+                body = self._read_body()
+                self._begin()
+                try:
+                    self._put(body)
+                finally:
+                    self._end()
+
+            def _put(self, body):
+                if not self._authorized():
+                    return
+                if stub.put_status is not None:
+                    self._reply(stub.put_status)
+                    return
+                if_match = self.headers.get("If-Match")
+                with stub._lock:
+                    existed = self.path in stub.events
+                    current = stub.etag(self.path) if existed else None
+                if if_match and if_match != current:
+                    self._reply(412)
+                    return
+                stub.puts += 1
+                etag = stub.edit(self.path, body)
+                self._reply(204 if existed else 201, {"ETag": etag})
+
+            def do_GET(self):
+                self._begin()
+                try:
+                    if not self._authorized():
+                        return
+                    with stub._lock:
+                        body = stub.events.get(self.path)
+                        etag = stub.etag(self.path) if body is not None else None
+                    if body is None:
+                        self._reply(404)
+                        return
+                    self._reply(200, {"Content-Type": "text/calendar", "ETag": etag}, body.encode())
+                finally:
+                    self._end()
+
+            def do_DELETE(self):
+                self._begin()
+                try:
+                    self._delete()
+                finally:
+                    self._end()
+
+            def _delete(self):
+                if not self._authorized():
+                    return
+                self._reply(204 if stub.remove(self.path) else 404)
+
+            def do_PROPFIND(self):
+                self._read_body()
+                self._begin()
+                try:
+                    if not self._authorized():
+                        return
+                    with stub._lock:
+                        props = f"<CS:getctag>{stub.version}</CS:getctag>"
+                        if stub.sync_collection:
+                            props += f"<D:sync-token>{stub.sync_token}</D:sync-token>"
+                        responses = [stub._response(self.path, props)]
+                        if self.headers.get("Depth") == "1":
+                            responses += [
+                                stub._response(path, f"<D:getetag>{stub.etag(path)}</D:getetag>")
+                                for path in stub.events
+                            ]
+                    self._multistatus(responses)
+                finally:
+                    self._end()
+
+            def do_REPORT(self):
+                query = ET.fromstring(self._read_body())
+                self._begin()
+                try:
+                    if not self._authorized():
+                        return
+                    with stub._lock:
+                        stub.reports.append(query.tag.split("}")[1])
+                        if query.tag == f"{DAV}sync-collection":
+                            self._sync_collection(query)
+                        elif query.tag == f"{CALDAV}calendar-multiget":
+                            self._multiget(query)
+                        else:
+                            self._reply(501)
+                finally:
+                    self._end()
+
+            def _sync_collection(self, query):
+                token = query.findtext(f"{DAV}sync-token") or ""
+                since = 0
+                if token:
+                    since = token[len(SYNC_TOKEN_PREFIX):]
+                    if not token.startswith(SYNC_TOKEN_PREFIX) or not since.isdigit() or int(since) > stub.version:
+                        since = None
+                    else:
+                        since = int(since)
+                if not stub.sync_collection or since is None:
+                    self._reply(409 if stub.sync_collection else 501)
+                    return
+                responses = [
+                    stub._response(path, f"<D:getetag>{stub.etag(path)}</D:getetag>")
+                    for path, version in stub.changed.items()
+                    if version > since and path in stub.events
+                ]
+                responses += [
+                    f"<D:response><D:href>{escape(path)}</D:href>"
+                    "<D:status>HTTP/1.1 404 Not Found</D:status></D:response>"
+                    for path, version in stub.deleted.items()
+                    if version > since and since > 0
+                ]
+                self._multistatus(responses, stub.sync_token)
+
+            def _multiget(self, query):
+                responses = []
+                for href in query.iter(f"{DAV}href"):
+                    path = href.text
+                    if path in stub.events:
+                        props = (
+                            f"<D:getetag>{stub.etag(path)}</D:getetag>"
+                            f"<C:calendar-data>{escape(stub.events[path])}</C:calendar-data>"
+                        )
+                        responses.append(stub._response(path, props))
+                    else:
+                        responses.append(
+                            f"<D:response><D:href>{escape(path)}</D:href>"
+                            "<D:status>HTTP/1.1 404 Not Found</D:status></D:response>"
+                        )
+                self._multistatus(responses)
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self.scheme = "http"
+        if certfile:
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(certfile, keyfile)
+            self._server.socket = context.wrap_socket(self._server.socket, server_side=True)
+            self.scheme = "https"
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def sync_token(self) -> str:
+        return f"{SYNC_TOKEN_PREFIX}{self.version}"
+
+    def etag(self, path: str) -> str:
+        return f'"{self.changed[path]}"'
+
+    def edit(self, path: str, body: str) -> str:
+        """Create or replace the event at path; returns its new ETag."""
+        with self._lock:
+            self.version += 1
+            self.events[path] = body
+            self.changed[path] = self.version
+            self.deleted.pop(path, None)
+            return self.etag(path)
+
+    def remove(self, path: str) -> bool:
+        """Delete the event at path; returns whether it existed."""
+        with self._lock:
+            if self.events.pop(path, None) is None:
+                return False
+            self.version += 1
+            self.deleted[path] = self.version
+            return True
+
+    def _response(self, path: str, props: str) -> str:
+        return (
+            f"<D:response><D:href>{escape(path)}</D:href><D:propstat><D:prop>{props}</D:prop>"
+            "<D:status>HTTP/1.1 200 OK</D:status></D:propstat></D:response>"
+        )
+
+    @property
+    def url(self) -> str:
+        """URL of the calendar collection."""
+        return f"{self.scheme}://127.0.0.1:{self._server.server_address[1]}/calendars/journal/"
+
+    def start(self) -> "CalDAVStubServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,330 @@
+"""Integration tests for the incremental calendar pull against a stand-in server."""
+import pytest
+from datetime import date, datetime, timedelta, timezone
+from urllib.parse import quote
+from tests.caldav_stub import CalDAVStubServer
+
+EVENT = (
+    "BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:iPhone\r\nBEGIN:VEVENT\r\n"
+    "UID:{uid}\r\nDTSTART:{start}\r\n"
+    "SUMMARY:{title}\r\nDESCRIPTION:{description}\r\nLAST-MODIFIED:{modified}\r\n"
+    "END:VEVENT\r\nEND:VCALENDAR\r\n"
+)
+
+
+def _event(uid, title, description="", modified=None, start=None):
+    modified = modified or datetime.now(timezone.utc) + timedelta(minutes=5)
+    start = start or datetime(2026, 1, 1, 9, tzinfo=timezone.utc)
+    return EVENT.format(
+        uid=uid,
+        title=title,
+        description=description,
+        modified=modified.strftime("%Y%m%dT%H%M%SZ"),
+        start=start.strftime("%Y%m%dT%H%M%SZ"),
+    )
+
+
+def _make_server(**kwargs):
+    return CalDAVStubServer(**kwargs).start()
+
+
+@pytest.fixture
+def caldav_server():
+    server = _make_server()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def pull_app(app, caldav_server):
+    """App syncing to the stand-in server, with an always-online probe."""
+    from services.connectivity import HealthTracker
+
+    app.config.update(CALDAV_SERVER_URL=caldav_server.url, CALDAV_MULTIGET_BATCH_SIZE=100)
+    app.extensions["caldav_health"] = HealthTracker(probe=lambda host, port, timeout: True)
+    yield app
+    transports, _ = app.extensions["caldav_transports"]
+    for transport in transports.values():
+        transport.close()
+
+
+def _pushed_entry(user_id, content="Content"):
+    """Create an entry and push it, returning it with its event path."""
+    from services.caldav_service import CalDAVService
+    from services.journal_service import JournalService
+
+    entry = JournalService.create_entry(user_id, "Original title", content, date.today())
+    CalDAVService.sync_entry_to_calendar(entry)
+    return entry, f"/calendars/journal/{quote(entry.calendar_event_id, safe='')}.ics"
+
+
+class TestCalendarPull:
+    """Test cases for CalDAVService.pull_calendar_changes."""
+
+    def test_unchanged_calendar_costs_one_request(self, pull_app, caldav_server, user):
+        """Once pulled, a calendar with no changes is checked with one PROPFIND."""
+        from services.caldav_service import CalDAVService
+
+        for i in range(250):
+            caldav_server.edit(f"/calendars/journal/other-{i}.ics", _event(f"other-{i}", f"Event {i}"))
+
+        with pull_app.app_context():
+            first = CalDAVService.pull_calendar_changes(user.id)
+            assert first["changed"] == 250
+            assert caldav_server.reports == ["sync-collection"] + ["calendar-multiget"] * 3
+
+            requests = caldav_server.requests
+            second = CalDAVService.pull_calendar_changes(user.id)
+
+        assert second == {"changed": 0, "updated": 0, "deleted": 0, "unchanged": True}
+        assert caldav_server.requests == requests + 1
+
+    def test_remote_edit_updates_only_changed_fields(self, pull_app, caldav_server, user):
+        """A title edited on the iPhone is pulled; long content is not truncated."""
+        from models import SyncOutbox
+        from services.caldav_service import CalDAVService
+
+        long_content = " ".join(["Long content."] * 100)
+        with pull_app.app_context():
+            entry, path = _pushed_entry(user.id, long_content)
+            CalDAVService.pull_calendar_changes(user.id)
+            caldav_server.reports.clear()
+
+            from services.ics_generator import ICSGenerator
+
+            caldav_server.edit(
+                path,
+                _event(
+                    entry.calendar_event_id,
+                    "Renamed on iPhone",
+                    ICSGenerator.event_description(long_content).replace("\n", "\\n"),
+                ),
+            )
+            result = CalDAVService.pull_calendar_changes(user.id)
+
+            assert (result["changed"], result["updated"]) == (1, 1)
+            assert caldav_server.reports == ["sync-collection", "calendar-multiget"]
+            assert entry.title == "Renamed on iPhone"
+            assert entry.content == long_content
+            assert entry.sync_status == "synced"
+            # The pulled edit is not queued to be pushed back
+            assert SyncOutbox.query.count() == 0
+
+    def test_older_remote_edit_loses_to_local_edit(self, pull_app, caldav_server, user):
+        """Last-write-wins: an event older than the entry is not applied."""
+        from services.caldav_service import CalDAVService
+
+        with pull_app.app_context():
+            entry, path = _pushed_entry(user.id)
+            long_ago = datetime(2020, 1, 1, tzinfo=timezone.utc)
+            caldav_server.edit(path, _event(entry.calendar_event_id, "Stale", modified=long_ago))
+            result = CalDAVService.pull_calendar_changes(user.id)
+
+            assert result["updated"] == 0
+            assert entry.title == "Original title"
+
+    def test_remote_delete_removes_linked_entry(self, pull_app, caldav_server, user):
+        """A deletion reported by sync-collection deletes the linked entry (FR-024)."""
+        from models import db, JournalEntry, SyncOutbox
+        from services.caldav_service import CalDAVService
+
+        with pull_app.app_context():
+            entry, path = _pushed_entry(user.id)
+            entry_id = entry.id
+            CalDAVService.pull_calendar_changes(user.id)
+
+            caldav_server.remove(path)
+            result = CalDAVService.pull_calendar_changes(user.id)
+
+            assert result["deleted"] == 1
+            assert db.session.get(JournalEntry, entry_id) is None
+            assert SyncOutbox.query.count() == 0
+
+    def test_expired_sync_token_falls_back_to_full_pull(self, pull_app, caldav_server, user):
+        """A token the server rejects is replaced by a full listing diffed against the mirror."""
+        from models import db, CalendarEvent, CalendarSyncState, JournalEntry
+        from services.caldav_service import CalDAVService
+
+        caldav_server.edit("/calendars/journal/a.ics", _event("a", "A"))
+        with pull_app.app_context():
+            entry, path = _pushed_entry(user.id)
+            entry_id = entry.id
+            CalDAVService.pull_calendar_changes(user.id)
+            state = db.session.get(CalendarSyncState, (user.id, caldav_server.url))
+            state.sync_token = "http://stub/sync/999"
+            db.session.commit()
+
+            caldav_server.edit("/calendars/journal/b.ics", _event("b", "B"))
+            caldav_server.remove(path)
+            result = CalDAVService.pull_calendar_changes(user.id)
+            state = db.session.get(CalendarSyncState, (user.id, caldav_server.url))
+
+            # Only the new event is fetched; the unchanged one is skipped
+            assert result["changed"] == 1
+            assert result["deleted"] == 1
+            assert db.session.get(JournalEntry, entry_id) is None
+            assert {e.external_event_id for e in CalendarEvent.query.filter_by(user_id=user.id)} == {"a", "b"}
+            assert state.sync_token == caldav_server.sync_token
+
+    def test_server_without_sync_tokens_is_gated_by_ctag(self, app, user):
+        """Without sync-collection the calendar is listed only when its CTag changes."""
+        from services.caldav_service import CalDAVService
+        from services.connectivity import HealthTracker
+
+        server = _make_server(sync_collection=False)
+        app.config["CALDAV_SERVER_URL"] = server.url
+        app.extensions["caldav_health"] = HealthTracker(probe=lambda host, port, timeout: True)
+        try:
+            server.edit("/calendars/journal/a.ics", _event("a", "A"))
+            with app.app_context():
+                first = CalDAVService.pull_calendar_changes(user.id)
+                requests = server.requests
+                second = CalDAVService.pull_calendar_changes(user.id)
+                from services.caldav_transport import get_transport
+
+                get_transport().close()
+        finally:
+            server.stop()
+
+        assert first["changed"] == 1
+        assert server.reports == ["calendar-multiget"]
+        assert second["unchanged"] is True
+        assert server.requests == requests + 1
+
+    def test_server_without_sync_tokens_detects_deletions(self, app, user):
+        """A CTag-only listing fetches changed events only and drops those no longer listed."""
+        from models import db, CalendarEvent, JournalEntry
+        from services.caldav_service import CalDAVService
+        from services.connectivity import HealthTracker
+        from services.caldav_transport import get_transport
+
+        server = _make_server(sync_collection=False)
+        app.config["CALDAV_SERVER_URL"] = server.url
+        app.extensions["caldav_health"] = HealthTracker(probe=lambda host, port, timeout: True)
+        try:
+            server.edit("/calendars/journal/a.ics", _event("a", "A"))
+            server.edit("/calendars/journal/b.ics", _event("b", "B"))
+            with app.app_context():
+                entry, path = _pushed_entry(user.id)
+                entry_id = entry.id
+                CalDAVService.pull_calendar_changes(user.id)
+
+                server.edit("/calendars/journal/a.ics", _event("a", "A edited"))
+                server.remove(path)
+                result = CalDAVService.pull_calendar_changes(user.id)
+                uids = {e.external_event_id for e in CalendarEvent.query.filter_by(user_id=user.id)}
+                title = CalendarEvent.query.filter_by(user_id=user.id, external_event_id="a").one().title
+                gone = db.session.get(JournalEntry, entry_id) is None
+                get_transport().close()
+        finally:
+            server.stop()
+
+        assert result["changed"] == 1
+        assert result["deleted"] == 1
+        assert gone
+        assert uids == {"a", "b"}
+        assert title == "A edited"
+
+
+class TestCalendarMirror:
+    """Test cases for the local CalendarEvent mirror filled by pulls."""
+
+    def _seed(self, server, count):
+        first = datetime(2026, 3, 1, 8, tzinfo=timezone.utc)
+        for i in range(count):
+            server.edit(
+                f"/calendars/journal/ev-{i}.ics",
+                _event(f"ev-{i}", f"Event {i}", start=first + timedelta(hours=i)),
+            )
+
+    def test_pull_upserts_each_batch_in_one_statement(self, pull_app, caldav_server, user):
+        """250 events are mirrored with 3 upserts; re-pulled events update in place."""
+        from sqlalchemy import event
+        from models import db, CalendarEvent
+        from services.caldav_service import CalDAVService
+
+        self._seed(caldav_server, 250)
+        inserts = []
+
+        def _capture(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("INSERT INTO calendar_events"):
+                inserts.append(executemany)
+
+        with pull_app.app_context():
+            event.listen(db.engine, "before_cursor_execute", _capture)
+            try:
+                CalDAVService.pull_calendar_changes(user.id)
+            finally:
+                event.remove(db.engine, "before_cursor_execute", _capture)
+            assert inserts == [True, True, True]
+            assert CalendarEvent.query.filter_by(user_id=user.id).count() == 250
+
+            caldav_server.edit("/calendars/journal/ev-7.ics", _event("ev-7", "Moved"))
+            CalDAVService.pull_calendar_changes(user.id)
+            mirrored = CalendarEvent.query.filter_by(user_id=user.id, external_event_id="ev-7").one()
+
+            assert CalendarEvent.query.filter_by(user_id=user.id).count() == 250
+            assert mirrored.title == "Moved"
+            assert mirrored.etag == caldav_server.etag("/calendars/journal/ev-7.ics")
+
+    def test_deleted_event_leaves_the_mirror(self, pull_app, caldav_server, user):
+        """A remote deletion removes the mirrored row."""
+        from models import CalendarEvent
+        from services.caldav_service import CalDAVService
+
+        self._seed(caldav_server, 3)
+        with pull_app.app_context():
+            CalDAVService.pull_calendar_changes(user.id)
+            caldav_server.remove("/calendars/journal/ev-1.ics")
+            CalDAVService.pull_calendar_changes(user.id)
+
+            uids = {e.external_event_id for e in CalendarEvent.query.filter_by(user_id=user.id)}
+        assert uids == {"ev-0", "ev-2"}
+
+    def test_linked_event_points_at_its_entry(self, pull_app, caldav_server, user):
+        """The mirror row of a pushed entry's event links back to the entry."""
+        from models import CalendarEvent
+        from services.caldav_service import CalDAVService
+
+        with pull_app.app_context():
+            entry, _ = _pushed_entry(user.id)
+            CalDAVService.pull_calendar_changes(user.id)
+            mirrored = CalendarEvent.query.filter_by(external_event_id=entry.calendar_event_id).one()
+
+            assert mirrored.journal_entry_id == entry.id
+            assert mirrored.sync_direction == "bidirectional"
+
+    def test_events_endpoint_pages_the_mirror(self, pull_app, caldav_server, client, user):
+        """/api/calendar/events pages in start order without contacting the server."""
+        from services.caldav_service import CalDAVService
+
+        self._seed(caldav_server, 30)
+        with pull_app.app_context():
+            CalDAVService.pull_calendar_changes(user.id)
+        client.post("/api/auth/login", json={"username": "testuser", "password": "testpass"})
+        requests = caldav_server.requests
+
+        titles = []
+        cursor = None
+        while True:
+            query = {"limit": 12, **({"cursor": cursor} if cursor else {})}
+            response = client.get("/api/calendar/events", query_string=query)
+            assert response.status_code == 200
+            titles += [event["title"] for event in response.json["events"]]
+            cursor = response.json["next_cursor"]
+            if cursor is None:
+                break
+
+        assert titles == [f"Event {i}" for i in range(30)]
+        assert "total" not in response.json
+        assert caldav_server.requests == requests
+
+        response = client.get(
+            "/api/calendar/events", query_string={"start_date": "2026-03-02", "end_date": "2026-03-02"}
+        )
+        assert [event["title"] for event in response.json["events"]] == [f"Event {i}" for i in range(16, 30)]
+
+    def test_events_endpoint_rejects_bad_cursor(self, client, auth_headers):
+        """A malformed cursor is a 400, not a server error."""
+        response = client.get("/api/calendar/events?cursor=not-a-cursor")
+        assert response.status_code == 400
@@ -0,0 +1,319 @@
+"""Integration tests for the pooled CalDAV transport against a stand-in server."""
+import pytest
+from datetime import date
+from urllib.parse import quote
+from tests.caldav_stub import CalDAVStubServer
+
+
+@pytest.fixture
+def caldav_server():
+    server = CalDAVStubServer(username="journal", password="secret").start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def caldav_app(app, caldav_server):
+    """App syncing to the stand-in server, with an always-online probe."""
+    from services.connectivity import HealthTracker
+
+    app.config.update(
+        CALDAV_SERVER_URL=caldav_server.url,
+        CALDAV_USERNAME="journal",
+        CALDAV_PASSWORD="secret",
+    )
+    app.extensions["caldav_health"] = HealthTracker(probe=lambda host, port, timeout: True)
+    yield app
+    transports, _ = app.extensions["caldav_transports"]
+    for transport in transports.values():
+        transport.close()
+
+
+def _pending_entries(user_id, count):
+    from models import db
+    from services.journal_service import JournalService
+
+    entries = []
+    for i in range(count):
+        entry = JournalService.create_entry(user_id, f"Entry {i}", f"Content {i}", date.today())
+        entry.sync_status = "sync_pending"
+        entries.append(entry)
+    db.session.commit()
+    return entries
+
+
+class TestCalDAVTransport:
+    """Test cases for CalDAVTransport."""
+
+    def test_sync_reuses_kept_alive_connections(self, caldav_app, caldav_server, user):
+        """PUTs reuse at most one kept-alive connection per concurrent slot."""
+        from services.caldav_service import CalDAVService
+
+        with caldav_app.app_context():
+            _pending_entries(user.id, 20)
+            result = CalDAVService.sync_all_pending_entries(user.id)
+            connections = caldav_server.connections
+
+            _pending_entries(user.id, 20)
+            CalDAVService.sync_all_pending_entries(user.id)
+
+        assert result["success"] == 20
+        assert len(caldav_server.events) == 40
+        assert all("BEGIN:VEVENT" in body for body in caldav_server.events.values())
+        assert connections <= caldav_app.config["CALDAV_MAX_CONCURRENCY"]
+        assert caldav_server.connections == connections
+
+    def test_transport_is_shared_across_requests(self, caldav_app, caldav_server, user):
+        """Separate requests use the same transport and its open connection."""
+        from services.caldav_service import CalDAVService
+        from services.caldav_transport import get_transport
+
+        with caldav_app.app_context():
+            entries = _pending_entries(user.id, 2)
+            entry_ids = [entry.id for entry in entries]
+
+        transports = []
+        for entry_id in entry_ids:
+            with caldav_app.test_request_context():
+                from models import db, JournalEntry
+
+                transports.append(get_transport())
+                CalDAVService.sync_entry_to_calendar(db.session.get(JournalEntry, entry_id))
+
+        assert transports[0] is transports[1]
+        assert caldav_server.connections == 1
+
+    def test_event_resource_is_named_after_uid(self, caldav_app, caldav_server, user):
+        """Events are stored at <collection>/<uid>.ics."""
+        from services.caldav_service import CalDAVService
+
+        with caldav_app.app_context():
+            entry = _pending_entries(user.id, 1)[0]
+            CalDAVService.sync_entry_to_calendar(entry)
+            uid = entry.calendar_event_id
+
+        from urllib.parse import quote
+
+        assert f"/calendars/journal/{quote(uid, safe='')}.ics" in caldav_server.events
+
+    def test_full_calendar_marks_entry_as_error(self, caldav_app, caldav_server, user):
+        """HTTP 507 from the server is reported as a full calendar."""
+        from services.caldav_service import CalDAVService
+
+        caldav_server.put_status = 507
+        with caldav_app.app_context():
+            entry = _pending_entries(user.id, 1)[0]
+            with pytest.raises(ValueError, match="Calendar is full"):
+                CalDAVService.sync_entry_to_calendar(entry)
+            assert entry.sync_status == "sync_error"
+
+    def test_server_error_keeps_entry_pending_and_trips_breaker(self, caldav_app, caldav_server, user):
+        """Failed PUTs leave entries pending and count against the breaker."""
+        from services.caldav_service import CalDAVService
+        from services.connectivity import get_health_tracker
+
+        caldav_server.put_status = 500
+        with caldav_app.app_context():
+            _pending_entries(user.id, 3)
+            result = CalDAVService.sync_all_pending_entries(user.id)
+            breaker = get_health_tracker().breaker(caldav_server.url)
+
+        assert (result["success"], result["failed"]) == (0, 3)
+        assert breaker.state == "open"
+
+    @pytest.mark.parametrize("status", [403, 507])
+    def test_refused_put_does_not_trip_breaker(self, caldav_app, caldav_server, user, status):
+        """A server that answers with a refusal is up, so the breaker stays closed."""
+        from services.caldav_service import CalDAVService
+        from services.connectivity import get_health_tracker
+
+        caldav_server.put_status = status
+        with caldav_app.app_context():
+            _pending_entries(user.id, 3)
+            with pytest.raises(ValueError):
+                CalDAVService.sync_all_pending_entries(user.id)
+            entry = _pending_entries(user.id, 1)[0]
+            with pytest.raises(ValueError):
+                CalDAVService.sync_entry_to_calendar(entry)
+            breaker = get_health_tracker().breaker(caldav_server.url)
+
+        assert breaker.state == "closed"
+
+
+class TestConcurrentPush:
+    """Test cases for parallel PUTs against a slow server."""
+
+    @pytest.fixture
+    def slow_server(self):
+        server = CalDAVStubServer(latency=0.1).start()
+        yield server
+        server.stop()
+
+    @pytest.fixture
+    def slow_app(self, app, slow_server):
+        from services.connectivity import HealthTracker
+
+        app.config.update(
+            CALDAV_SERVER_URL=slow_server.url,
+            CALDAV_MAX_CONCURRENCY=4,
+            CALDAV_SYNC_CHUNK_SIZE=8,
+        )
+        app.extensions["caldav_health"] = HealthTracker(probe=lambda host, port, timeout: True)
+        yield app
+        transports, _ = app.extensions["caldav_transports"]
+        for transport in transports.values():
+            transport.close()
+
+    def test_puts_run_in_parallel_within_the_limit(self, slow_app, slow_server, user):
+        """16 PUTs of 100 ms each finish in about 4 rounds, never over 4 in flight."""
+        import time
+        from services.caldav_service import CalDAVService
+
+        with slow_app.app_context():
+            entries = _pending_entries(user.id, 16)
+            started = time.perf_counter()
+            result = CalDAVService.sync_all_pending_entries(user.id)
+            elapsed = time.perf_counter() - started
+
+            assert result["success"] == 16
+            assert [chunk["entries"] for chunk in result["chunks"]] == [8, 8]
+            assert all(entry.sync_status == "synced" for entry in entries)
+        assert slow_server.max_in_flight == 4
+        assert elapsed < 16 * 0.1 / 2
+
+    def test_timed_out_put_leaves_entry_pending(self, slow_app, user):
+        """A PUT slower than CALDAV_PUSH_TIMEOUT counts as failed."""
+        from services.caldav_service import CalDAVService
+
+        slow_app.config["CALDAV_PUSH_TIMEOUT"] = 0.01
+        with slow_app.app_context():
+            entries = _pending_entries(user.id, 1)
+            result = CalDAVService.sync_all_pending_entries(user.id)
+
+            assert (result["success"], result["failed"]) == (0, 1)
+            assert entries[0].sync_status == "sync_pending"
+
+    def test_put_stored_after_timeout_is_not_a_conflict(self, slow_app, slow_server, user):
+        """A timed-out PUT the server still applies does not fail the next one with 412."""
+        import time
+        from services.caldav_service import CalDAVService
+        from services.journal_service import JournalService
+
+        with slow_app.app_context():
+            entry = _pending_entries(user.id, 1)[0]
+            CalDAVService.sync_all_pending_entries(user.id)
+            JournalService.update_entry(entry.id, user.id, content="Edited")
+
+            slow_app.config["CALDAV_PUSH_TIMEOUT"] = 0.01
+            assert CalDAVService.sync_all_pending_entries(user.id)["failed"] == 1
+            time.sleep(0.2)
+            assert "Edited" in next(iter(slow_server.events.values()))
+
+            slow_app.config["CALDAV_PUSH_TIMEOUT"] = 30
+            result = CalDAVService.sync_all_pending_entries(user.id)
+
+            assert (result["success"], result["failed"]) == (1, 0)
+            assert entry.sync_status == "synced"
+
+
+class TestOutboxSync:
+    """Test cases for sending queued journal changes to the server."""
+
+    def test_edit_burst_is_one_put(self, caldav_app, caldav_server, user):
+        """Ten saves of a synced entry cost one PUT on the next sync."""
+        from services.caldav_service import CalDAVService
+        from services.journal_service import JournalService
+
+        with caldav_app.app_context():
+            entry = JournalService.create_entry(user.id, "Draft", "v0", date.today())
+            CalDAVService.sync_all_pending_entries(user.id)
+            requests = caldav_server.requests
+
+            for i in range(10):
+                JournalService.update_entry(entry.id, user.id, content=f"v{i + 1}")
+            result = CalDAVService.sync_all_pending_entries(user.id)
+
+        assert result["success"] == 1
+        assert caldav_server.requests - requests == 1
+        assert "v10" in next(iter(caldav_server.events.values()))
+
+    def test_deleted_entry_removes_its_event(self, caldav_app, caldav_server, user):
+        """Deleting a synced entry deletes its calendar event on the next sync."""
+        from services.caldav_service import CalDAVService
+        from services.journal_service import JournalService
+
+        with caldav_app.app_context():
+            kept, removed = (
+                JournalService.create_entry(user.id, title, "Content", date.today()) for title in ("Kept", "Removed")
+            )
+            CalDAVService.sync_all_pending_entries(user.id)
+            JournalService.delete_entry(removed.id, user.id)
+            result = CalDAVService.sync_all_pending_entries(user.id)
+            kept_uid = kept.calendar_event_id
+
+        assert (result["success"], result["deleted"]) == (0, 1)
+        assert list(caldav_server.events) == [f"/calendars/journal/{quote(kept_uid, safe='')}.ics"]
+
+
+class TestChangeDetection:
+    """Test cases for skipping PUTs of events the calendar already holds."""
+
+    def test_invisible_edit_sends_nothing(self, caldav_app, caldav_server, user):
+        """An edit past the description truncation does not PUT the event again."""
+        from services.caldav_service import CalDAVService
+        from services.journal_service import JournalService
+
+        long_content = "x" * 600
+        with caldav_app.app_context():
+            entry = JournalService.create_entry(user.id, "Long", long_content, date.today())
+            CalDAVService.sync_all_pending_entries(user.id)
+            puts = caldav_server.puts
+
+            JournalService.update_entry(entry.id, user.id, content=long_content + "  more")
+            result = CalDAVService.sync_all_pending_entries(user.id)
+            assert CalDAVService.sync_entry_to_calendar(entry)
+
+            assert (result["success"], result["unchanged"]) == (0, 1)
+            assert entry.sync_status == "synced"
+        assert caldav_server.puts == puts
+
+    def test_puts_are_conditional_on_the_last_etag(self, caldav_app, caldav_server, user):
+        """A PUT over an event changed on the calendar is refused until a pull."""
+        from services.caldav_service import CalDAVService
+        from services.journal_service import JournalService
+
+        with caldav_app.app_context():
+            entry = JournalService.create_entry(user.id, "Shared", "v0", date.today())
+            CalDAVService.sync_all_pending_entries(user.id)
+            path = f"/calendars/journal/{quote(entry.calendar_event_id, safe='')}.ics"
+            caldav_server.edit(path, caldav_server.events[path].replace("SUMMARY:Shared", "SUMMARY:iPhone"))
+
+            JournalService.update_entry(entry.id, user.id, content="v1")
+            result = CalDAVService.sync_all_pending_entries(user.id)
+            assert (result["success"], result["failed"]) == (0, 1)
+            assert entry.sync_status == "sync_conflict"
+            assert "SUMMARY:iPhone" in caldav_server.events[path]
+
+            CalDAVService.pull_calendar_changes(user.id)
+            result = CalDAVService.sync_all_pending_entries(user.id)
+
+            assert result["success"] == 1
+            assert entry.calendar_etag == caldav_server.etag(path)
+        assert "DESCRIPTION:v1" in caldav_server.events[path]
+
+    def test_pulled_change_is_overwritten_on_next_push(self, caldav_app, caldav_server, user):
+        """After the calendar changed an event, pushing the entry sends it again."""
+        from services.caldav_service import CalDAVService
+        from services.journal_service import JournalService
+
+        with caldav_app.app_context():
+            entry = JournalService.create_entry(user.id, "Kept", "Local", date.today())
+            CalDAVService.sync_all_pending_entries(user.id)
+            path = f"/calendars/journal/{quote(entry.calendar_event_id, safe='')}.ics"
+            caldav_server.edit(path, caldav_server.events[path].replace("DESCRIPTION:Local", "DESCRIPTION:Remote"))
+            CalDAVService.pull_calendar_changes(user.id)
+            assert entry.calendar_content_hash is None
+
+            puts = caldav_server.puts
+            assert CalDAVService.sync_entry_to_calendar(entry)
+        assert caldav_server.puts == puts + 1
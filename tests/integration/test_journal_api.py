@@ -0,0 +1,232 @@
+"""Integration tests for the journal HTTP API."""
+import pytest
+
+
+@pytest.fixture
+def logged_in(client, user):
+    """Log the test client in as the test user."""
+    response = client.post(
+        "/api/auth/login", json={"username": "testuser", "password": "testpass"}
+    )
+    assert response.status_code == 200
+    return client
+
+
+class TestConditionalGet:
+    """ETag / If-None-Match handling on journal GET endpoints."""
+
+    def test_list_returns_304_for_current_etag(self, logged_in):
+        """Test a repeated listing with the returned ETag is not modified."""
+        logged_in.post("/api/journal/entries", json={"title": "A", "content": "Content"})
+
+        first = logged_in.get("/api/journal/entries")
+        assert first.status_code == 200
+        etag = first.headers["ETag"]
+        assert not etag.startswith("W/")
+        assert first.headers["Last-Modified"]
+
+        second = logged_in.get("/api/journal/entries", headers={"If-None-Match": etag})
+        assert second.status_code == 304
+        assert second.data == b""
+        assert second.headers["ETag"] == etag
+
+    def test_write_invalidates_etag(self, logged_in):
+        """Test any write changes the ETag so stale caches get a full response."""
+        created = logged_in.post(
+            "/api/journal/entries", json={"title": "A", "content": "Content"}
+        ).json
+        etag = logged_in.get(f"/api/journal/entries/{created['id']}").headers["ETag"]
+
+        logged_in.put(f"/api/journal/entries/{created['id']}", json={"title": "B"})
+
+        response = logged_in.get(
+            f"/api/journal/entries/{created['id']}", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 200
+        assert response.json["title"] == "B"
+        assert response.headers["ETag"] != etag
+
+    def test_304_skips_entry_queries(self, app, logged_in):
+        """Test a matching If-None-Match never reaches the journal_entries table."""
+        from sqlalchemy import event
+        from models import db
+
+        logged_in.post("/api/journal/entries", json={"title": "A", "content": "Content"})
+        etag = logged_in.get("/api/journal/entries").headers["ETag"]
+
+        statements = []
+        with app.app_context():
+            engine = db.engine
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", capture)
+        try:
+            response = logged_in.get(
+                "/api/journal/entries", headers={"If-None-Match": etag}
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", capture)
+
+        assert response.status_code == 304
+        assert statements
+        assert not any("FROM journal_entries" in sql for sql in statements)
+
+    def test_missing_entry_has_no_etag(self, logged_in):
+        """Test 404 responses are not given cache validators."""
+        response = logged_in.get("/api/journal/entries/9999")
+        assert response.status_code == 404
+        assert "ETag" not in response.headers
+
+
+class TestListing:
+    """Page size handling of GET /journal/entries."""
+
+    def test_limit_is_capped(self, app, user, logged_in):
+        """Test a limit above JOURNAL_LIST_MAX_LIMIT returns a capped page."""
+        from datetime import date
+        from services.journal_service import JournalService
+
+        with app.app_context():
+            for i in range(101):
+                JournalService.create_entry(user.id, f"Entry {i}", "Content", date.today())
+
+        response = logged_in.get("/api/journal/entries?limit=500")
+        assert response.status_code == 200
+        assert len(response.json["entries"]) == 100
+        assert response.json["next_cursor"]
+
+
+class TestCalendarHistogram:
+    """GET /api/journal/calendar month and year views."""
+
+    def test_month_view(self, logged_in):
+        """Test the month view returns one bucket per day with entries."""
+        for day in ("2025-03-01", "2025-03-01", "2025-03-31", "2025-04-01"):
+            logged_in.post(
+                "/api/journal/entries",
+                json={"title": "T", "content": "Content", "date": day},
+            )
+
+        response = logged_in.get("/api/journal/calendar?month=2025-03")
+        assert response.status_code == 200
+        data = response.json
+        assert data["start_date"] == "2025-03-01"
+        assert data["end_date"] == "2025-03-31"
+        assert data["total"] == 3
+        assert [(d["date"], d["total"]) for d in data["days"]] == [
+            ("2025-03-01", 2),
+            ("2025-03-31", 1),
+        ]
+        assert data["days"][0]["sync_status"]["not_synced"] == 2
+
+    def test_year_view_groups_months(self, logged_in):
+        """Test the year view adds per-month totals."""
+        for day in ("2025-01-05", "2025-12-31", "2025-12-01"):
+            logged_in.post(
+                "/api/journal/entries",
+                json={"title": "T", "content": "Content", "date": day},
+            )
+
+        data = logged_in.get("/api/journal/calendar?year=2025").json
+        assert data["total"] == 3
+        assert [(m["month"], m["total"]) for m in data["months"]] == [
+            ("2025-01", 1),
+            ("2025-12", 2),
+        ]
+
+    def test_invalid_range(self, logged_in):
+        """Test a missing or malformed range is rejected."""
+        assert logged_in.get("/api/journal/calendar").status_code == 400
+        assert logged_in.get("/api/journal/calendar?month=2025-13").status_code == 400
+
+
+class TestSearch:
+    """GET /api/journal/search."""
+
+    def test_search(self, logged_in):
+        """Test matching entries come back with highlighted snippets."""
+        logged_in.post(
+            "/api/journal/entries",
+            json={"title": "Trip", "content": "Walked along the river", "date": "2025-05-01"},
+        )
+        logged_in.post("/api/journal/entries", json={"title": "Other", "content": "Nothing"})
+
+        response = logged_in.get("/api/journal/search?q=river")
+        assert response.status_code == 200
+        data = response.json
+        assert [r["title"] for r in data["results"]] == ["Trip"]
+        assert data["results"][0]["date"] == "2025-05-01"
+        assert "<mark>river</mark>" in data["results"][0]["snippet"]
+        assert data["next_cursor"] is None
+
+    def test_search_validation(self, logged_in):
+        """Test missing queries and malformed dates are rejected."""
+        assert logged_in.get("/api/journal/search").status_code == 400
+        assert logged_in.get("/api/journal/search?q=river&from=2025-13-01").status_code == 400
+        assert logged_in.get("/api/journal/search?q=river&cursor=bogus").status_code == 400
+
+
+class TestBulkEntries:
+    """POST /api/journal/entries/bulk."""
+
+    def test_bulk_reports_per_item_results(self, logged_in):
+        """Test valid operations are applied and invalid ones reported, in order."""
+        existing = logged_in.post(
+            "/api/journal/entries", json={"title": "A", "content": "Content"}
+        ).json
+
+        response = logged_in.post(
+            "/api/journal/entries/bulk",
+            json={
+                "operations": [
+                    {"op": "create", "title": "B", "content": "More", "date": "2025-01-02"},
+                    {"op": "create", "title": "C"},
+                    {"op": "update", "id": existing["id"], "content": "Edited"},
+                    {"op": "rename"},
+                    {"op": "delete", "id": existing["id"]},
+                ]
+            },
+        )
+        assert response.status_code == 200
+        data = response.json
+        assert [r["status"] for r in data["results"]] == [201, 400, 200, 400, 204]
+        assert data["results"][1]["error"] == "Content is required"
+        assert (data["created"], data["updated"], data["deleted"], data["failed"]) == (1, 1, 1, 2)
+
+        listing = logged_in.get("/api/journal/entries").json
+        assert [e["title"] for e in listing["entries"]] == ["B"]
+        assert listing["total"] == 1
+
+    def test_bulk_rejects_bad_batches(self, app, logged_in):
+        """Test missing, empty and oversized batches are rejected."""
+        assert logged_in.post("/api/journal/entries/bulk", json={}).status_code == 400
+        assert logged_in.post("/api/journal/entries/bulk", json={"operations": []}).status_code == 400
+        app.config["JOURNAL_BULK_MAX_OPERATIONS"] = 1
+        response = logged_in.post(
+            "/api/journal/entries/bulk",
+            json={"operations": [{"op": "delete", "id": 1}, {"op": "delete", "id": 2}]},
+        )
+        assert response.status_code == 400
+
+
+class TestBatchExport:
+    """POST /api/journal/entries/batch-export."""
+
+    def test_duplicate_ids_are_exported_once(self, logged_in):
+        """Test an id repeated in entry_ids appears once in the export."""
+        from urllib.parse import unquote
+
+        entry = logged_in.post("/api/journal/entries", json={"title": "Once", "content": "Content"}).json
+        response = logged_in.post(
+            "/api/journal/entries/batch-export", json={"entry_ids": [entry["id"], entry["id"]]}
+        )
+        assert response.status_code == 200
+        assert unquote(response.json["shortcuts_url"]).count("Once") == 1
+
+    def test_non_integer_ids_are_rejected(self, logged_in):
+        """Test entry_ids must be a list of integers."""
+        for entry_ids in (["1"], [1.5], [True], {"id": 1}, 7):
+            response = logged_in.post("/api/journal/entries/batch-export", json={"entry_ids": entry_ids})
+            assert response.status_code == 400
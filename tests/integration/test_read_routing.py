@@ -0,0 +1,87 @@
+"""Integration tests for routing GET traffic to the read-only engine."""
+import pytest
+from sqlalchemy import event, text
+
+
+@pytest.fixture
+def file_app(tmp_path):
+    """App on a file-backed database, so a reader engine is configured."""
+    from app import create_app
+    from config import TestingConfig, config
+    config["routing_test"] = type(
+        "RoutingTestConfig",
+        (TestingConfig,),
+        {"SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'journal.db'}"},
+    )
+    try:
+        app = create_app("routing_test")
+    finally:
+        del config["routing_test"]
+    with app.app_context():
+        from models import db, User
+        user = User(username="testuser")
+        user.set_password("testpass")
+        db.session.add(user)
+        db.session.commit()
+    yield app
+    with app.app_context():
+        from models import db
+        for engine in db.engines.values():
+            engine.dispose()
+
+
+def record_statements(engine):
+    statements = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    return statements
+
+
+class TestReadRouting:
+    """GET handlers read from the reader engine, writes go to the writer."""
+
+    def test_get_uses_reader_and_post_uses_writer(self, file_app):
+        """Test statements of each request land on the expected engine."""
+        from models import db
+        from models.read_routing import READER_BIND
+        with file_app.app_context():
+            writer, reader = db.engines[None], db.engines[READER_BIND]
+        client = file_app.test_client()
+        client.post("/api/auth/login", json={"username": "testuser", "password": "testpass"})
+
+        writes, reads = record_statements(writer), record_statements(reader)
+        assert client.post("/api/journal/entries", json={"title": "A", "content": "C"}).status_code == 201
+        assert any(s.startswith("INSERT INTO journal_entries") for s in writes)
+        assert not any("journal_entries" in s for s in reads)
+
+        writes.clear()
+        response = client.get("/api/journal/entries")
+        assert response.status_code == 200
+        assert [e["title"] for e in response.json["entries"]] == ["A"]
+        assert any("FROM journal_entries" in s for s in reads)
+        assert not any("journal_entries" in s for s in writes)
+
+    def test_reader_connections_reject_writes(self, file_app):
+        """Test the reader engine is opened read-only and query-only."""
+        from sqlalchemy.exc import OperationalError
+        from models import db
+        from models.read_routing import READER_BIND
+        with file_app.app_context():
+            reader = db.engines[READER_BIND]
+        assert reader.url.query["mode"] == "ro"
+        with reader.connect() as conn:
+            assert conn.execute(text("PRAGMA query_only")).scalar() == 1
+            with pytest.raises(OperationalError):
+                conn.execute(text("DELETE FROM journal_entries"))
+
+    def test_later_app_without_reader_can_create_all(self, file_app):
+        """Test the reader bind does not leak into apps that lack it."""
+        from app import create_app
+        from models import db
+        app = create_app("testing")
+        with app.app_context():
+            db.create_all()
+            assert "journal_entries" in db.inspect(db.engine).get_table_names()
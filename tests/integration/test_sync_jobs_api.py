@@ -0,0 +1,191 @@
+"""Integration tests for queued calendar syncs and the sync worker."""
+import pytest
+import time
+from datetime import date
+from tests.caldav_stub import CalDAVStubServer
+
+
+@pytest.fixture
+def caldav_server():
+    server = CalDAVStubServer().start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def worker_app(app, caldav_server):
+    """App syncing to the stand-in server, with an always-online probe."""
+    from services.connectivity import HealthTracker
+
+    app.config.update(CALDAV_SERVER_URL=caldav_server.url)
+    app.extensions["caldav_health"] = HealthTracker(probe=lambda host, port, timeout: True)
+    yield app
+    transports, _ = app.extensions["caldav_transports"]
+    for transport in transports.values():
+        transport.close()
+
+
+def _login(client):
+    client.post("/api/auth/login", json={"username": "testuser", "password": "testpass"})
+
+
+def _pending_entry(user_id):
+    from models import db
+    from services.journal_service import JournalService
+
+    entry = JournalService.create_entry(user_id, "Queued", "Pushed by the worker", date.today())
+    entry.sync_status = "sync_pending"
+    db.session.commit()
+    return entry.id
+
+
+class TestQueuedSync:
+    """Test cases for the 202 sync endpoints and the worker."""
+
+    def test_manual_sync_is_queued_and_run_by_worker(self, worker_app, caldav_server, client, user):
+        """POST /calendar/sync returns 202 at once; the worker pushes and records the result."""
+        from services.sync_jobs import run_worker
+
+        with worker_app.app_context():
+            _pending_entry(user.id)
+        _login(client)
+
+        response = client.post("/api/calendar/sync")
+        assert response.status_code == 202
+        job = response.get_json()["job"]
+        assert job["status"] == "queued"
+        assert response.headers["Location"].endswith(f"/api/calendar/jobs/{job['id']}")
+        assert caldav_server.events == {}
+
+        with worker_app.app_context():
+            assert run_worker("test", once=True) == 1
+
+        job = client.get(response.headers["Location"]).get_json()
+        assert job["status"] == "succeeded"
+        assert job["attempts"] == 1
+        assert job["result"]["success"] == 1
+        assert "pulled" in job["result"]
+        assert len(caldav_server.events) == 1
+
+    def test_entry_sync_is_queued(self, worker_app, caldav_server, client, user):
+        """POST /journal/entries/<id>/sync queues a job whose result is the synced entry."""
+        from services.sync_jobs import run_worker
+
+        with worker_app.app_context():
+            entry_id = _pending_entry(user.id)
+        _login(client)
+
+        response = client.post(f"/api/journal/entries/{entry_id}/sync")
+        assert response.status_code == 202
+        assert response.get_json()["job"]["kind"] == "sync_entry"
+
+        with worker_app.app_context():
+            run_worker("test", once=True)
+
+        job = client.get(response.headers["Location"]).get_json()
+        assert job["status"] == "succeeded"
+        assert job["result"]["entry"]["sync_status"] == "synced"
+
+    def test_missing_entry_is_not_queued(self, client, auth_headers):
+        """Syncing an unknown entry is still a 404."""
+        response = client.post("/api/journal/entries/999/sync")
+        assert response.status_code == 404
+
+    def test_invalid_entry_ids_are_rejected(self, client, auth_headers):
+        """entry_ids must be a list of integers."""
+        response = client.post("/api/calendar/sync", json={"entry_ids": ["1"]})
+        assert response.status_code == 400
+
+    def test_other_users_job_is_not_found(self, worker_app, client, user):
+        """Job status is only visible to the job's owner."""
+        from models import db, SyncJob, User
+        from services.sync_jobs import SyncJobService
+
+        with worker_app.app_context():
+            other = User(username="other", email="other@example.com")
+            other.set_password("otherpass")
+            db.session.add(other)
+            db.session.commit()
+            job_id = SyncJobService.enqueue(other.id, SyncJob.KIND_SYNC_ALL).id
+        _login(client)
+
+        assert client.get(f"/api/calendar/jobs/{job_id}").status_code == 404
+
+    def test_run_after_response_without_worker(self, worker_app, caldav_server, client, user):
+        """With SYNC_JOBS_RUN_AFTER_RESPONSE the web process runs the job itself."""
+        worker_app.config["SYNC_JOBS_RUN_AFTER_RESPONSE"] = True
+        with worker_app.app_context():
+            _pending_entry(user.id)
+        _login(client)
+
+        response = client.post("/api/calendar/sync")
+        response.close()
+
+        job = client.get(response.headers["Location"]).get_json()
+        assert job["status"] == "succeeded"
+        assert len(caldav_server.events) == 1
+
+
+class TestAutomaticSync:
+    """Test cases for the sync settings and automatic mode."""
+
+    def test_settings_round_trip(self, client, auth_headers):
+        """PUT /user/settings updates the sync mode that GET returns."""
+        assert client.get("/api/user/settings").get_json() == {
+            "calendar_sync_enabled": False,
+            "calendar_sync_mode": "manual",
+        }
+
+        response = client.put("/api/user/settings", json={"calendar_sync_mode": "automatic"})
+        assert response.status_code == 200
+        assert client.get("/api/user/settings").get_json()["calendar_sync_mode"] == "automatic"
+
+    def test_invalid_settings_are_rejected(self, client, auth_headers):
+        """Unknown modes and non-boolean flags are a 400."""
+        assert client.put("/api/user/settings", json={"calendar_sync_mode": "hourly"}).status_code == 400
+        assert client.put("/api/user/settings", json={"calendar_sync_enabled": "yes"}).status_code == 400
+
+    def test_switching_to_automatic_schedules_waiting_changes(self, worker_app, client, user):
+        """Changes made in manual mode are pushed once automatic mode is on."""
+        from models import db, SyncJob
+
+        with worker_app.app_context():
+            _pending_entry(user.id)
+        _login(client)
+
+        client.put("/api/user/settings", json={"calendar_sync_mode": "automatic"})
+
+        with worker_app.app_context():
+            kinds = db.session.scalars(db.select(SyncJob.kind)).all()
+        assert kinds == [SyncJob.KIND_AUTO_SYNC]
+
+    def test_debounced_sync_runs_on_cron_without_worker(self, worker_app, caldav_server, client, user):
+        """Without a worker the write returns at once and the cron trigger pushes the due sync."""
+        worker_app.config.update(
+            SYNC_JOBS_RUN_AFTER_RESPONSE=True, AUTO_SYNC_DELAY=1, SYNC_CRON_SECRET="s3cret"
+        )
+        _login(client)
+        client.put("/api/user/settings", json={"calendar_sync_mode": "automatic"})
+
+        started = time.monotonic()
+        response = client.post(
+            "/api/journal/entries",
+            json={"title": "Auto", "content": "Pushed by the cron", "date": date.today().isoformat()},
+        )
+        response.close()
+        assert response.status_code == 201
+        assert time.monotonic() - started < 1
+        assert caldav_server.events == {}
+
+        headers = {"Authorization": "Bearer s3cret"}
+        assert client.get("/api/calendar/jobs/run-due", headers=headers).get_json() == {"ran": 0}
+        time.sleep(1)
+        assert client.get("/api/calendar/jobs/run-due", headers=headers).get_json() == {"ran": 1}
+        assert len(caldav_server.events) == 1
+
+    def test_cron_trigger_requires_secret(self, worker_app, client):
+        """The due-jobs trigger is off without CRON_SECRET and rejects a wrong one."""
+        assert client.get("/api/calendar/jobs/run-due").status_code == 404
+        worker_app.config["SYNC_CRON_SECRET"] = "s3cret"
+        response = client.get("/api/calendar/jobs/run-due", headers={"Authorization": "Bearer nope"})
+        assert response.status_code == 401
@@ -204,10 +204,9 @@ class TestCalDAVService:
         with app.app_context():
             from services.caldav_service import CalDAVService
 
-            # Currently returns False (assumes online)
-            # This is a placeholder implementation
+            # Without CALDAV_SERVER_URL there is no server to reach
             result = CalDAVService.is_offline()
-            assert isinstance(result, bool)
+            assert result is False
 
     def test_sync_all_pending_entries(self, app, user):
         """Test syncing all pending entries for a user."""
@@ -260,3 +259,94 @@ class TestCalDAVService:
             assert stats["failed"] == 0
             assert stats["skipped"] == 0
 
+
+    def test_sync_selected_entries(self, app, user, monkeypatch):
+        """Test entry_ids restricts the sync and counts entries with nothing queued as skipped."""
+        with app.app_context():
+            from services.caldav_service import CalDAVService
+            from services.journal_service import JournalService
+            from models import db
+
+            monkeypatch.setattr(CalDAVService, "is_offline", staticmethod(lambda: False))
+            pending = JournalService.create_entry(
+                user_id=user.id, title="Entry 1", content="Content 1", entry_date=date.today()
+            )
+            other = JournalService.create_entry(
+                user_id=user.id, title="Entry 2", content="Content 2", entry_date=date.today()
+            )
+            pending.sync_status = "sync_pending"
+            other.sync_status = "sync_pending"
+            db.session.commit()
+            synced = JournalService.create_entry(
+                user_id=user.id, title="Entry 3", content="Content 3", entry_date=date.today()
+            )
+            CalDAVService.sync_entry_to_calendar(synced)
+
+            stats = CalDAVService.sync_all_pending_entries(
+                user.id, [pending.id, synced.id, 9999]
+            )
+
+            assert (stats["success"], stats["failed"], stats["skipped"]) == (1, 0, 2)
+            assert [chunk["entries"] for chunk in stats["chunks"]] == [1]
+            db.session.refresh(other)
+            assert other.sync_status == "sync_pending"
+
+    def test_sync_all_pending_entries_in_chunks(self, app, user, monkeypatch):
+        """Pending entries are synced and committed one chunk at a time."""
+        with app.app_context():
+            from services.caldav_service import CalDAVService
+            from services.journal_service import JournalService
+            from models import db, JournalEntry
+
+            monkeypatch.setattr(CalDAVService, "is_offline", staticmethod(lambda: False))
+            app.config["CALDAV_SYNC_CHUNK_SIZE"] = 4
+            for i in range(10):
+                entry = JournalService.create_entry(
+                    user_id=user.id, title=f"Entry {i}", content="Content", entry_date=date.today()
+                )
+                entry.sync_status = "sync_pending"
+            db.session.commit()
+
+            commits = []
+            monkeypatch.setattr(
+                db.session, "commit", lambda real=db.session.commit: commits.append(1) or real()
+            )
+            stats = CalDAVService.sync_all_pending_entries(user.id)
+
+            assert stats["success"] == 10
+            assert [chunk["entries"] for chunk in stats["chunks"]] == [4, 4, 2]
+            assert all(chunk["duration_ms"] >= 0 for chunk in stats["chunks"])
+            assert len(commits) == 3
+            assert JournalEntry.query.filter_by(sync_status="sync_pending").count() == 0
+
+    def test_failed_entries_stay_pending_without_blocking_chunk(self, app, user, monkeypatch):
+        """A push failure leaves that entry pending and commits the rest."""
+        with app.app_context():
+            from services.caldav_service import CalDAVService
+            from services.journal_service import JournalService
+            from models import db
+
+            monkeypatch.setattr(CalDAVService, "is_offline", staticmethod(lambda: False))
+            entries = []
+            for i in range(3):
+                entry = JournalService.create_entry(
+                    user_id=user.id, title=f"Entry {i}", content="Content", entry_date=date.today()
+                )
+                entry.sync_status = "sync_pending"
+                entries.append(entry)
+            db.session.commit()
+            failing_id = entries[1].id
+
+            render = CalDAVService._render_entry
+
+            def flaky_render(entry):
+                if entry.id == failing_id:
+                    raise RuntimeError("cannot render")
+                return render(entry)
+
+            monkeypatch.setattr(CalDAVService, "_render_entry", staticmethod(flaky_render))
+            stats = CalDAVService.sync_all_pending_entries(user.id)
+
+            assert (stats["success"], stats["failed"]) == (2, 1)
+            db.session.expire_all()
+            assert [e.sync_status for e in entries] == ["synced", "sync_pending", "synced"]
@@ -0,0 +1,61 @@
+"""Unit tests for the cold-start path of the serverless entry point."""
+import os
+import subprocess
+import sys
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+ROOT = os.path.join(os.path.dirname(__file__), "..", "..")
+
+
+def test_importing_app_does_not_load_calendar_libraries(tmp_path):
+    """ics is only imported once an event is generated, the PostgreSQL dialect never on SQLite."""
+    env = dict(os.environ, DATABASE_URL=f"sqlite:///{tmp_path / 'journal.db'}")
+    result = subprocess.run(
+        [sys.executable, "-c", "import sys, app; print(sorted({'ics', 'caldav', 'sqlalchemy.dialects.postgresql'} & set(sys.modules)))"],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip().splitlines()[-1] == "[]"
+
+
+def test_budget_mode_defers_schema_check_to_first_request():
+    """With STARTUP_BUDGET_MODE create_app runs no query; the first request checks."""
+    from app import create_app
+    from config import TestingConfig, config
+
+    config["budget-test"] = type("BudgetTestConfig", (TestingConfig,), {"STARTUP_BUDGET_MODE": True})
+    statements = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", _capture)
+    try:
+        app = create_app("budget-test")
+        assert statements == []
+
+        response = app.test_client().get("/health")
+        assert response.status_code == 200
+        assert any("schema_version" in statement for statement in statements)
+
+        checked = len(statements)
+        app.test_client().get("/health")
+        assert len(statements) == checked
+    finally:
+        event.remove(Engine, "before_cursor_execute", _capture)
+        del config["budget-test"]
+
+
+def test_partial_indexes_keep_their_predicate_on_postgresql():
+    """Partial indexes compile to CREATE INDEX ... WHERE on PostgreSQL as on SQLite."""
+    from sqlalchemy.dialects import postgresql, sqlite
+    from sqlalchemy.schema import CreateIndex
+    from models import JournalEntry
+
+    index = next(i for i in JournalEntry.__table__.indexes if i.name == "ix_journal_entries_user_pending")
+    for dialect in (sqlite.dialect(), postgresql.dialect()):
+        assert str(CreateIndex(index).compile(dialect=dialect)).endswith("WHERE sync_status = 'sync_pending'")
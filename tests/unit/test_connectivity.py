@@ -0,0 +1,143 @@
+"""Unit tests for the CalDAV health tracker and circuit breaker."""
+import pytest
+from datetime import date
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeProbe:
+    """Probe returning a scripted result and counting calls."""
+
+    def __init__(self, reachable=True):
+        self.reachable = reachable
+        self.calls = []
+
+    def __call__(self, host, port, timeout):
+        self.calls.append((host, port))
+        return self.reachable
+
+
+@pytest.fixture
+def tracker_factory():
+    from services.connectivity import HealthTracker
+
+    def _make(probe, **kwargs):
+        clock = FakeClock()
+        kwargs.setdefault("ttl", 30)
+        kwargs.setdefault("failure_threshold", 3)
+        kwargs.setdefault("reset_timeout", 60)
+        return HealthTracker(probe=probe, clock=clock, **kwargs), clock
+
+    return _make
+
+
+class TestHealthTracker:
+    """Test cases for HealthTracker."""
+
+    def test_probe_result_is_cached_for_ttl(self, tracker_factory):
+        """Repeated checks within the TTL reuse one probe."""
+        probe = FakeProbe()
+        tracker, clock = tracker_factory(probe)
+
+        for _ in range(100):
+            assert tracker.is_reachable("https://caldav.example.com/dav/")
+        assert probe.calls == [("caldav.example.com", 443)]
+
+        clock.now += 31
+        tracker.is_reachable("https://caldav.example.com/dav/")
+        assert len(probe.calls) == 2
+
+    def test_breaker_opens_after_consecutive_failures(self, tracker_factory):
+        """Once open, the host is reported down without probing."""
+        probe = FakeProbe(reachable=False)
+        tracker, clock = tracker_factory(probe, ttl=0)
+        url = "https://caldav.example.com"
+
+        for _ in range(3):
+            assert not tracker.is_reachable(url)
+        assert tracker.breaker(url).state == "open"
+
+        assert not tracker.is_reachable(url)
+        assert len(probe.calls) == 3
+
+    def test_half_open_trial_closes_breaker_on_success(self, tracker_factory):
+        """After reset_timeout one trial probe decides the breaker state."""
+        probe = FakeProbe(reachable=False)
+        tracker, clock = tracker_factory(probe, ttl=0)
+        url = "https://caldav.example.com"
+        for _ in range(3):
+            tracker.is_reachable(url)
+
+        clock.now += 61
+        assert tracker.breaker(url).state == "half_open"
+        probe.reachable = True
+        assert tracker.is_reachable(url)
+        assert tracker.breaker(url).state == "closed"
+
+    def test_failed_trial_reopens_breaker(self, tracker_factory):
+        """A failing half-open trial re-opens the breaker immediately."""
+        probe = FakeProbe(reachable=False)
+        tracker, clock = tracker_factory(probe, ttl=0)
+        url = "https://caldav.example.com"
+        for _ in range(3):
+            tracker.is_reachable(url)
+
+        clock.now += 61
+        assert not tracker.is_reachable(url)
+        assert tracker.breaker(url).state == "open"
+        assert len(probe.calls) == 4
+
+    def test_breakers_are_per_host(self, tracker_factory):
+        """An open breaker for one host does not affect another."""
+        probe = FakeProbe()
+        tracker, _ = tracker_factory(probe)
+        for _ in range(3):
+            tracker.record_failure("https://down.example.com")
+
+        assert tracker.breaker("https://down.example.com").state == "open"
+        assert tracker.is_reachable("https://up.example.com")
+
+
+class TestIsOffline:
+    """Test cases for CalDAVService.is_offline with the health tracker."""
+
+    def test_pending_sync_probes_once(self, app, user, monkeypatch):
+        """Syncing many pending entries costs a single reachability probe."""
+        from models import db
+        from services.caldav_service import CalDAVService
+        from services.connectivity import HealthTracker
+        from services.journal_service import JournalService
+
+        probe = FakeProbe()
+        app.config["CALDAV_SERVER_URL"] = "https://caldav.example.com/dav/"
+        app.extensions["caldav_health"] = HealthTracker(probe=probe)
+        # Simulated pushes: only the reachability checks are under test
+        monkeypatch.setattr("services.caldav_service.get_transport", lambda: None)
+
+        with app.app_context():
+            for i in range(20):
+                entry = JournalService.create_entry(user.id, f"Entry {i}", "Content", date.today())
+                entry.sync_status = "sync_pending"
+            db.session.commit()
+
+            result = CalDAVService.sync_all_pending_entries(user.id)
+
+        assert result["success"] == 20
+        assert len(probe.calls) == 1
+
+    def test_unreachable_server_is_offline(self, app):
+        """An unreachable configured server makes sync offline."""
+        from services.caldav_service import CalDAVService
+        from services.connectivity import HealthTracker
+
+        app.config["CALDAV_SERVER_URL"] = "https://caldav.example.com/dav/"
+        app.extensions["caldav_health"] = HealthTracker(probe=FakeProbe(reachable=False))
+
+        with app.app_context():
+            assert CalDAVService.is_offline() is True
@@ -77,3 +77,45 @@ def test_generate_ics_string(sample_entry, app):
         assert "BEGIN:VCALENDAR" in ics_string
         assert "END:VCALENDAR" in ics_string
 
+
+
+def test_parse_events_reads_event_properties():
+    """Folded lines, text escapes and TZID times are parsed; VALARM text is not."""
+    from zoneinfo import ZoneInfo
+    from services.ics_generator import ICSGenerator
+
+    ics_text = (
+        "BEGIN:VCALENDAR\r\nVERSION:2.0\r\nBEGIN:VEVENT\r\n"
+        "UID:event-1\r\nDTSTART;TZID=Europe/Berlin:20260101T090000\r\n"
+        "DTEND:20260101T100000Z\r\nSUMMARY:Lunch\\, then walk\r\n"
+        "DESCRIPTION:First line\\nsecond line that is\r\n  folded\r\n"
+        "LAST-MODIFIED:20260102T080000Z\r\nSTATUS:CANCELLED\r\n"
+        "BEGIN:VALARM\r\nDESCRIPTION:Reminder\r\nEND:VALARM\r\n"
+        "END:VEVENT\r\nEND:VCALENDAR\r\n"
+    )
+    (event,) = ICSGenerator.parse_events(ics_text)
+
+    assert event["uid"] == "event-1"
+    assert event["title"] == "Lunch, then walk"
+    assert event["description"] == "First line\nsecond line that is folded"
+    assert event["start_datetime"] == datetime(2026, 1, 1, 9, tzinfo=ZoneInfo("Europe/Berlin"))
+    assert event["last_modified"].isoformat() == "2026-01-02T08:00:00+00:00"
+    assert event["completion_status"] == "cancelled"
+
+
+def test_parse_events_round_trips_generated_calendar(sample_entry, app):
+    """Events generated for an entry parse back to the same title and description."""
+    from services.ics_generator import ICSGenerator
+
+    with app.app_context():
+        from models import db
+        db.session.add(sample_entry)
+        db.session.refresh(sample_entry)
+        ics_text = ICSGenerator.generate_ics_string([sample_entry])
+        (event,) = ICSGenerator.parse_events(ics_text)
+        uid = f"journal-entry-{sample_entry.id}@{sample_entry.user_id}"
+
+    assert event["uid"] == uid
+    assert event["title"] == "Test Entry"
+    assert event["description"] == "This is a test entry content."
+    assert event["start_datetime"].hour == 9
@@ -193,3 +193,373 @@ class TestJournalService:
             assert entry2.id in entry_ids
             assert entry3.id in entry_ids
 
+
+    def test_list_entries_cursor_pagination(self, app, user):
+        """Test walking all pages with next_cursor returns every entry once, in order."""
+        with app.app_context():
+            from services.journal_service import JournalService
+            from datetime import timedelta
+
+            today = date.today()
+            created = []
+            for i in range(7):
+                entry = JournalService.create_entry(
+                    user_id=user.id,
+                    title=f"Entry {i}",
+                    content="Content",
+                    entry_date=today - timedelta(days=i % 3),
+                )
+                created.append(entry.id)
+
+            offset_ids = [
+                e.id for e in JournalService.list_entries(user_id=user.id, limit=10)["entries"]
+            ]
+
+            seen = []
+            cursor = None
+            while True:
+                result = JournalService.list_entries(user_id=user.id, limit=3, cursor=cursor)
+                seen.extend(e.id for e in result["entries"])
+                cursor = result["next_cursor"]
+                if cursor is None:
+                    break
+
+            assert seen == offset_ids
+            assert sorted(seen) == sorted(created)
+
+    def test_list_entries_next_cursor_absent_on_last_page(self, app, user):
+        """Test next_cursor is None when the page holds the remaining entries."""
+        with app.app_context():
+            from services.journal_service import JournalService
+            JournalService.create_entry(
+                user_id=user.id, title="Only", content="Content", entry_date=date.today()
+            )
+
+            result = JournalService.list_entries(user_id=user.id, limit=1)
+            assert len(result["entries"]) == 1
+            assert result["next_cursor"] is None
+
+    def test_list_entries_invalid_cursor(self, app, user):
+        """Test a malformed cursor is rejected with a ValidationError."""
+        with app.app_context():
+            from services.journal_service import JournalService
+            from utils.validation import ValidationError
+
+            with pytest.raises(ValidationError):
+                JournalService.list_entries(user_id=user.id, cursor="not-a-cursor")
+
+    def test_entry_counters_follow_create_update_delete(self, app, user):
+        """Test the per-user and per-date counters track every mutation."""
+        with app.app_context():
+            from services.journal_service import JournalService
+            from datetime import timedelta
+
+            today = date.today()
+            yesterday = today - timedelta(days=1)
+            first = JournalService.create_entry(
+                user_id=user.id, title="A", content="Content", entry_date=today
+            )
+            JournalService.create_entry(
+                user_id=user.id, title="B", content="Content", entry_date=today
+            )
+            assert JournalService.count_entries(user.id) == 2
+            assert JournalService.count_entries(user.id, today) == 2
+
+            JournalService.update_entry(
+                entry_id=first.id, user_id=user.id, entry_date=yesterday
+            )
+            assert JournalService.count_entries(user.id) == 2
+            assert JournalService.count_entries(user.id, today) == 1
+            assert JournalService.count_entries(user.id, yesterday) == 1
+
+            JournalService.delete_entry(first.id, user.id)
+            assert JournalService.count_entries(user.id) == 1
+            assert JournalService.count_entries(user.id, yesterday) == 0
+
+    def test_entry_counters_rebuilt_for_untracked_user(self, app, user):
+        """Test counters missing for a user fall back to a scan and rebuild on write."""
+        with app.app_context():
+            from models import db, JournalUserStats, JournalDailyRollup
+            from services.journal_service import JournalService
+
+            JournalService.create_entry(
+                user_id=user.id, title="A", content="Content", entry_date=date.today()
+            )
+            JournalDailyRollup.query.filter_by(user_id=user.id).delete()
+            JournalUserStats.query.filter_by(user_id=user.id).delete()
+            db.session.commit()
+
+            assert JournalService.count_entries(user.id) == 1
+
+            JournalService.create_entry(
+                user_id=user.id, title="B", content="Content", entry_date=date.today()
+            )
+            assert db.session.get(JournalUserStats, user.id).entry_count == 2
+            assert JournalService.count_entries(user.id, date.today()) == 2
+
+    def test_list_entries_without_total(self, app, user):
+        """Test include_total=False skips the count and returns None."""
+        with app.app_context():
+            from services.journal_service import JournalService
+            JournalService.create_entry(
+                user_id=user.id, title="A", content="Content", entry_date=date.today()
+            )
+
+            result = JournalService.list_entries(user_id=user.id, include_total=False)
+            assert result["total"] is None
+            assert len(result["entries"]) == 1
+
+    def test_list_entries_summary_projection(self, app, user):
+        """Test summary listings return rows with a preview and without content."""
+        with app.app_context():
+            from models import JournalEntry
+            from services.journal_service import JournalService
+
+            long_content = "x" * (JournalEntry.PREVIEW_LENGTH + 50)
+            JournalService.create_entry(
+                user_id=user.id, title="Long", content=long_content, entry_date=date.today()
+            )
+            JournalService.create_entry(
+                user_id=user.id, title="Short", content="Short content", entry_date=date.today()
+            )
+
+            result = JournalService.list_entries(
+                user_id=user.id, fields=list(JournalEntry.SUMMARY_FIELDS)
+            )
+            rows = {row.title: row._mapping for row in result["entries"]}
+
+            assert "content" not in rows["Long"]
+            assert rows["Long"]["preview"] == "x" * JournalEntry.PREVIEW_LENGTH + "..."
+            assert rows["Short"]["preview"] == "Short content"
+            assert rows["Short"]["date"] == date.today()
+
+    def test_list_entries_projection_pages_with_cursor(self, app, user):
+        """Test projected listings still produce a usable next_cursor."""
+        with app.app_context():
+            from services.journal_service import JournalService
+            for i in range(3):
+                JournalService.create_entry(
+                    user_id=user.id, title=f"Entry {i}", content="Content", entry_date=date.today()
+                )
+
+            first = JournalService.list_entries(user_id=user.id, limit=2, fields=["title"])
+            second = JournalService.list_entries(
+                user_id=user.id, limit=2, fields=["title"], cursor=first["next_cursor"]
+            )
+            ids = [row.id for row in first["entries"] + second["entries"]]
+            assert len(set(ids)) == 3
+            assert second["next_cursor"] is None
+
+    def test_list_entries_unknown_field(self, app, user):
+        """Test requesting an unknown field raises a ValidationError."""
+        with app.app_context():
+            from services.journal_service import JournalService
+            from utils.validation import ValidationError
+
+            with pytest.raises(ValidationError):
+                JournalService.list_entries(user_id=user.id, fields=["password_hash"])
+
+    def test_change_version_bumps_on_every_write(self, app, user):
+        """Test create, update and delete each advance the change version."""
+        with app.app_context():
+            from services.journal_service import JournalService
+
+            assert JournalService.get_change_version(user.id) == (0, None)
+
+            entry = JournalService.create_entry(
+                user_id=user.id, title="A", content="Content", entry_date=date.today()
+            )
+            after_create, changed_at = JournalService.get_change_version(user.id)
+            assert after_create > 0
+            assert changed_at is not None
+
+            JournalService.update_entry(entry_id=entry.id, user_id=user.id, title="B")
+            after_update, _ = JournalService.get_change_version(user.id)
+            assert after_update > after_create
+
+            JournalService.delete_entry(entry.id, user.id)
+            after_delete, _ = JournalService.get_change_version(user.id)
+            assert after_delete > after_update
+
+    def test_daily_histogram_tracks_sync_status(self, app, user):
+        """Test the rollup follows creates, status changes, date moves and deletes."""
+        with app.app_context():
+            from models import db
+            from services.journal_service import JournalService
+            from datetime import timedelta
+
+            today = date.today()
+            yesterday = today - timedelta(days=1)
+            first = JournalService.create_entry(
+                user_id=user.id, title="A", content="Content", entry_date=today
+            )
+            second = JournalService.create_entry(
+                user_id=user.id, title="B", content="Content", entry_date=today
+            )
+            JournalService.update_entry(entry_id=first.id, user_id=user.id, title="A2")
+            second.sync_status = "synced"
+            db.session.commit()
+
+            days = JournalService.get_daily_histogram(user.id, yesterday, today)
+            assert len(days) == 1
+            assert days[0]["total"] == 2
+            assert days[0]["sync_status"]["sync_pending"] == 1
+            assert days[0]["sync_status"]["synced"] == 1
+            assert days[0]["sync_status"]["not_synced"] == 0
+
+            JournalService.update_entry(
+                entry_id=second.id, user_id=user.id, entry_date=yesterday
+            )
+            JournalService.delete_entry(first.id, user.id)
+
+            days = JournalService.get_daily_histogram(user.id, yesterday, today)
+            assert [day["date"] for day in days] == [yesterday]
+            assert days[0]["sync_status"]["sync_pending"] == 1
+
+    def test_daily_histogram_matches_fallback(self, app, user):
+        """Test rollup results equal the GROUP BY fallback for untracked users."""
+        with app.app_context():
+            from models import db, JournalUserStats
+            from services.journal_service import JournalService
+            from datetime import timedelta
+
+            today = date.today()
+            for i in range(6):
+                entry = JournalService.create_entry(
+                    user_id=user.id, title=f"E{i}", content="Content",
+                    entry_date=today - timedelta(days=i % 2),
+                )
+                if i % 3 == 0:
+                    JournalService.update_entry(entry_id=entry.id, user_id=user.id, title="X")
+
+            start = today - timedelta(days=7)
+            from_rollup = JournalService.get_daily_histogram(user.id, start, today)
+
+            JournalUserStats.query.filter_by(user_id=user.id).delete()
+            db.session.commit()
+            from_scan = JournalService.get_daily_histogram(user.id, start, today)
+
+            assert from_rollup == from_scan
+
+    def test_apply_bulk_operations(self, app, user):
+        """Test a mixed batch is applied in order with per-item results and counters."""
+        with app.app_context():
+            from models import db, JournalEntry
+            from services.journal_service import JournalService
+            keep = JournalService.create_entry(user.id, "Keep", "Content", date(2024, 1, 1))
+            drop = JournalService.create_entry(user.id, "Drop", "Content", date(2024, 1, 1))
+            keep_id, drop_id = keep.id, drop.id
+
+            results = JournalService.apply_bulk_operations(
+                user.id,
+                [
+                    {"index": 0, "op": "create", "title": "", "content": " New ", "entry_date": date(2024, 1, 2)},
+                    {"index": 1, "op": "update", "id": keep_id, "title": "Kept"},
+                    {"index": 2, "op": "delete", "id": drop_id},
+                    {"index": 3, "op": "update", "id": drop_id, "title": "Gone"},
+                    {"index": 4, "op": "delete", "id": 9999},
+                ],
+            )
+
+            assert [r["status"] for r in results] == [201, 200, 204, 404, 404]
+            created = db.session.get(JournalEntry, results[0]["id"])
+            assert (created.title, created.content) == ("Untitled", "New")
+            updated = db.session.get(JournalEntry, keep_id)
+            assert (updated.title, updated.sync_status) == ("Kept", "sync_pending")
+            titles = [e.title for e in JournalEntry.query.filter_by(user_id=user.id)]
+            assert sorted(titles) == ["Kept", "Untitled"]
+            assert JournalService.count_entries(user.id) == 2
+
+    def test_bulk_create_matches_create_entry(self, app, user):
+        """Test a bulk-created entry reads back like one from create_entry."""
+        with app.app_context():
+            from models import db, JournalEntry
+            from services.journal_service import JournalService
+            single = JournalService.create_entry(user.id, "Same", "Content", date(2024, 1, 1)).to_dict()
+            result = JournalService.apply_bulk_operations(
+                user.id,
+                [{"index": 0, "op": "create", "title": "Same", "content": "Content", "entry_date": date(2024, 1, 1)}],
+            )[0]
+            db.session.expire_all()
+            bulk = db.session.get(JournalEntry, result["id"]).to_dict()
+
+            volatile = ("id", "created_at", "updated_at")
+            assert {k: v for k, v in bulk.items() if k not in volatile} == {
+                k: v for k, v in single.items() if k not in volatile
+            }
+
+    def test_apply_bulk_operations_batches_inserts(self, app, user):
+        """Test creates in a batch go out as one executemany INSERT."""
+        with app.app_context():
+            from sqlalchemy import event
+            from models import db
+            from services.journal_service import JournalService
+
+            inserts = []
+
+            def record(conn, cursor, statement, parameters, context, executemany):
+                if statement.startswith("INSERT INTO journal_entries"):
+                    inserts.append(statement)
+
+            event.listen(db.engine, "before_cursor_execute", record)
+            try:
+                results = JournalService.apply_bulk_operations(
+                    user.id,
+                    [{"index": i, "op": "create", "title": f"T{i}", "content": "C"} for i in range(50)],
+                )
+            finally:
+                event.remove(db.engine, "before_cursor_execute", record)
+
+            assert len(inserts) == 1
+            assert JournalService.count_entries(user.id) == 50
+            from models import JournalEntry
+            titles = {e.id: e.title for e in JournalEntry.query.filter_by(user_id=user.id)}
+            assert [titles[r["id"]] for r in results] == [f"T{i}" for i in range(50)]
+
+    def test_bulk_create_pairs_identical_rows(self, app, user):
+        """Test creates with equal values each get their own new id."""
+        with app.app_context():
+            from models import db, JournalEntry
+            from services.journal_service import JournalService
+            ops = [
+                {"index": i, "op": "create", "title": title, "content": "C", "entry_date": date(2024, 1, 1)}
+                for i, title in enumerate(["Same", "Other", "Same"])
+            ]
+            results = JournalService.apply_bulk_operations(user.id, ops)
+
+            ids = [r["id"] for r in results]
+            assert len(set(ids)) == 3
+            assert [db.session.get(JournalEntry, i).title for i in ids] == ["Same", "Other", "Same"]
+
+    def test_get_entries_keeps_requested_order(self, app, user):
+        """Test a bulk fetch returns owned entries in request order with one query."""
+        with app.app_context():
+            from sqlalchemy import event
+            from models import db, User
+            from services.journal_service import JournalService
+            other_user = User(username="otheruser", email="other@example.com")
+            other_user.set_password("testpass")
+            db.session.add(other_user)
+            db.session.commit()
+            ids = [
+                JournalService.create_entry(user.id, f"E{i}", "Content", date.today()).id
+                for i in range(3)
+            ]
+            foreign = JournalService.create_entry(other_user.id, "X", "Content", date.today()).id
+            db.session.expire_all()
+
+            selects = []
+
+            def record(conn, cursor, statement, parameters, context, executemany):
+                if "FROM journal_entries" in statement:
+                    selects.append(statement)
+
+            event.listen(db.engine, "before_cursor_execute", record)
+            try:
+                entries = JournalService.get_entries([ids[2], foreign, 9999, ids[0]], user.id)
+            finally:
+                event.remove(db.engine, "before_cursor_execute", record)
+
+            assert [e.title for e in entries] == ["E2", "E0"]
+            assert len(selects) == 1
+            assert JournalService.get_entries([], user.id) == []
@@ -0,0 +1,239 @@
+"""Unit tests for the schema migration subsystem."""
+import pytest
+from sqlalchemy import event, inspect, text
+from sqlalchemy.engine import Engine
+
+
+@pytest.fixture
+def make_app(tmp_path):
+    """Build apps on a file database with DB_AUTO_UPGRADE off."""
+    from app import create_app
+    from config import TestingConfig, config
+
+    db_path = tmp_path / "journal.db"
+    config["migrations-test"] = type(
+        "MigrationsTestConfig",
+        (TestingConfig,),
+        {"SQLALCHEMY_DATABASE_URI": f"sqlite:///{db_path}", "DB_AUTO_UPGRADE": False},
+    )
+    apps = []
+
+    def _make():
+        app = create_app("migrations-test")
+        apps.append(app)
+        return app
+
+    yield _make
+    from models import db
+
+    for app in apps:
+        with app.app_context():
+            for engine in db.engines.values():
+                engine.dispose()
+    del config["migrations-test"]
+
+
+class TestMigrations:
+    """Test cases for versioned migrations."""
+
+    def test_startup_does_not_create_tables(self, make_app):
+        """Without DB_AUTO_UPGRADE an empty database is left untouched."""
+        from models import db
+
+        app = make_app()
+        with app.app_context():
+            assert inspect(db.engine).get_table_names() == []
+
+    def test_db_upgrade_creates_schema_and_stamps_version(self, make_app):
+        """flask db-upgrade builds the schema once and then reports no work."""
+        from models import db
+        from migrations import HEAD_VERSION, get_schema_version
+
+        app = make_app()
+        runner = app.test_cli_runner()
+
+        result = runner.invoke(args=["db-upgrade"])
+        assert result.exit_code == 0
+        assert f"from version 0 to {HEAD_VERSION}" in result.output
+
+        with app.app_context():
+            assert "journal_entries" in inspect(db.engine).get_table_names()
+            with db.engine.connect() as connection:
+                assert get_schema_version(connection) == HEAD_VERSION
+
+        result = runner.invoke(args=["db-upgrade"])
+        assert "up to date" in result.output
+
+    def test_upgrade_migrates_unversioned_database(self, make_app):
+        """A database created before versioning gets every migration."""
+        from models import db
+
+        app = make_app()
+        with app.app_context():
+            with db.engine.begin() as connection:
+                db.metadata.create_all(connection)
+                connection.execute(text("DROP INDEX ix_journal_entries_user_pending"))
+                connection.execute(
+                    text("CREATE INDEX ix_journal_entries_sync_status ON journal_entries (sync_status)")
+                )
+
+        app.test_cli_runner().invoke(args=["db-upgrade"])
+
+        with app.app_context():
+            names = {index["name"] for index in inspect(db.engine).get_indexes("journal_entries")}
+        assert "ix_journal_entries_user_pending" in names
+        assert "ix_journal_entries_sync_status" not in names
+
+    def test_upgrade_turns_calendar_events_into_a_mirror(self, make_app):
+        """A pre-mirror calendar_events table gains href/etag and per-user UIDs."""
+        from models import db
+
+        app = make_app()
+        with app.app_context():
+            with db.engine.begin() as connection:
+                db.metadata.create_all(connection)
+                connection.execute(text("DROP TABLE calendar_events"))
+                connection.execute(
+                    text(
+                        "CREATE TABLE calendar_events (id INTEGER PRIMARY KEY, "
+                        "user_id INTEGER NOT NULL, external_event_id VARCHAR(255) NOT NULL, "
+                        "journal_entry_id INTEGER, title VARCHAR(200) NOT NULL, "
+                        "start_datetime DATETIME NOT NULL, end_datetime DATETIME, "
+                        "description TEXT, completion_status VARCHAR(20), notes TEXT, "
+                        "sync_direction VARCHAR(20) NOT NULL, last_synced_at DATETIME NOT NULL)"
+                    )
+                )
+                connection.execute(
+                    text(
+                        "CREATE UNIQUE INDEX ix_calendar_events_external_event_id "
+                        "ON calendar_events (external_event_id)"
+                    )
+                )
+
+        app.test_cli_runner().invoke(args=["db-upgrade"])
+
+        with app.app_context():
+            inspector = inspect(db.engine)
+            columns = {column["name"] for column in inspector.get_columns("calendar_events")}
+            indexes = {index["name"] for index in inspector.get_indexes("calendar_events")}
+        assert {"href", "etag"} <= columns
+        assert "ix_calendar_events_user_external_event" in indexes
+        assert "ix_calendar_events_external_event_id" not in indexes
+
+    def test_upgrade_replaces_queued_sync_job_index(self, make_app):
+        """The queued-only claim index gives way to one on status, run_at and id."""
+        from models import db
+
+        app = make_app()
+        with app.app_context():
+            with db.engine.begin() as connection:
+                db.metadata.create_all(connection)
+                connection.execute(text("DROP INDEX ix_sync_jobs_status_run_at"))
+                connection.execute(
+                    text(
+                        "CREATE INDEX ix_sync_jobs_queued_run_at ON sync_jobs (run_at, id) "
+                        "WHERE status = 'queued'"
+                    )
+                )
+
+        app.test_cli_runner().invoke(args=["db-upgrade"])
+
+        with app.app_context():
+            names = {index["name"] for index in inspect(db.engine).get_indexes("sync_jobs")}
+        assert "ix_sync_jobs_status_run_at" in names
+        assert "ix_sync_jobs_queued_run_at" not in names
+
+    def test_migrations_do_not_use_live_models(self):
+        """Each migration carries its own DDL instead of reading the current models."""
+        from models import db
+        from migrations import MIGRATIONS
+
+        for migration in MIGRATIONS:
+            assert not any(
+                isinstance(value, type) and issubclass(value, db.Model) for value in vars(migration).values()
+            ), migration.__name__
+
+    def test_frozen_sync_jobs_ddl_matches_the_model(self, make_app):
+        """Migrations 4 and 6 build the sync_jobs indexes the model declares."""
+        from models import db, SyncJob
+        from migrations import m0004_sync_jobs, m0006_sync_job_status_index
+
+        app = make_app()
+        with app.app_context():
+            with db.engine.begin() as connection:
+                db.metadata.create_all(connection)
+                connection.execute(text("DROP TABLE sync_jobs"))
+                m0004_sync_jobs.upgrade(connection)
+                m0006_sync_job_status_index.upgrade(connection)
+            names = {index["name"] for index in inspect(db.engine).get_indexes("sync_jobs")}
+        assert names == {index.name for index in SyncJob.__table__.indexes}
+
+    def test_upgrade_adds_entry_calendar_hash_columns(self, make_app):
+        """Journal entries gain the hash and ETag of their last pushed event."""
+        from models import db
+
+        app = make_app()
+        with app.app_context():
+            with db.engine.begin() as connection:
+                db.metadata.create_all(connection)
+                connection.execute(text("ALTER TABLE journal_entries DROP COLUMN calendar_content_hash"))
+                connection.execute(text("ALTER TABLE journal_entries DROP COLUMN calendar_etag"))
+
+        app.test_cli_runner().invoke(args=["db-upgrade"])
+
+        with app.app_context():
+            columns = {column["name"] for column in inspect(db.engine).get_columns("journal_entries")}
+        assert {"calendar_content_hash", "calendar_etag"} <= columns
+
+    def test_upgrade_queues_pending_entries_in_the_outbox(self, make_app):
+        """Entries pending under the sync_status scan are queued as updates."""
+        from datetime import date
+        from models import db, JournalEntry, User
+
+        app = make_app()
+        with app.app_context():
+            with db.engine.begin() as connection:
+                db.metadata.create_all(connection)
+                connection.execute(text("DROP TABLE sync_outbox"))
+                connection.execute(User.__table__.insert().values(id=1, username="u", password_hash="x"))
+                connection.execute(
+                    JournalEntry.__table__.insert(),
+                    [
+                        {"id": entry_id, "user_id": 1, "title": "t", "content": "c", "date": date(2026, 1, 1),
+                         "sync_status": status}
+                        for entry_id, status in ((1, "sync_pending"), (2, "synced"), (3, "sync_pending"))
+                    ],
+                )
+                from migrations import schema_metadata, schema_version
+
+                schema_metadata.create_all(connection)
+                connection.execute(schema_version.insert().values(version=4))
+
+        app.test_cli_runner().invoke(args=["db-upgrade"])
+
+        with app.app_context():
+            from migrations import m0005_sync_outbox
+
+            with db.engine.begin() as connection:
+                m0005_sync_outbox.upgrade(connection)
+                rows = connection.execute(text("SELECT entry_id, op FROM sync_outbox ORDER BY id")).all()
+        assert [tuple(row) for row in rows] == [(1, "update"), (3, "update")]
+
+    def test_startup_check_is_a_single_query(self, make_app):
+        """An up-to-date database costs one SELECT at startup, no reflection."""
+        make_app().test_cli_runner().invoke(args=["db-upgrade"])
+
+        statements = []
+
+        def _capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(Engine, "before_cursor_execute", _capture)
+        try:
+            make_app()
+        finally:
+            event.remove(Engine, "before_cursor_execute", _capture)
+
+        queries = [s for s in statements if not s.lstrip().upper().startswith("PRAGMA")]
+        assert len(queries) == 1
+        assert "schema_version" in queries[0]
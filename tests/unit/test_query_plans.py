@@ -0,0 +1,217 @@
+"""Query plan regression tests for the journal, CalDAV and sync job services.
+
+Every statement JournalService, CalDAVService and SyncJobService send to
+the database is captured and run through EXPLAIN QUERY PLAN; a full table
+scan or a temp B-tree sort means a query no longer matches the index set in
+models/journal_entry.py (or calendar_event.py, sync_job.py, sync_outbox.py).
+"""
+import pytest
+from datetime import date, datetime, timedelta, timezone
+from sqlalchemy import event, text
+
+
+def _plan(connection, statement, parameters):
+    """Return the EXPLAIN QUERY PLAN detail lines of a statement."""
+    cursor = connection.connection.dbapi_connection.cursor()
+    try:
+        cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        return [row[3] for row in cursor.fetchall()]
+    finally:
+        cursor.close()
+
+
+def _bad_steps(plan):
+    """Return plan steps that scan a table or sort in a temp B-tree."""
+    return [
+        step
+        for step in plan
+        if "USE TEMP B-TREE" in step
+        or (step.startswith("SCAN ") and "VIRTUAL TABLE" not in step)
+    ]
+
+
+@pytest.fixture
+def captured(app):
+    """Record (statement, parameters) of every statement run on the engine."""
+    from models import db
+
+    statements = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        if executemany:
+            parameters = parameters[0]
+        statements.append((statement, parameters))
+
+    with app.app_context():
+        engine = db.engine
+        event.listen(engine, "before_cursor_execute", _capture)
+        yield statements
+        event.remove(engine, "before_cursor_execute", _capture)
+
+
+def _run_service_scenario(user_id, untracked_user_id, monkeypatch):
+    """Call every JournalService/CalDAVService/SyncJobService query path once."""
+    from models import SyncJob
+    from services.journal_service import JournalService
+    from services.caldav_service import CalDAVService
+    from services.sync_jobs import SyncJobService
+    from services.auth_service import AuthService
+
+    today = date.today()
+    monkeypatch.setattr(CalDAVService, "is_offline", staticmethod(lambda: False))
+
+    entries = [
+        JournalService.create_entry(user_id, f"Entry {i}", "Content", today - timedelta(days=i % 3))
+        for i in range(6)
+    ]
+    JournalService.get_entry(entries[0].id, user_id)
+    JournalService.get_entries([e.id for e in entries], user_id)
+
+    page = JournalService.list_entries(user_id, limit=2)
+    JournalService.list_entries(user_id, limit=2, cursor=page["next_cursor"])
+    JournalService.list_entries(user_id, entry_date=today, limit=2, offset=1)
+    JournalService.list_entries(user_id, limit=2, fields=["id", "title", "preview"])
+
+    JournalService.count_entries(user_id)
+    JournalService.count_entries(user_id, today)
+    JournalService.get_daily_histogram(user_id, today - timedelta(days=7), today)
+    JournalService.get_change_version(user_id)
+
+    JournalService.update_entry(entries[1].id, user_id, title="Updated")
+    JournalService.delete_entry(entries[2].id, user_id)
+    JournalService.apply_bulk_operations(
+        user_id,
+        [
+            {"index": 0, "op": "create", "id": None, "title": "Bulk", "content": "Bulk", "entry_date": today},
+            {"index": 1, "op": "update", "id": entries[3].id, "title": "Bulk update", "content": None, "entry_date": None},
+            {"index": 2, "op": "delete", "id": entries[4].id, "title": None, "content": None, "entry_date": None},
+        ],
+    )
+
+    JournalService.create_entry_from_calendar_event(user_id, "From calendar", "Content", today, "event-1")
+    CalDAVService.handle_calendar_event_deletion("event-1", user_id)
+    CalDAVService.sync_entry_to_calendar(entries[5])
+    CalDAVService.sync_all_pending_entries(user_id)
+    CalDAVService.sync_all_pending_entries(user_id, entry_ids=[entries[0].id])
+
+    CalDAVService._store_remote_events(
+        user_id,
+        [
+            {
+                "uid": f"remote-{i}",
+                "href": f"/calendars/journal/remote-{i}.ics",
+                "etag": f'"{i}"',
+                "title": f"Remote {i}",
+                "description": None,
+                "start_datetime": datetime.now(timezone.utc) + timedelta(hours=i),
+                "end_datetime": None,
+                "last_modified": None,
+                "completion_status": None,
+            }
+            for i in range(3)
+        ],
+    )
+    page = CalDAVService.list_calendar_events(user_id, limit=1)
+    CalDAVService.list_calendar_events(user_id, today, today + timedelta(days=1), 1, page["next_cursor"])
+    CalDAVService._remove_remote_events(user_id, ["/calendars/journal/remote-0.ics"])
+
+    job = SyncJobService.enqueue(user_id, SyncJob.KIND_SYNC_ALL)
+    SyncJobService.enqueue(user_id, SyncJob.KIND_SYNC_ALL)
+    SyncJobService.get_job(job.id, user_id)
+    SyncJobService.release_stale_jobs()
+    SyncJobService.claim("worker")
+    SyncJobService.claim("worker", job.id)
+
+    AuthService.update_sync_settings(user_id, calendar_sync_mode="automatic")
+    JournalService.update_entry(entries[0].id, user_id, content="Scheduled")
+    JournalService.update_entry(entries[0].id, user_id, content="Debounced")
+
+    # Users without counters take the fallback paths
+    JournalService.count_entries(untracked_user_id)
+    JournalService.count_entries(untracked_user_id, today)
+    JournalService.get_daily_histogram(untracked_user_id, today - timedelta(days=7), today)
+
+
+class TestQueryPlans:
+    """EXPLAIN QUERY PLAN checks for service queries."""
+
+    def test_service_queries_use_indexes(self, app, user, captured, monkeypatch):
+        """No service query scans journal_entries or sorts in a temp B-tree."""
+        from models import db, User, JournalEntry
+
+        with app.app_context():
+            untracked = User(username="untracked")
+            untracked.set_password("untrackedpass")
+            db.session.add(untracked)
+            db.session.commit()
+            # Core insert bypasses the stats listener, as for pre-counter rows
+            db.session.execute(
+                JournalEntry.__table__.insert(),
+                [{"user_id": untracked.id, "title": "Old", "content": "Old", "date": date.today(), "sync_status": "synced"}],
+            )
+            db.session.commit()
+
+            captured.clear()
+            _run_service_scenario(user.id, untracked.id, monkeypatch)
+
+            connection = db.session.connection()
+            checked = 0
+            failures = []
+            for statement, parameters in captured:
+                if not statement.lstrip().upper().startswith(("SELECT", "UPDATE", "DELETE", "WITH")):
+                    continue
+                checked += 1
+                bad = _bad_steps(_plan(connection, statement, parameters))
+                if bad:
+                    failures.append(f"{statement}\n  -> {bad}")
+
+            assert checked > 20
+            assert not failures, "\n\n".join(failures)
+
+    @pytest.mark.parametrize(
+        "statement, parameters, index",
+        [
+            (
+                "SELECT id FROM journal_entries WHERE user_id = ? AND sync_status = ?",
+                (1, "sync_pending"),
+                "ix_journal_entries_user_pending",
+            ),
+            (
+                "SELECT id FROM journal_entries WHERE calendar_event_id = ? AND user_id = ?",
+                ("event-1", 1),
+                "ix_journal_entries_user_calendar_event",
+            ),
+        ],
+    )
+    def test_sync_lookups_use_dedicated_indexes(self, app, statement, parameters, index):
+        """Pending-sync and calendar-event lookups pick their own index."""
+        from models import db
+
+        with app.app_context():
+            plan = _plan(db.session.connection(), statement, parameters)
+            assert any(index in step for step in plan), plan
+
+    def test_migration_replaces_single_column_indexes(self, app):
+        """The index migration upgrades a database with the old index set."""
+        from models import db
+        from migrations import m0001_query_shape_indexes
+
+        with app.app_context():
+            with db.engine.begin() as connection:
+                connection.execute(text("DROP INDEX ix_journal_entries_user_pending"))
+                connection.execute(text("CREATE INDEX ix_journal_entries_user_id ON journal_entries (user_id)"))
+                connection.execute(text("CREATE INDEX ix_journal_entries_sync_status ON journal_entries (sync_status)"))
+
+                m0001_query_shape_indexes.upgrade(connection)
+                m0001_query_shape_indexes.upgrade(connection)
+
+                names = {
+                    row[0]
+                    for row in connection.execute(
+                        text("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'journal_entries'")
+                    )
+                }
+            assert "ix_journal_entries_user_pending" in names
+            assert "ix_journal_entries_user_calendar_event" in names
+            assert "ix_journal_entries_user_id" not in names
+            assert "ix_journal_entries_sync_status" not in names
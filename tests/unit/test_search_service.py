@@ -0,0 +1,119 @@
+"""Unit tests for SearchService."""
+import pytest
+from datetime import date
+
+
+@pytest.fixture
+def entries(app, user):
+    """Create a few entries to search."""
+    with app.app_context():
+        from services.journal_service import JournalService
+        JournalService.create_entry(user.id, "Hiking trip", "We went hiking in the <hills>", date(2024, 1, 2))
+        JournalService.create_entry(user.id, "Groceries", "Bought apples and bread", date(2024, 1, 5))
+        JournalService.create_entry(user.id, "Notes", "More hiking planned for spring", date(2024, 3, 1))
+        JournalService.create_entry(user.id, "工作日志", "今天工作很累，但是完成了项目", date(2024, 3, 2))
+
+
+class TestSearchService:
+    """Test cases for SearchService."""
+
+    def test_search_ranks_title_matches_first(self, app, user, entries):
+        """Test a term in the title outranks the same term in content only."""
+        with app.app_context():
+            from services.search_service import SearchService
+            result = SearchService.search_entries(user.id, "hiking")
+            assert [r["title"] for r in result["results"]] == ["Hiking trip", "Notes"]
+            assert result["results"][0]["score"] > result["results"][1]["score"]
+            assert result["next_cursor"] is None
+
+    def test_search_snippet_is_escaped_and_highlighted(self, app, user, entries):
+        """Test snippets escape entry HTML and wrap matches in <mark>."""
+        with app.app_context():
+            from services.search_service import SearchService
+            snippet = SearchService.search_entries(user.id, "hills")["results"][0]["snippet"]
+            assert "<mark>hills</mark>" in snippet
+            assert "&lt;" in snippet and "<hills>" not in snippet
+
+    def test_search_cjk_terms(self, app, user, entries):
+        """Test Chinese phrases match, including two-character words."""
+        with app.app_context():
+            from services.search_service import SearchService
+            assert [r["title"] for r in SearchService.search_entries(user.id, "完成了项目")["results"]] == ["工作日志"]
+            assert [r["title"] for r in SearchService.search_entries(user.id, "工作")["results"]] == ["工作日志"]
+
+    def test_search_date_range(self, app, user, entries):
+        """Test from/to bounds restrict the results."""
+        with app.app_context():
+            from services.search_service import SearchService
+            result = SearchService.search_entries(
+                user.id, "hiking", start_date=date(2024, 2, 1), end_date=date(2024, 12, 31)
+            )
+            assert [r["title"] for r in result["results"]] == ["Notes"]
+
+    def test_search_cursor_pagination(self, app, user, entries):
+        """Test next_cursor walks through every result once."""
+        with app.app_context():
+            from services.search_service import SearchService
+            first = SearchService.search_entries(user.id, "hiking", limit=1)
+            assert first["next_cursor"] is not None
+            second = SearchService.search_entries(user.id, "hiking", limit=1, cursor=first["next_cursor"])
+            assert [r["title"] for r in first["results"] + second["results"]] == ["Hiking trip", "Notes"]
+            assert second["next_cursor"] is None
+
+    def test_search_ranking_ignores_other_users(self, app, user, entries):
+        """Test other users' writes change neither scores nor the next page."""
+        with app.app_context():
+            from models import db, User
+            from services.journal_service import JournalService
+            from services.search_service import SearchService
+            first = SearchService.search_entries(user.id, "hiking", limit=1)
+            scores = [r["score"] for r in SearchService.search_entries(user.id, "hiking")["results"]]
+
+            other = User(username="other")
+            other.set_password("otherpass")
+            db.session.add(other)
+            db.session.commit()
+            for i in range(20):
+                JournalService.create_entry(other.id, "Hiking hiking", "hiking " * i, date(2024, 1, 1))
+
+            assert [r["score"] for r in SearchService.search_entries(user.id, "hiking")["results"]] == scores
+            second = SearchService.search_entries(user.id, "hiking", limit=1, cursor=first["next_cursor"])
+            assert [r["title"] for r in second["results"]] == ["Notes"]
+
+    def test_search_follows_updates_and_deletes(self, app, user, entries):
+        """Test the index is kept in sync by the table triggers."""
+        with app.app_context():
+            from services.journal_service import JournalService
+            from services.search_service import SearchService
+            hit = SearchService.search_entries(user.id, "apples")["results"][0]
+            JournalService.update_entry(hit["id"], user.id, content="Bought pears")
+            assert SearchService.search_entries(user.id, "apples")["results"] == []
+            assert len(SearchService.search_entries(user.id, "pears")["results"]) == 1
+
+            JournalService.delete_entry(hit["id"], user.id)
+            assert SearchService.search_entries(user.id, "pears")["results"] == []
+
+    def test_search_is_scoped_to_user(self, app, user, entries):
+        """Test other users' entries never appear."""
+        with app.app_context():
+            from models import db, User
+            from services.search_service import SearchService
+            other = User(username="other")
+            other.set_password("otherpass")
+            db.session.add(other)
+            db.session.commit()
+            assert SearchService.search_entries(other.id, "hiking")["results"] == []
+
+    def test_search_query_syntax_is_literal(self, app, user, entries):
+        """Test FTS5 operators in user input are searched as text, not parsed."""
+        with app.app_context():
+            from services.search_service import SearchService
+            assert SearchService.search_entries(user.id, 'hiking OR "apples* NEAR(')["results"] == []
+
+    def test_search_requires_query(self, app, user):
+        """Test an empty query is rejected."""
+        with app.app_context():
+            from services.search_service import SearchService
+            from utils.validation import ValidationError
+            with pytest.raises(ValidationError):
+                SearchService.search_entries(user.id, "   ")
@@ -0,0 +1,41 @@
+"""Unit tests for listing row serialization."""
+import json
+import pytest
+from datetime import date
+
+
+@pytest.fixture
+def entry_rows(app, user):
+    """Create entries and return them as full-view listing rows."""
+    with app.app_context():
+        from models import JournalEntry
+        from services.journal_service import JournalService
+        for i in range(5):
+            JournalService.create_entry(
+                user_id=user.id, title=f"Entry {i}", content=f"内容 {i}", entry_date=date.today()
+            )
+        result = JournalService.list_entries(
+            user_id=user.id, fields=list(JournalEntry.FULL_FIELDS)
+        )
+        expected = [
+            JournalService.get_entry(row.id, user.id).to_dict() for row in result["entries"]
+        ]
+        return result["entries"], expected
+
+
+@pytest.mark.parametrize("backend", ["json", "orjson"])
+def test_rows_match_to_dict(entry_rows, backend):
+    """Test serialized rows are identical to JournalEntry.to_dict() output."""
+    from utils.serialization import get_json_backend, rows_to_dicts
+    if backend == "orjson":
+        pytest.importorskip("orjson")
+    rows, expected = entry_rows
+    dumps = get_json_backend(backend)
+    assert json.loads(dumps(rows_to_dicts(rows))) == expected
+
+
+def test_unknown_backend():
+    """Test requesting a backend that is not registered fails loudly."""
+    from utils.serialization import get_json_backend
+    with pytest.raises(ValueError):
+        get_json_backend("does-not-exist")
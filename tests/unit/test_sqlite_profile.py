@@ -0,0 +1,52 @@
+"""Unit tests for the SQLite connection profile."""
+import pytest
+from sqlalchemy import text
+
+
+def make_app(tmp_path, **overrides):
+    """Create an app on a file database with config overrides."""
+    from app import create_app
+    from config import TestingConfig, config
+    attrs = {"SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'journal.db'}"}
+    attrs.update(overrides)
+    config["profile_test"] = type("ProfileTestConfig", (TestingConfig,), attrs)
+    try:
+        return create_app("profile_test")
+    finally:
+        del config["profile_test"]
+
+
+def read_pragmas(app):
+    from models import db
+    with app.app_context():
+        with db.engine.connect() as conn:
+            return {
+                name: conn.execute(text(f"PRAGMA {name}")).scalar()
+                for name in ("journal_mode", "synchronous", "busy_timeout", "temp_store")
+            }
+
+
+class TestSQLiteProfile:
+    """Test cases for init_sqlite_profile."""
+
+    def test_profile_applied_to_new_connections(self, tmp_path):
+        """Test the default profile switches a file database to WAL and tuned pragmas."""
+        from config import Config
+        app = make_app(
+            tmp_path,
+            SQLITE_PRAGMAS=Config.SQLITE_PRAGMAS,
+            SQLALCHEMY_ENGINE_OPTIONS=Config.SQLALCHEMY_ENGINE_OPTIONS,
+        )
+        assert read_pragmas(app) == {
+            "journal_mode": "wal",
+            "synchronous": 1,  # NORMAL
+            "busy_timeout": Config.SQLITE_PRAGMAS["busy_timeout"],
+            "temp_store": 2,  # MEMORY
+        }
+
+    def test_empty_profile_leaves_defaults(self, tmp_path):
+        """Test SQLITE_PRAGMAS={} keeps SQLite's own defaults."""
+        app = make_app(tmp_path, SQLITE_PRAGMAS={})
+        pragmas = read_pragmas(app)
+        assert pragmas["journal_mode"] == "delete"
+        assert pragmas["synchronous"] == 2  # FULL
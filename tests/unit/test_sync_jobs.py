@@ -0,0 +1,261 @@
+"""Unit tests for the background sync job queue."""
+import pytest
+from datetime import datetime, timedelta, timezone
+
+
+def _now():
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+@pytest.fixture
+def queue_app(app):
+    app.config.update(SYNC_JOB_MAX_ATTEMPTS=3, SYNC_JOB_BACKOFF_BASE=10, SYNC_JOB_BACKOFF_MAX=60)
+    return app
+
+
+class TestSyncJobQueue:
+    """Test cases for enqueueing and claiming sync jobs."""
+
+    def test_identical_queued_job_is_reused(self, queue_app, user):
+        """Enqueueing the same sync twice before it runs queues one job."""
+        from models import SyncJob
+        from services.sync_jobs import SyncJobService
+
+        with queue_app.app_context():
+            first = SyncJobService.enqueue(user.id, SyncJob.KIND_SYNC_ALL)
+            second = SyncJobService.enqueue(user.id, SyncJob.KIND_SYNC_ALL)
+            other = SyncJobService.enqueue(user.id, SyncJob.KIND_SYNC_ENTRY, {"entry_id": 1})
+
+            assert second.id == first.id
+            assert other.id != first.id
+            assert first.max_attempts == 3
+
+    def test_claim_takes_due_jobs_in_order_once(self, queue_app, user):
+        """Jobs are claimed oldest first, each by one worker, and not before run_at."""
+        from models import db, SyncJob
+        from services.sync_jobs import SyncJobService
+
+        with queue_app.app_context():
+            jobs = [SyncJobService.enqueue(user.id, SyncJob.KIND_SYNC_ENTRY, {"entry_id": i}) for i in range(3)]
+            jobs[0].run_at = _now() + timedelta(minutes=5)
+            db.session.commit()
+
+            claimed = [SyncJobService.claim("w1"), SyncJobService.claim("w2")]
+            job = db.session.get(SyncJob, jobs[1].id)
+            assert claimed == [jobs[1].id, None]
+            assert (job.status, job.locked_by, job.attempts) == ("running", "w1", 1)
+
+            # The user's next job waits until the running one finishes
+            SyncJobService._finish(jobs[1].id, "succeeded")
+            assert [SyncJobService.claim("w2"), SyncJobService.claim("w1")] == [jobs[2].id, None]
+
+    def test_claim_caps_running_jobs_across_users(self, queue_app, user):
+        """No more than SYNC_MAX_RUNNING_JOBS run at once, one per user."""
+        from models import db, SyncJob, User
+        from services.sync_jobs import SyncJobService
+
+        queue_app.config["SYNC_MAX_RUNNING_JOBS"] = 2
+        with queue_app.app_context():
+            others = [User(username=f"user{i}", password_hash="x") for i in range(3)]
+            db.session.add_all(others)
+            db.session.commit()
+            jobs = [SyncJobService.enqueue(u.id, SyncJob.KIND_SYNC_ALL) for u in [user, *others]]
+
+            claimed = [SyncJobService.claim("w") for _ in range(3)]
+            assert claimed == [jobs[0].id, jobs[1].id, None]
+
+            SyncJobService._finish(jobs[0].id, "succeeded")
+            assert SyncJobService.claim("w") == jobs[2].id
+
+    def test_stale_running_job_is_requeued(self, queue_app, user):
+        """A job whose worker died is released after SYNC_JOB_LEASE."""
+        from models import db, SyncJob
+        from services.sync_jobs import SyncJobService
+
+        with queue_app.app_context():
+            job = SyncJobService.enqueue(user.id, SyncJob.KIND_SYNC_ALL)
+            SyncJobService.claim("dead-worker")
+            assert SyncJobService.release_stale_jobs() == 0
+
+            job.locked_at = _now() - timedelta(seconds=queue_app.config["SYNC_JOB_LEASE"] + 1)
+            db.session.commit()
+            assert SyncJobService.release_stale_jobs() == 1
+            assert SyncJobService.claim("w2") == job.id
+
+
+class TestSyncJobRun:
+    """Test cases for running jobs, retries and backoff."""
+
+    def test_backoff_grows_exponentially_with_jitter(self, queue_app):
+        """Delays double per attempt up to the cap, jittered within [d/2, d]."""
+        from services.sync_jobs import SyncJobService
+
+        with queue_app.app_context():
+            low = [SyncJobService.backoff_delay(n, rand=lambda: 0.0) for n in range(1, 6)]
+            high = [SyncJobService.backoff_delay(n, rand=lambda: 1.0) for n in range(1, 6)]
+
+        assert low == [5, 10, 20, 30, 30]
+        assert high == [10, 20, 40, 60, 60]
+
+    def test_failed_attempts_retry_then_fail(self, queue_app, user, monkeypatch):
+        """Transient failures are retried with backoff until max_attempts."""
+        from models import db, SyncJob
+        from services.caldav_service import CalDAVService
+        from services.sync_jobs import SyncJobService
+
+        def _boom(*args, **kwargs):
+            raise ConnectionError("server unreachable")
+
+        monkeypatch.setattr(CalDAVService, "is_offline", staticmethod(lambda: False))
+        monkeypatch.setattr(CalDAVService, "sync_all_pending_entries", staticmethod(_boom))
+
+        with queue_app.app_context():
+            job_id = SyncJobService.enqueue(user.id, SyncJob.KIND_SYNC_ALL).id
+            statuses = []
+            for _ in range(3):
+                db.session.get(SyncJob, job_id).run_at = _now()
+                db.session.commit()
+                assert SyncJobService.claim("w1", job_id) == job_id
+                job = SyncJobService.run_job(job_id)
+                statuses.append(job.status)
+                if job.status == "queued":
+                    assert job.run_at > _now()
+
+            assert statuses == ["queued", "queued", "failed"]
+            assert job.last_error == "server unreachable"
+            assert job.finished_at is not None
+
+    def test_permanent_error_fails_without_retry(self, queue_app, user):
+        """A job for a missing entry fails on its first attempt."""
+        from models import SyncJob
+        from services.sync_jobs import SyncJobService
+
+        with queue_app.app_context():
+            job_id = SyncJobService.enqueue(user.id, SyncJob.KIND_SYNC_ENTRY, {"entry_id": 999}).id
+            SyncJobService.claim("w1")
+            job = SyncJobService.run_job(job_id)
+
+            assert (job.status, job.attempts, job.last_error) == ("failed", 1, "Journal entry not found")
+
+    def test_worker_once_drains_due_jobs(self, queue_app, user, monkeypatch):
+        """run_worker(once=True) runs every due job and returns without sleeping."""
+        from models import db, SyncJob
+        from services.caldav_service import CalDAVService
+        from services.sync_jobs import SyncJobService, run_worker
+
+        monkeypatch.setattr(CalDAVService, "is_offline", staticmethod(lambda: False))
+        monkeypatch.setattr(
+            CalDAVService,
+            "sync_all_pending_entries",
+            staticmethod(lambda user_id, entry_ids=None: {"success": 0, "failed": 0, "skipped": 0, "chunks": []}),
+        )
+        monkeypatch.setattr(
+            CalDAVService, "pull_calendar_changes", staticmethod(lambda user_id: {"changed": 0})
+        )
+
+        with queue_app.app_context():
+            SyncJobService.enqueue(user.id, SyncJob.KIND_SYNC_ALL)
+            SyncJobService.enqueue(user.id, SyncJob.KIND_SYNC_ALL, {"entry_ids": [1]})
+
+            processed = run_worker("w1", once=True, sleep=pytest.fail)
+            statuses = db.session.scalars(db.select(SyncJob.status)).all()
+
+        assert processed == 2
+        assert statuses == ["succeeded", "succeeded"]
+
+
+class TestAutoSync:
+    """Test cases for debounced syncs in automatic sync mode."""
+
+    @pytest.fixture
+    def auto_user(self, queue_app, user):
+        from models import db, User
+
+        queue_app.config.update(AUTO_SYNC_DELAY=10, AUTO_SYNC_MAX_DELAY=60)
+        with queue_app.app_context():
+            db.session.get(User, user.id).calendar_sync_mode = "automatic"
+            db.session.commit()
+        return user
+
+    def _auto_jobs(self, user_id):
+        from models import db, SyncJob
+
+        return db.session.scalars(
+            db.select(SyncJob).where(SyncJob.user_id == user_id, SyncJob.kind == SyncJob.KIND_AUTO_SYNC)
+        ).all()
+
+    def test_writes_share_one_debounced_job(self, queue_app, auto_user):
+        """Each write pushes the queued job's run_at to AUTO_SYNC_DELAY after it."""
+        from datetime import date
+        from models import db
+        from services.journal_service import JournalService
+
+        with queue_app.app_context():
+            before = _now()
+            entry = JournalService.create_entry(auto_user.id, "Draft", "v0", date.today())
+            job = self._auto_jobs(auto_user.id)[0]
+            job.run_at = job.created_at = before - timedelta(seconds=30)
+            db.session.commit()
+
+            for i in range(5):
+                JournalService.update_entry(entry.id, auto_user.id, content=f"v{i + 1}")
+            jobs = self._auto_jobs(auto_user.id)
+
+            assert len(jobs) == 1
+            assert jobs[0].status == "queued"
+            assert before + timedelta(seconds=10) <= jobs[0].run_at <= _now() + timedelta(seconds=10)
+
+    def test_continuous_writes_are_capped_by_max_delay(self, queue_app, auto_user):
+        """A job queued AUTO_SYNC_MAX_DELAY ago is not pushed out any further."""
+        from datetime import date
+        from models import db
+        from services.journal_service import JournalService
+
+        with queue_app.app_context():
+            entry = JournalService.create_entry(auto_user.id, "Draft", "v0", date.today())
+            job = self._auto_jobs(auto_user.id)[0]
+            job.created_at = _now() - timedelta(seconds=55)
+            db.session.commit()
+            created_at = job.created_at
+
+            JournalService.update_entry(entry.id, auto_user.id, content="v1")
+            db.session.refresh(job)
+
+            assert job.run_at == created_at + timedelta(seconds=60)
+
+    def test_manual_mode_queues_nothing(self, queue_app, user):
+        """Writes of users in manual mode only fill the outbox."""
+        from datetime import date
+        from services.journal_service import JournalService
+
+        with queue_app.app_context():
+            JournalService.create_entry(user.id, "Draft", "v0", date.today())
+            assert self._auto_jobs(user.id) == []
+
+    def test_due_auto_sync_pushes_changes(self, queue_app, auto_user, monkeypatch):
+        """The worker runs a due auto_sync job as a push without a pull."""
+        from datetime import date
+        from models import db
+        from services.caldav_service import CalDAVService
+        from services.journal_service import JournalService
+        from services.sync_jobs import run_worker
+
+        pushed = []
+        monkeypatch.setattr(CalDAVService, "is_offline", staticmethod(lambda: False))
+        monkeypatch.setattr(
+            CalDAVService,
+            "sync_all_pending_entries",
+            staticmethod(lambda user_id, entry_ids=None: pushed.append(user_id) or {"success": 1, "failed": 0}),
+        )
+        monkeypatch.setattr(CalDAVService, "pull_calendar_changes", pytest.fail)
+
+        with queue_app.app_context():
+            JournalService.create_entry(auto_user.id, "Draft", "v0", date.today())
+            assert run_worker("w1", once=True, sleep=pytest.fail) == 0
+
+            self._auto_jobs(auto_user.id)[0].run_at = _now()
+            db.session.commit()
+            assert run_worker("w1", once=True, sleep=pytest.fail) == 1
+            assert self._auto_jobs(auto_user.id)[0].status == "succeeded"
+
+        assert pushed == [auto_user.id]
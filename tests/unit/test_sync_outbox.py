@@ -0,0 +1,137 @@
+"""Unit tests for the journal change outbox."""
+import pytest
+from datetime import date
+
+
+def _outbox(user_id):
+    from models import db, SyncOutbox
+
+    return [
+        (row.entry_id, row.op)
+        for row in db.session.scalars(
+            db.select(SyncOutbox).where(SyncOutbox.user_id == user_id).order_by(SyncOutbox.id)
+        )
+    ]
+
+
+class TestOutboxRecording:
+    """Test cases for the flush listener writing the outbox."""
+
+    def test_mutations_are_recorded_in_order(self, app, user):
+        """Create, update and delete each add a row in the same commit."""
+        from services.journal_service import JournalService
+
+        with app.app_context():
+            entry = JournalService.create_entry(user.id, "Title", "Content", date.today())
+            JournalService.update_entry(entry.id, user.id, content="Edited")
+            JournalService.delete_entry(entry.id, user.id)
+
+            assert _outbox(user.id) == [(entry.id, "create"), (entry.id, "update"), (entry.id, "delete")]
+
+    def test_sync_status_changes_are_not_recorded(self, app, user):
+        """Marking an entry synced is not a change to send."""
+        from models import db
+        from services.caldav_service import CalDAVService
+        from services.journal_service import JournalService
+
+        with app.app_context():
+            entry = JournalService.create_entry(user.id, "Title", "Content", date.today())
+            CalDAVService.sync_entry_to_calendar(entry)
+            entry.sync_status = "sync_error"
+            db.session.commit()
+
+            assert _outbox(user.id) == []
+
+    def test_calendar_changes_are_not_sent_back(self, app, user):
+        """Entries created, edited or deleted from the calendar stay out of the outbox."""
+        from services.caldav_service import CalDAVService
+        from services.journal_service import JournalService
+
+        with app.app_context():
+            entry = JournalService.create_entry_from_calendar_event(
+                user.id, "From iPhone", "Content", date.today(), "event-1"
+            )
+            CalDAVService.sync_completion_status(entry, "completed")
+            CalDAVService.handle_calendar_event_deletion("event-1", user.id)
+
+            assert _outbox(user.id) == []
+
+    def test_bulk_operations_are_recorded(self, app, user):
+        """Core-inserted bulk creates are queued alongside ORM updates and deletes."""
+        from services.journal_service import JournalService
+
+        with app.app_context():
+            first = JournalService.create_entry(user.id, "One", "Content", date.today())
+            second = JournalService.create_entry(user.id, "Two", "Content", date.today())
+            results = JournalService.apply_bulk_operations(
+                user.id,
+                [
+                    {"index": 0, "op": "update", "id": first.id, "title": "Edited", "content": None, "entry_date": None},
+                    {"index": 1, "op": "delete", "id": second.id, "title": None, "content": None, "entry_date": None},
+                    {"index": 2, "op": "create", "id": None, "title": "New", "content": "New", "entry_date": None},
+                ],
+            )
+
+            assert _outbox(user.id)[2:] == [
+                (first.id, "update"),
+                (second.id, "delete"),
+                (results[2]["id"], "create"),
+            ]
+
+
+class TestOutboxConsumer:
+    """Test cases for coalescing and consuming queued changes."""
+
+    def test_edit_burst_coalesces_to_one_change(self, app, user, monkeypatch):
+        """A create followed by many updates is sent once and consumed."""
+        from services.caldav_service import CalDAVService
+        from services.journal_service import JournalService
+
+        monkeypatch.setattr(CalDAVService, "is_offline", staticmethod(lambda: False))
+        with app.app_context():
+            entry = JournalService.create_entry(user.id, "Title", "v0", date.today())
+            for i in range(1, 6):
+                JournalService.update_entry(entry.id, user.id, content=f"v{i}")
+
+            changes = CalDAVService._pending_changes(user.id)
+            assert [(c.entry_id, c.upsert, c.delete_uid, len(c.outbox_ids)) for c in changes] == [
+                (entry.id, True, None, 6)
+            ]
+
+            stats = CalDAVService.sync_all_pending_entries(user.id)
+            assert (stats["success"], stats["chunks"][0]["entries"]) == (1, 1)
+            assert _outbox(user.id) == []
+
+    def test_unsynced_entry_deleted_before_sync_sends_nothing(self, app, user, monkeypatch):
+        """An entry that never reached the calendar needs no remote delete."""
+        from services.caldav_service import CalDAVService
+        from services.journal_service import JournalService
+
+        monkeypatch.setattr(CalDAVService, "is_offline", staticmethod(lambda: False))
+        with app.app_context():
+            entry = JournalService.create_entry(user.id, "Title", "Content", date.today())
+            JournalService.delete_entry(entry.id, user.id)
+
+            stats = CalDAVService.sync_all_pending_entries(user.id)
+            assert (stats["success"], stats["deleted"], stats["failed"]) == (0, 0, 0)
+            assert _outbox(user.id) == []
+
+    def test_change_during_sync_stays_queued(self, app, user, monkeypatch):
+        """Only the rows read by a sync are consumed by it."""
+        from services.caldav_service import CalDAVService
+        from services.journal_service import JournalService
+
+        monkeypatch.setattr(CalDAVService, "is_offline", staticmethod(lambda: False))
+        with app.app_context():
+            entry = JournalService.create_entry(user.id, "Title", "Content", date.today())
+            render = CalDAVService._render_entry
+
+            def render_then_edit(rendered_entry):
+                result = render(rendered_entry)
+                JournalService.update_entry(entry.id, user.id, content="Edited mid-sync")
+                return result
+
+            monkeypatch.setattr(CalDAVService, "_render_entry", staticmethod(render_then_edit))
+            CalDAVService.sync_all_pending_entries(user.id)
+
+            assert _outbox(user.id) == [(entry.id, "update")]
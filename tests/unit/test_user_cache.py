@@ -0,0 +1,139 @@
+"""Unit tests for the authenticated-user cache."""
+import pytest
+from sqlalchemy import event
+
+
+@pytest.fixture
+def user_selects(app):
+    """Record SELECTs against the users table."""
+    from models import db
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("SELECT") and "FROM users" in statement:
+            statements.append(statement)
+
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", record)
+
+
+class TestInProcessBackend:
+    """Test cases for InProcessUserCacheBackend."""
+
+    def test_ttl_expiry(self):
+        """Test entries disappear once their TTL has passed."""
+        from services.user_cache import InProcessUserCacheBackend
+        now = [100.0]
+        backend = InProcessUserCacheBackend(clock=lambda: now[0])
+        backend.set("k", "v", ttl=10)
+        assert backend.get("k") == "v"
+        now[0] += 10
+        assert backend.get("k") is None
+
+    def test_lru_bound(self):
+        """Test the least recently used entry is evicted at capacity."""
+        from services.user_cache import InProcessUserCacheBackend
+        backend = InProcessUserCacheBackend(max_entries=2)
+        backend.set("a", 1)
+        backend.set("b", 2)
+        backend.get("a")
+        backend.set("c", 3)
+        assert (backend.get("a"), backend.get("b"), backend.get("c")) == (1, None, 3)
+        assert backend.incr("n") == 1 and backend.incr("n") == 2
+
+
+class TestUserCache:
+    """Test cases for UserCache."""
+
+    def test_second_load_skips_query(self, app, user, user_selects):
+        """Test a cached user is attached to the session without a SELECT."""
+        with app.app_context():
+            from models import db
+            from services.user_cache import get_user_cache
+            cache = get_user_cache()
+            assert cache.load(user.id).username == "testuser"
+            db.session.remove()
+            user_selects.clear()
+
+            loaded = cache.load(user.id)
+            assert loaded.username == "testuser"
+            assert loaded in db.session
+            assert user_selects == []
+
+    def test_committed_change_invalidates(self, app, user, user_selects):
+        """Test a password change is visible on the next load."""
+        with app.app_context():
+            from models import db
+            from services.user_cache import get_user_cache
+            cache = get_user_cache()
+            loaded = cache.load(user.id)
+            loaded.set_password("newpass")
+            db.session.commit()
+            db.session.remove()
+            user_selects.clear()
+
+            assert cache.load(user.id).check_password("newpass")
+            assert len(user_selects) == 1
+
+    def test_password_hashes_are_not_cached(self, app, user, user_selects):
+        """Test the stored entry leaves out the hashes, which load on demand."""
+        with app.app_context():
+            from models import db
+            from services.user_cache import get_user_cache
+            cache = get_user_cache()
+            cache.load(user.id)
+            data = cache.backend.get(cache._key(user.id))["data"]
+            assert "password_hash" not in data and "caldav_password_hash" not in data
+            db.session.remove()
+            user_selects.clear()
+
+            assert cache.load(user.id).check_password("testpass")
+            assert len(user_selects) == 1
+
+    def test_backend_requires_every_method(self):
+        """Test a backend missing part of the interface cannot be created."""
+        from services.user_cache import UserCacheBackend
+
+        class Partial(UserCacheBackend):
+            def get(self, key):
+                return None
+
+        with pytest.raises(TypeError):
+            Partial()
+
+    def test_stale_refill_is_ignored(self, app, user):
+        """Test an entry read before an invalidation is never served."""
+        with app.app_context():
+            from models import db
+            from services.user_cache import get_user_cache
+            cache = get_user_cache()
+            key = cache._key(user.id)
+            stale = {"version": 0, "data": {"id": user.id, "username": "stale"}}
+            cache.invalidate(user.id)
+            cache.backend.set(key, stale, cache.ttl)
+            db.session.remove()
+            assert cache.load(user.id).username == "testuser"
+
+    def test_status_request_skips_user_query(self, client, user, user_selects):
+        """Test authenticated API calls no longer load the user from the database."""
+        client.post("/api/auth/login", json={"username": "testuser", "password": "testpass"})
+        client.get("/api/auth/status")
+        user_selects.clear()
+
+        response = client.get("/api/auth/status")
+        assert response.json["authenticated"] is True
+        assert user_selects == []
+
+    def test_disabled_with_zero_ttl(self):
+        """Test USER_CACHE_TTL=0 leaves the cache uninstalled."""
+        from app import create_app
+        from config import TestingConfig, config
+        config["nocache"] = type("NoCache", (TestingConfig,), {"USER_CACHE_TTL": 0})
+        try:
+            assert "user_cache" not in create_app("nocache").extensions
+        finally:
+            del config["nocache"]
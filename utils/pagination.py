@@ -0,0 +1,124 @@
+"""Opaque cursor helpers for keyset pagination."""
+import base64
+import json
+from datetime import date, datetime
+from typing import Tuple
+
+from utils.validation import ValidationError
+
+
+def _encode(values) -> str:
+    payload = json.dumps(values, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode(cursor: str):
+    padded = cursor + "=" * (-len(cursor) % 4)
+    return json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+
+
+def encode_cursor(entry_date: date, created_at: datetime, entry_id: int) -> str:
+    """
+    Encode the sort key of the last row on a page into an opaque cursor.
+
+    Args:
+        entry_date: Date of the last entry on the page
+        created_at: Creation timestamp of the last entry on the page
+        entry_id: ID of the last entry on the page
+
+    Returns:
+        URL-safe cursor string
+    """
+    return _encode([entry_date.isoformat(), created_at.isoformat(), entry_id])
+
+
+def decode_cursor(cursor: str) -> Tuple[date, datetime, int]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string from a previous page
+
+    Returns:
+        Tuple of (date, created_at, id)
+
+    Raises:
+        ValidationError: If the cursor is malformed
+    """
+    try:
+        entry_date, created_at, entry_id = _decode(cursor)
+        return (
+            date.fromisoformat(entry_date),
+            datetime.fromisoformat(created_at),
+            int(entry_id),
+        )
+    except (ValueError, TypeError, UnicodeError):
+        raise ValidationError("Invalid cursor")
+
+
+def encode_search_cursor(score: float, entry_id: int) -> str:
+    """
+    Encode the rank of the last search result on a page into a cursor.
+
+    Args:
+        score: Relevance score of the last result on the page
+        entry_id: ID of the last result on the page
+
+    Returns:
+        URL-safe cursor string
+    """
+    return _encode([score, entry_id])
+
+
+def decode_search_cursor(cursor: str) -> Tuple[float, int]:
+    """
+    Decode a cursor produced by encode_search_cursor.
+
+    Args:
+        cursor: Cursor string from a previous page
+
+    Returns:
+        Tuple of (score, id)
+
+    Raises:
+        ValidationError: If the cursor is malformed
+    """
+    try:
+        score, entry_id = _decode(cursor)
+        return float(score), int(entry_id)
+    except (ValueError, TypeError, UnicodeError):
+        raise ValidationError("Invalid cursor")
+
+
+def encode_event_cursor(start_datetime: datetime, event_id: int) -> str:
+    """
+    Encode the sort key of the last calendar event on a page into a cursor.
+
+    Args:
+        start_datetime: Start of the last event on the page
+        event_id: ID of the last event on the page
+
+    Returns:
+        URL-safe cursor string
+    """
+    return _encode([start_datetime.isoformat(), event_id])
+
+
+def decode_event_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Decode a cursor produced by encode_event_cursor.
+
+    Args:
+        cursor: Cursor string from a previous page
+
+    Returns:
+        Tuple of (start_datetime, id)
+
+    Raises:
+        ValidationError: If the cursor is malformed
+    """
+    try:
+        start_datetime, event_id = _decode(cursor)
+        return datetime.fromisoformat(start_datetime), int(event_id)
+    except (ValueError, TypeError, UnicodeError):
+        raise ValidationError("Invalid cursor")
@@ -0,0 +1,79 @@
+"""Fast JSON serialization for projected listing rows."""
+import json
+from datetime import date, datetime
+from typing import Callable, Dict, List
+
+# name -> callable(obj) -> bytes; dates/datetimes must come out as ISO 8601
+JSON_BACKENDS: Dict[str, Callable[[object], bytes]] = {}
+
+
+def _isoformat_default(value):
+    """json.dumps fallback for date and datetime values."""
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _stdlib_dumps(obj) -> bytes:
+    return json.dumps(
+        obj, default=_isoformat_default, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def register_json_backend(name: str, dumps: Callable[[object], bytes]) -> None:
+    """
+    Register a JSON encoder usable by get_json_backend.
+
+    Args:
+        name: Backend name (as used in the JSON_BACKEND setting)
+        dumps: Callable serializing an object to UTF-8 bytes
+    """
+    JSON_BACKENDS[name] = dumps
+
+
+register_json_backend("json", _stdlib_dumps)
+
+try:
+    import orjson
+
+    # orjson emits naive date/datetime values in the same form as isoformat()
+    register_json_backend("orjson", orjson.dumps)
+except ImportError:  # pragma: no cover - optional dependency
+    pass
+
+
+def get_json_backend(name: str = "auto") -> Callable[[object], bytes]:
+    """
+    Resolve a JSON encoder by name.
+
+    Args:
+        name: Backend name, or "auto" for the fastest one installed
+
+    Returns:
+        Callable serializing an object to UTF-8 bytes
+
+    Raises:
+        ValueError: If the named backend is not available
+    """
+    if name == "auto":
+        return JSON_BACKENDS.get("orjson", JSON_BACKENDS["json"])
+    if name not in JSON_BACKENDS:
+        raise ValueError(f"JSON backend '{name}' is not available")
+    return JSON_BACKENDS[name]
+
+
+def rows_to_dicts(rows) -> List[dict]:
+    """
+    Turn result rows into plain dictionaries in a single pass.
+
+    Args:
+        rows: Sequence of SQLAlchemy Row tuples from one result
+
+    Returns:
+        List of dictionaries keyed by column label
+    """
+    if not rows:
+        return []
+    keys = rows[0]._fields
+    return [dict(zip(keys, row)) for row in rows]
+
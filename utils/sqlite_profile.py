@@ -0,0 +1,57 @@
+"""SQLite connection tuning applied through an engine connect hook."""
+import logging
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+
+def apply_sqlite_pragmas(dbapi_connection, pragmas):
+    """
+    Run PRAGMA statements on a new DB-API connection.
+
+    Args:
+        dbapi_connection: Raw sqlite3 connection
+        pragmas: Mapping of pragma name to value, applied in order
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+
+def init_sqlite_profile(app, db):
+    """
+    Apply the SQLITE_PRAGMAS profile to every SQLite engine of an app.
+
+    journal_mode=WAL lets readers run alongside a writer, synchronous=NORMAL
+    drops the fsync from ordinary commits (WAL keeps the database
+    consistent), and busy_timeout makes writers wait for the lock instead of
+    failing with "database is locked". An empty SQLITE_PRAGMAS disables it.
+
+    Args:
+        app: Flask application instance
+        db: Flask-SQLAlchemy extension bound to the app
+    """
+    pragmas = app.config.get("SQLITE_PRAGMAS") or {}
+    if not pragmas:
+        return
+
+    with app.app_context():
+        engines = list(db.engines.values())
+
+    for engine in engines:
+        if engine.dialect.name != "sqlite":
+            continue
+        engine_pragmas = dict(pragmas)
+        if engine.url.query.get("mode") == "ro":
+            # The journal mode is a property of the file, set by the writer;
+            # a read-only connection cannot change it
+            engine_pragmas.pop("journal_mode", None)
+
+        @event.listens_for(engine, "connect")
+        def _on_connect(dbapi_connection, connection_record, pragmas=engine_pragmas):
+            apply_sqlite_pragmas(dbapi_connection, pragmas)
+
+        logger.debug(f"SQLite profile {engine_pragmas} registered for {engine.url}")